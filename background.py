@@ -0,0 +1,236 @@
+import math
+from collections import OrderedDict
+from PyQt4 import QtGui, QtCore
+
+REFERENCE_TILE_SIZE = 512
+
+
+class ReferenceImage(object):
+    """
+    Reference plate drawn under the strokes, decoded lazily into a tiled
+    mip pyramid. Only tiles visible at the level matching the view scale
+    are decoded; least recently drawn tiles are evicted once the memory
+    budget is exceeded. Formats that cannot decode part of an image, such as
+    PNG, decode a whole level, keep it in a single bounded slot & slice the
+    requested tiles & their neighbours from it while the budget allows.
+
+    Attributes:
+        budget (int): bytes of decoded tiles kept
+        level_budget (int): largest decoded level kept for formats without
+                            clip support, larger levels are decoded per miss
+        levels (int): number of mip levels, level 0 is full resolution
+        opacity (float): draw opacity
+        size (QSize): full resolution size
+    """
+    def __init__(self, filepath, budget=64 * 1024 * 1024,
+                 tile_size=REFERENCE_TILE_SIZE, opacity=1.0,
+                 level_budget=256 * 1024 * 1024):
+        """
+        Args:
+            filepath (str): image path
+            budget (int, optional): bytes of decoded tiles kept
+            tile_size (int, optional): tile edge length in pixels of its level
+            opacity (float, optional): draw opacity
+            level_budget (int, optional): largest decoded level kept for
+                                          formats without clip support
+        """
+        self._filepath = filepath
+        self.budget = budget
+        self.level_budget = level_budget
+        self.opacity = opacity
+        self._tile_size = tile_size
+
+        reader = QtGui.QImageReader(filepath)
+        self.size = reader.size()
+        if not self.size.isValid():
+            raise IOError('cannot read {}: {}'.format(filepath,
+                                                      reader.errorString()))
+        # formats without clip support decode a whole level, see _decoded
+        self._clip = reader.supportsOption(QtGui.QImageIOHandler.ClipRect)
+
+        longest = max(self.size.width(), self.size.height())
+        self.levels = 1
+        while longest / 2 ** (self.levels - 1) > tile_size:
+            self.levels += 1
+
+        self._tiles = OrderedDict()
+        self._bytes = 0
+        # (level, image) last decoded whole level & the (level, columns,
+        # rows) ranges around the tiles being drawn
+        self._level = None
+        self._nearby = None
+
+    def level_for(self, lod):
+        """
+        mip level to draw at a view scale
+
+        Args:
+            lod (float): screen pixels per image pixel
+
+        Returns:
+            int: level, each level halves resolution
+        """
+        if lod <= 0 or lod >= 1:
+            return 0
+        return min(self.levels - 1, int(math.log(1.0 / lod, 2)))
+
+    def _tile_rect(self, level, col, row):
+        # tile area in full resolution pixels
+        span = self._tile_size * 2 ** level
+        rect = QtCore.QRect(col * span, row * span, span, span)
+        return rect.intersected(QtCore.QRect(QtCore.QPoint(0, 0), self.size))
+
+    def _level_size(self, level):
+        scale = 2 ** level
+        return QtCore.QSize(
+            max(1, int(math.ceil(self.size.width() / float(scale)))),
+            max(1, int(math.ceil(self.size.height() / float(scale)))))
+
+    def _store(self, key, image):
+        self._tiles[key] = image
+        self._bytes += image.byteCount()
+
+    def _level_grid(self, level):
+        # tile columns & rows of a level
+        size = self._level_size(level)
+        return (int(math.ceil(size.width() / float(self._tile_size))),
+                int(math.ceil(size.height() / float(self._tile_size))))
+
+    def _slice(self, full, level, col, row):
+        # tile of a decoded level, edge tiles are clipped to the image
+        rect = self._tile_rect(level, col, row)
+        scale = float(2 ** level)
+        return full.copy(int(rect.x() / scale), int(rect.y() / scale),
+                         max(1, int(math.ceil(rect.width() / scale))),
+                         max(1, int(math.ceil(rect.height() / scale))))
+
+    def _decode(self, level, col, row):
+        if self._clip:
+            reader = QtGui.QImageReader(self._filepath)
+            rect = self._tile_rect(level, col, row)
+            scale = float(2 ** level)
+            reader.setClipRect(rect)
+            reader.setScaledSize(QtCore.QSize(
+                max(1, int(math.ceil(rect.width() / scale))),
+                max(1, int(math.ceil(rect.height() / scale)))))
+            return reader.read()
+
+        full = self._decoded(level)
+        if self._nearby is not None and self._nearby[0] == level:
+            # neighbours come from the same decode, stored before the
+            # requested tile so they are evicted first
+            cols, rows = self._nearby[1:]
+            for tile_row in rows:
+                for tile_col in cols:
+                    key = (level, tile_col, tile_row)
+                    if (tile_col, tile_row) == (col, row) or \
+                            key in self._tiles:
+                        continue
+                    image = self._slice(full, level, tile_col, tile_row)
+                    if self._bytes + image.byteCount() > self.budget:
+                        return self._slice(full, level, col, row)
+                    self._store(key, image)
+        return self._slice(full, level, col, row)
+
+    def _decoded(self, level):
+        # whole level for formats without clip support, one level is kept
+        # when it fits level_budget
+        if self._level is not None and self._level[0] == level:
+            return self._level[1]
+        self._level = None
+        size = self._level_size(level)
+        reader = QtGui.QImageReader(self._filepath)
+        reader.setScaledSize(size)
+        full = reader.read()
+        if full.byteCount() <= self.level_budget:
+            self._level = (level, full)
+        return full
+
+    def tile(self, level, col, row):
+        """
+        decoded tile, loaded on first use
+
+        Args:
+            level (int): mip level
+            col (int): tile column
+            row (int): tile row
+
+        Returns:
+            QImage: tile pixels at level resolution
+        """
+        key = (level, col, row)
+        image = self._tiles.pop(key, None)
+        if image is None:
+            image = self._decode(level, col, row)
+        else:
+            self._bytes -= image.byteCount()
+        self._store(key, image)
+        return image
+
+    def _evict(self, keep, reserve=0):
+        # drops least recently drawn tiles until reserve more bytes fit
+        for key in list(self._tiles):
+            if self._bytes + reserve <= self.budget:
+                break
+            if key in keep:
+                continue
+            self._bytes -= self._tiles.pop(key).byteCount()
+
+    def draw(self, painter, rect, lod):
+        """
+        draws visible tiles at the level matching lod
+
+        Args:
+            painter (QPainter): painter in scene coordinates
+            rect (QRectF): exposed scene rect
+            lod (float): screen pixels per scene pixel
+        """
+        bounds = QtCore.QRectF(0, 0, self.size.width(), self.size.height())
+        rect = rect.intersected(bounds)
+        if rect.isEmpty():
+            return
+
+        level = self.level_for(lod)
+        span = float(self._tile_size * 2 ** level)
+        first_col = int(rect.left() // span)
+        last_col = int(min(rect.right(), bounds.right() - 1) // span)
+        first_row = int(rect.top() // span)
+        last_row = int(min(rect.bottom(), bounds.bottom() - 1) // span)
+
+        painter.save()
+        painter.setOpacity(painter.opacity() * self.opacity)
+        painter.setRenderHint(QtGui.QPainter.SmoothPixmapTransform)
+        # one ring of tiles around the view is sliced along with a decoded
+        # level, see _decode
+        cols, rows = self._level_grid(level)
+        self._nearby = (level,
+                        range(max(0, first_col - 1), min(cols, last_col + 2)),
+                        range(max(0, first_row - 1), min(rows, last_row + 2)))
+        drawn = set()
+        for row in range(first_row, last_row + 1):
+            for col in range(first_col, last_col + 1):
+                image = self.tile(level, col, row)
+                drawn.add((level, col, row))
+                target = QtCore.QRectF(self._tile_rect(level, col, row))
+                painter.drawImage(target, image)
+        painter.restore()
+        self._evict(drawn)
+
+    def clear(self):
+        """
+        drops every decoded tile & the kept level
+        """
+        self._tiles.clear()
+        self._bytes = 0
+        self._level = None
+
+    def memory_usage(self):
+        """
+        bytes held by decoded tiles & the kept level
+
+        Returns:
+            int: bytes
+        """
+        if self._level is not None:
+            return self._bytes + self._level[1].byteCount()
+        return self._bytes
@@ -0,0 +1,1111 @@
+"""
+Headless benchmark suite for PyQtPaint hot paths.
+
+Drives PaintScene/PaintView with synthetic strokes and times the canvas,
+layer panel, undo and export code paths. Results are written as JSON and can
+be compared against a stored baseline.
+
+Usage:
+    python benchmark.py [--output bench.json] [--baseline baseline.json]
+                        [--save-baseline] [--tolerance 0.25] [--only name]
+                        [--quick]
+
+Runs on the offscreen Qt platform when the Qt build supports it, otherwise
+on whatever display is available (e.g. Xvfb).
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import tempfile
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt4 import QtGui, QtCore  # noqa: E402
+
+BENCHMARKS = []
+
+
+def benchmark(name):
+    """
+    registers a benchmark function under name
+
+    Args:
+        name (str): unique benchmark name used in the results file
+    """
+    def register(func):
+        BENCHMARKS.append((name, func))
+        return func
+    return register
+
+
+def summarize(samples):
+    """
+    reduces a list of timings to summary statistics
+
+    Args:
+        samples (list): timings in milliseconds
+
+    Returns:
+        dict: count/min/median/mean/p95/max/total of samples
+    """
+    ordered = sorted(samples)
+    count = len(ordered)
+    if not count:
+        return {'count': 0}
+    total = sum(ordered)
+    return {'count': count,
+            'min': ordered[0],
+            'median': ordered[count // 2],
+            'mean': total / count,
+            'p95': ordered[min(count - 1, int(count * 0.95))],
+            'max': ordered[-1],
+            'total': total}
+
+
+class Timer(object):
+    """
+    accumulates wall clock samples in milliseconds
+    """
+    def __init__(self):
+        self.samples = []
+        self._start = None
+
+    def __enter__(self):
+        self._start = time.time()
+        return self
+
+    def __exit__(self, *exc):
+        self.samples.append((time.time() - self._start) * 1000.0)
+
+    def stats(self):
+        return summarize(self.samples)
+
+
+class Context(object):
+    """
+    shared state handed to each benchmark
+
+    Attributes:
+        app (QApplication): running application
+        quick (bool): run reduced problem sizes
+    """
+    def __init__(self, app, quick=False):
+        self.app = app
+        self.quick = quick
+
+    def sizes(self, full, quick):
+        return quick if self.quick else full
+
+    def make_paint(self, width=1920, height=1080):
+        """
+        creates & shows a PyQtPaint widget
+
+        Returns:
+            PyQtPaint: widget ready for input
+        """
+        from pyqtpaint import PyQtPaint
+        paint = PyQtPaint(width, height)
+        paint.resize(1200, 800)
+        paint.show()
+        self.flush()
+        return paint
+
+    def flush(self):
+        """
+        processes pending events so deferred repaints are included
+        """
+        self.app.processEvents()
+
+
+def synthetic_stroke(length, width, height, seed=0):
+    """
+    random walk of points inside the canvas
+
+    Args:
+        length (int): number of points
+        width (int): canvas width
+        height (int): canvas height
+        seed (int): random seed so runs are repeatable
+
+    Returns:
+        list: QPointF positions
+    """
+    rng = random.Random(seed)
+    x = rng.uniform(0, width)
+    y = rng.uniform(0, height)
+    points = []
+    for i in range(length):
+        x = max(0, min(width, x + rng.uniform(-8, 8)))
+        y = max(0, min(height, y + rng.uniform(-8, 8)))
+        points.append(QtCore.QPointF(x, y))
+    return points
+
+
+def draw_stroke(scene, points, move_timer=None, complete_timer=None):
+    """
+    feeds a synthetic stroke through the PaintScene stroke api
+
+    Args:
+        scene (PaintScene): scene to paint into
+        points (list): QPointF positions, first is the press position
+        move_timer (Timer, optional): records per-move latency
+        complete_timer (Timer, optional): records commit cost
+    """
+    scene.start_paintstroke(QtCore.QPointF(points[0]))
+    for point in points[1:-1]:
+        if move_timer is None:
+            scene.update_paintstroke(point)
+        else:
+            with move_timer:
+                scene.update_paintstroke(point)
+    if complete_timer is None:
+        scene.complete_paintstroke(QtCore.QPointF(points[-1]))
+    else:
+        with complete_timer:
+            scene.complete_paintstroke(QtCore.QPointF(points[-1]))
+
+
+def send_mouse(view, kind, position, button=QtCore.Qt.LeftButton):
+    """
+    delivers a synthetic mouse event to the view's viewport
+
+    Args:
+        view (PaintView): target view
+        kind (QEvent.Type): MouseButtonPress, MouseMove or MouseButtonRelease
+        position (QPointF): scene position
+        button (Qt.MouseButton): button held
+    """
+    pos = view.mapFromScene(position)
+    buttons = button if kind != QtCore.QEvent.MouseButtonRelease else \
+        QtCore.Qt.NoButton
+    event = QtGui.QMouseEvent(kind, pos, button, buttons,
+                              QtCore.Qt.NoModifier)
+    QtGui.QApplication.sendEvent(view.viewport(), event)
+
+
+def fill_strokes(ctx, paint, count, length=50, blur=0):
+    """
+    commits count synthetic strokes to paint
+    """
+    scene = paint.paint_scene
+    scene.set_pen_blur(blur)
+    for i in range(count):
+        draw_stroke(scene, synthetic_stroke(length, scene.width,
+                                            scene.height, seed=i))
+    ctx.flush()
+
+
+@benchmark('construction')
+def bench_construction(ctx):
+    from pyqtpaint import PyQtPaint
+    timer = Timer()
+    for i in range(ctx.sizes(20, 5)):
+        with timer:
+            paint = PyQtPaint(1920, 1080)
+        paint.deleteLater()
+        ctx.flush()
+    show = Timer()
+    for i in range(ctx.sizes(10, 3)):
+        paint = PyQtPaint(1920, 1080)
+        with show:
+            paint.show()
+            ctx.flush()
+        paint.close()
+        paint.deleteLater()
+
+    # what construction used to do: parse the .ui file & build both
+    # dialogs up front, against the compiled layout alone
+    from PyQt4 import uic
+    from ui_pyqtpaint import Ui_Form
+    ui_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'ui',
+                           'pyqtpaint.ui')
+    parsed = Timer()
+    compiled = Timer()
+    for i in range(ctx.sizes(20, 5)):
+        widget = QtGui.QWidget()
+        with parsed:
+            uic.loadUi(ui_path, widget)
+            QtGui.QFileDialog(widget)
+            QtGui.QColorDialog()
+        widget.deleteLater()
+        widget = QtGui.QWidget()
+        with compiled:
+            Ui_Form().setupUi(widget)
+        widget.deleteLater()
+        ctx.flush()
+    return {'construct': timer.stats(), 'first_show': show.stats(),
+            'ui_parsed_eager_dialogs': parsed.stats(),
+            'ui_compiled_lazy_dialogs': compiled.stats()}
+
+
+@benchmark('instance_memory')
+def bench_instance_memory(ctx):
+    paints = []
+    for i in range(ctx.sizes(8, 3)):
+        paint = ctx.make_paint()
+        fill_strokes(ctx, paint, ctx.sizes(200, 20), length=50)
+        paints.append(paint)
+    usage = paints[-1].memory_usage()
+    timer = Timer()
+    for i in range(20):
+        with timer:
+            paints[-1].memory_report()
+    usage['report_ms'] = timer.stats()
+    for paint in paints:
+        paint.close()
+    return usage
+
+
+@benchmark('paintstroke_update')
+def bench_paintstroke_update(ctx):
+    results = {}
+    for blur in (0, 10):
+        for length in ctx.sizes((100, 1000, 5000), (100, 500)):
+            paint = ctx.make_paint()
+            scene = paint.paint_scene
+            scene.set_pen_blur(blur)
+            moves = Timer()
+            frames = Timer()
+            points = synthetic_stroke(length, scene.width, scene.height)
+            scene.start_paintstroke(QtCore.QPointF(points[0]))
+            for i, point in enumerate(points[1:]):
+                with moves:
+                    scene.update_paintstroke(point)
+                if i % 4 == 0:
+                    with frames:
+                        ctx.flush()
+            scene.complete_paintstroke()
+            key = 'len{}_blur{}'.format(length, blur)
+            results[key] = {'move': moves.stats(), 'frame': frames.stats()}
+            paint.close()
+    return results
+
+
+@benchmark('paintstroke_complete')
+def bench_paintstroke_complete(ctx):
+    results = {}
+    for count in ctx.sizes((100, 500), (50,)):
+        paint = ctx.make_paint()
+        scene = paint.paint_scene
+        commits = Timer()
+        for i in range(count):
+            draw_stroke(scene, synthetic_stroke(50, scene.width, scene.height,
+                                                seed=i),
+                        complete_timer=commits)
+        ctx.flush()
+        results['strokes{}'.format(count)] = commits.stats()
+        paint.close()
+    return results
+
+
+@benchmark('update_layer_index')
+def bench_update_layer_index(ctx):
+    results = {}
+    for count in ctx.sizes((100, 500, 1000), (50, 100)):
+        paint = ctx.make_paint()
+        fill_strokes(ctx, paint, count, length=10)
+        timer = Timer()
+        for i in range(10):
+            with timer:
+                paint.update_layer_index()
+        results['layers{}'.format(count)] = timer.stats()
+        paint.close()
+    return results
+
+
+@benchmark('remove_layer_item')
+def bench_remove_layer_item(ctx):
+    results = {}
+    for count in ctx.sizes((100, 500, 1000), (50, 100)):
+        paint = ctx.make_paint()
+        fill_strokes(ctx, paint, count, length=10)
+        timer = Timer()
+        ids = sorted(paint.paint_scene.strokes.keys())
+        for stroke_id in ids[::max(1, len(ids) // 20)]:
+            with timer:
+                paint.remove_layer_item(stroke_id)
+        results['layers{}'.format(count)] = timer.stats()
+        paint.close()
+    return results
+
+
+@benchmark('selected_create_layer')
+def bench_selected_create_layer(ctx):
+    from strokes import make_stroke
+    results = {}
+    for count in ctx.sizes((500, 2000), (100,)):
+        paint = ctx.make_paint()
+        fill_strokes(ctx, paint, count, length=10)
+        paint.layers_tree.selectAll()
+        scene = paint.paint_scene
+        timer = Timer()
+        for i in range(ctx.sizes(20, 5)):
+            points = [(p.x(), p.y())
+                      for p in synthetic_stroke(10, 1920, 1080, seed=i)]
+            stroke = make_stroke(points, scene.pen_color, scene.pen_size)
+            with timer:
+                scene.push_stroke(stroke)
+        results['{}_selected'.format(count)] = timer.stats()
+        paint.close()
+    return results
+
+
+@benchmark('delegate_paint')
+def bench_delegate_paint(ctx):
+    results = {}
+    for count in ctx.sizes((50, 500), (50,)):
+        paint = ctx.make_paint()
+        fill_strokes(ctx, paint, count, length=10)
+        paint.layers_tree.selectAll()
+        ctx.flush()
+        viewport = paint.layers_tree.viewport()
+        img = QtGui.QImage(viewport.size(),
+                           QtGui.QImage.Format_ARGB32_Premultiplied)
+        # first frame only schedules thumbnails, it must stay cheap
+        thumbnails = paint.layers_tree.thumbnails
+        thumbnails.clear()
+        cold = Timer()
+        with cold:
+            viewport.render(img)
+        results['layers{}_cold'.format(count)] = cold.stats()
+        thumbnails._pool.waitForDone()
+        ctx.flush()
+        timer = Timer()
+        for i in range(20):
+            with timer:
+                viewport.render(img)
+        results['layers{}'.format(count)] = timer.stats()
+        results['layers{}_thumbnail_bytes'.format(count)] = (
+            thumbnails.memory_usage())
+        paint.close()
+    return results
+
+
+@benchmark('undo_redo')
+def bench_undo_redo(ctx):
+    results = {}
+    for count in ctx.sizes((100, 500), (50,)):
+        paint = ctx.make_paint()
+        fill_strokes(ctx, paint, count, length=20)
+        stack = paint.paint_scene.undo_stack
+        undo = Timer()
+        redo = Timer()
+        while stack.canUndo():
+            with undo:
+                stack.undo()
+        ctx.flush()
+        while stack.canRedo():
+            with redo:
+                stack.redo()
+        ctx.flush()
+        undo_stats = undo.stats()
+        redo_stats = redo.stats()
+        undo_stats['ops_per_sec'] = count / (undo_stats['total'] / 1000.0)
+        redo_stats['ops_per_sec'] = count / (redo_stats['total'] / 1000.0)
+        results['strokes{}'.format(count)] = {'undo': undo_stats,
+                                              'redo': redo_stats}
+        paint.close()
+    return results
+
+
+@benchmark('history_jump')
+def bench_history_jump(ctx):
+    results = {}
+    for count in ctx.sizes((500, 2000), (200,)):
+        paint = ctx.make_paint()
+        fill_strokes(ctx, paint, count, length=20)
+        scene = paint.paint_scene
+        history = scene.history
+        for label, checkpoints in (('stepped', None),
+                                   ('checkpoints', history)):
+            scene.history = checkpoints
+            timer = Timer()
+            for target in (0, count, count // 3, count - 7):
+                with timer:
+                    paint.jump_to_history(target)
+                ctx.flush()
+            results['strokes{}_{}'.format(count, label)] = timer.stats()
+        scene.history = history
+        results['strokes{}_checkpoint_count'.format(count)] = len(history)
+        paint.close()
+    return results
+
+
+def layer_tree_state(paint):
+    """
+    layer panel contents as nested lists of stroke & group indices
+    """
+    from layers import Folder
+
+    def state(item):
+        if isinstance(item, Folder):
+            return [item.group_index] + [state(item.child(i))
+                                         for i in range(item.childCount())]
+        return item.stroke_index
+    tree = paint.layers_tree
+    return [state(tree.topLevelItem(i))
+            for i in range(tree.topLevelItemCount())]
+
+
+@benchmark('history_consistency')
+def bench_history_consistency(ctx):
+    """
+    checkpoint jumps must leave the same layers & strokes as stepping
+    """
+    from canvas import GroupStrokes, DeleteStroke
+    from layers import Layer
+    paint = ctx.make_paint()
+    scene = paint.paint_scene
+    history = scene.history
+    history.interval = 2
+    fill_strokes(ctx, paint, 6, length=20)
+    paint.update_layer_index()
+    scene.undo_stack.push(GroupStrokes(paint, [2, 3, 4]))
+    paint.update_layer_index()
+    iterator = QtGui.QTreeWidgetItemIterator(paint.layers_tree)
+    while not (isinstance(iterator.value(), Layer) and
+               iterator.value().stroke_index == 6):
+        iterator += 1
+    layer = iterator.value()
+    scene.undo_stack.push(DeleteStroke(paint, layer))
+    count = scene.undo_stack.count()
+
+    def snapshot():
+        ctx.flush()
+        strokes = sorted(stroke_id
+                         for stroke_id, stroke in scene.strokes.items()
+                         if stroke['stroke'].scene() is scene)
+        return layer_tree_state(paint), strokes
+
+    expected = {}
+    scene.history = None
+    for target in (0, count, count // 2, count):
+        paint.jump_to_history(target)
+        expected[target] = snapshot()
+    scene.history = history
+    mismatches = []
+    for target in (0, count, 0, count // 2, count):
+        paint.jump_to_history(target)
+        if snapshot() != expected[target]:
+            mismatches.append((target, snapshot(), expected[target]))
+    paint.close()
+    if mismatches:
+        raise AssertionError('checkpoint jumps differ from stepping: '
+                             '{}'.format(mismatches))
+    return {'jumps': 5, 'checkpoints': len(history)}
+
+
+@benchmark('get_img')
+def bench_get_img(ctx):
+    results = {}
+    for width, height in ctx.sizes(((1920, 1080), (3840, 2160)),
+                                   ((960, 540),)):
+        for blur in (0, 10):
+            paint = ctx.make_paint(width, height)
+            fill_strokes(ctx, paint, ctx.sizes(200, 20), length=100,
+                         blur=blur)
+            timer = Timer()
+            for i in range(5):
+                with timer:
+                    paint.get_img()
+            key = '{}x{}_blur{}'.format(width, height, blur)
+            results[key] = timer.stats()
+            paint.close()
+    return results
+
+
+@benchmark('sample_color')
+def bench_sample_color(ctx):
+    paint = ctx.make_paint()
+    fill_strokes(ctx, paint, ctx.sizes(500, 50), length=200)
+    scene = paint.paint_scene
+    points = [QtCore.QPointF(40 + i * 7 % 1800, 40 + i * 13 % 1000)
+              for i in range(ctx.sizes(200, 50))]
+    results = {}
+    for label, tiled in (('rendered', False), ('tiles', True)):
+        tiles = scene.set_tiled_rendering(tiled)
+        if tiles is not None:
+            tiles.render_all()
+        timer = Timer()
+        for point in points:
+            with timer:
+                paint.sample_color(point, 2)
+        results[label] = timer.stats()
+
+    crop = Timer()
+    for i in range(ctx.sizes(20, 5)):
+        with crop:
+            paint.get_img(QtCore.QRectF(800, 400, 256, 256))
+    results['crop_256'] = crop.stats()
+    scene.set_tiled_rendering(False)
+    paint.close()
+    return results
+
+
+@benchmark('render_array')
+def bench_render_array(ctx):
+    import buffers
+    if buffers.numpy is None:
+        return {'skipped': 'numpy is not installed'}
+    paint = ctx.make_paint()
+    fill_strokes(ctx, paint, ctx.sizes(500, 50), length=200)
+    rect = QtCore.QRectF(0, 0, 1024, 1024)
+    runs = ctx.sizes(10, 3)
+
+    # get_img allocates an image & converting it copies the pixels
+    copied = Timer()
+    for i in range(runs):
+        with copied:
+            image = paint.get_img(rect)
+            buffers.image_array(image).copy()
+    pooled = Timer()
+    for i in range(runs):
+        with pooled:
+            paint.render_array(rect)
+    results = {'copied': copied.stats(), 'pooled': pooled.stats(),
+               'pool_bytes': buffers.buffer_pool.nbytes}
+    buffers.buffer_pool.clear()
+    paint.close()
+    return results
+
+
+@benchmark('symmetry_commit')
+def bench_symmetry_commit(ctx):
+    results = {}
+    count = ctx.sizes(50, 10)
+    length = 400
+    for ways in (1, 2, 8):
+        paint = ctx.make_paint()
+        scene = paint.paint_scene
+        if ways > 1:
+            paint.set_symmetry('radial', ways)
+        commit = Timer()
+        for i in range(count):
+            points = synthetic_stroke(length, scene.width, scene.height,
+                                      seed=i)
+            scene.start_paintstroke(QtCore.QPointF(points[0]))
+            for point in points[1:-1]:
+                scene.update_paintstroke(point)
+            with commit:
+                scene.complete_paintstroke(QtCore.QPointF(points[-1]))
+        ctx.flush()
+        results['{}_way'.format(ways)] = {
+            'commit': commit.stats(),
+            'stroke_bytes': paint.memory_report()['strokes']}
+        paint.close()
+    return results
+
+
+@benchmark('stroke_outline')
+def bench_stroke_outline(ctx):
+    from strokes import stroke_outline
+    paint = ctx.make_paint()
+    scene = paint.paint_scene
+    fill_strokes(ctx, paint, ctx.sizes(100, 20), length=3000)
+    QtCore.QThreadPool.globalInstance().waitForDone()
+    ctx.flush()
+    items = [stroke['stroke'] for stroke in scene.strokes.values()]
+    points = [QtCore.QPointF(40 + i * 7 % 1800, 40 + i * 13 % 1000)
+              for i in range(ctx.sizes(200, 50))]
+
+    # what shape() cost before outlines were kept
+    uncached = Timer()
+    for point in points:
+        with uncached:
+            for item in items:
+                if item.sceneBoundingRect().contains(point):
+                    stroke_outline(item.path(), item.pen()).contains(point)
+    cached = Timer()
+    for point in points:
+        with cached:
+            scene.items(point)
+    results = {'uncached': uncached.stats(), 'cached': cached.stats(),
+               'outline_elements': sum(item.outline_elements
+                                       for item in items)}
+    paint.close()
+    return results
+
+
+@benchmark('svg_export')
+def bench_svg_export(ctx):
+    import export
+    results = {}
+    for blur in (0, 10):
+        paint = ctx.make_paint()
+        fill_strokes(ctx, paint, ctx.sizes(500, 20), length=200, blur=blur)
+        handle, filepath = tempfile.mkstemp(suffix='.svg')
+        os.close(handle)
+        timer = Timer()
+        for i in range(3):
+            with timer:
+                paint.export_svg(filepath)
+        result = {'export': timer.stats(),
+                  'bytes': os.path.getsize(filepath)}
+        try:
+            result.update(export.verify_svg(paint, filepath))
+        except ImportError:
+            # QtSvg not available
+            pass
+        os.remove(filepath)
+        results['blur{}'.format(blur)] = result
+        paint.close()
+    return results
+
+
+@benchmark('reference_image')
+def bench_reference_image(ctx):
+    side = ctx.sizes(8192, 2048)
+    plate = QtGui.QImage(side, side, QtGui.QImage.Format_RGB32)
+    painter = QtGui.QPainter(plate)
+    gradient = QtGui.QLinearGradient(0, 0, side, side)
+    gradient.setColorAt(0, QtGui.QColor(20, 40, 90))
+    gradient.setColorAt(1, QtGui.QColor(230, 200, 120))
+    painter.fillRect(plate.rect(), QtGui.QBrush(gradient))
+    painter.end()
+
+    # JPEG decodes tiles on their own, PNG decodes & slices whole levels
+    files = []
+    for fmt in ('JPG', 'PNG'):
+        handle, filepath = tempfile.mkstemp(suffix='.' + fmt.lower())
+        os.close(handle)
+        plate.save(filepath, fmt)
+        files.append((fmt, filepath))
+    del plate
+
+    results = {}
+    for fmt, filepath in files:
+        paint = ctx.make_paint(side, side)
+        view = paint._paint_view
+        with Timer() as load:
+            reference = paint.paint_scene.set_reference_image(filepath)
+        results['{}_load_ms'.format(fmt)] = load.samples[0]
+        for zoom in ('fit', 1.0):
+            if zoom == 'fit':
+                view.fit_canvas()
+            else:
+                view.set_zoom(zoom)
+            reference.clear()
+            first = Timer()
+            with first:
+                view.viewport().repaint()
+            timer = Timer()
+            for i in range(5):
+                with timer:
+                    view.viewport().repaint()
+            results['{}_zoom_{}'.format(fmt, zoom)] = {
+                'first_frame': first.samples[0], 'frame': timer.stats(),
+                'decoded_bytes': reference.memory_usage()}
+        paint.close()
+        os.remove(filepath)
+    return results
+
+
+@benchmark('mirror_loopback')
+def bench_mirror_loopback(ctx):
+    from mirror import StreamSubscriber
+    paint = ctx.make_paint()
+    scene = paint.paint_scene
+    name = 'pyqtpaint-bench-{}'.format(os.getpid())
+    publisher = scene.start_mirror(name)
+    subscriber = StreamSubscriber(name)
+    deadline = time.time() + 5
+    while subscriber.scene is None and time.time() < deadline:
+        ctx.flush()
+
+    count = ctx.sizes(200, 20)
+    length = 200
+    start = time.time()
+    for i in range(count):
+        points = synthetic_stroke(length, scene.width, scene.height, seed=i)
+        scene.start_paintstroke(QtCore.QPointF(points[0]))
+        for point in points[1:-1]:
+            scene.update_paintstroke(point)
+            # deliver like a real event loop would between mouse moves
+            ctx.flush()
+        scene.complete_paintstroke(QtCore.QPointF(points[-1]))
+        paint.update_layer_index()
+        ctx.flush()
+    while (subscriber.bytes_received < publisher.bytes_sent and
+           time.time() < deadline + 30):
+        ctx.flush()
+    elapsed = time.time() - start
+
+    mirrored = subscriber.scene
+    results = {
+        'strokes': count,
+        'bytes': publisher.bytes_sent,
+        'bytes_per_stroke': publisher.bytes_sent / float(count),
+        'bytes_per_s': publisher.bytes_sent / max(elapsed, 1e-9),
+        'latency_ms': subscriber.latency.stats(),
+        'mirrored': len([s for s in mirrored.strokes.values()
+                         if s['stroke'].scene() is mirrored])
+        if mirrored is not None else 0}
+    subscriber.close()
+    scene.stop_mirror()
+    paint.close()
+    return results
+
+
+@benchmark('frame_publishing')
+def bench_frame_publishing(ctx):
+    from framebuffer import FrameReader
+    paint = ctx.make_paint()
+    scene = paint.paint_scene
+    name = 'pyqtpaint-frames-{}'.format(os.getpid())
+    publisher = scene.start_frame_publishing(name, fps=1000)
+    reader = FrameReader(name)
+    ctx.flush()
+    publisher.publish()
+    reader.read()
+    publisher.publish_time.clear()
+
+    count = ctx.sizes(20, 5)
+    length = 200
+    read = Timer()
+    for i in range(count):
+        points = synthetic_stroke(length, scene.width, scene.height, seed=i)
+        scene.start_paintstroke(QtCore.QPointF(points[0]))
+        for point in points[1:-1]:
+            scene.update_paintstroke(point)
+            ctx.flush()
+            publisher.publish()
+            with read:
+                reader.read()
+        scene.complete_paintstroke(QtCore.QPointF(points[-1]))
+        paint.update_layer_index()
+        ctx.flush()
+    publisher.publish()
+    frames = publisher.frame
+
+    # hovering only moves the cursor, nothing should be published
+    for point in synthetic_stroke(length, scene.width, scene.height):
+        scene.move_cursor_preview(point)
+        ctx.flush()
+        publisher.publish()
+    frame_bytes = scene.width * scene.height * 4
+    results = {
+        'frames': frames,
+        'hover_frames': publisher.frame - frames,
+        'publish': publisher.publish_time.stats(),
+        'read': read.stats(),
+        'bytes_per_frame': publisher.bytes_copied / float(publisher.frame),
+        'full_frame_bytes': frame_bytes,
+        'latency_ms': reader.latency.stats()}
+    reader.detach()
+    scene.stop_frame_publishing()
+    paint.close()
+    return results
+
+
+@benchmark('zoom_levels')
+def bench_zoom_levels(ctx):
+    results = {}
+    paint = ctx.make_paint(7680, 4320)
+    fill_strokes(ctx, paint, ctx.sizes(500, 50), length=2000)
+    view = paint._paint_view
+    viewport = view.viewport()
+    for zoom in ('fit', 0.25, 1.0, 4.0):
+        if zoom == 'fit':
+            view.fit_canvas()
+        else:
+            view.set_zoom(zoom)
+        ctx.flush()
+        timer = Timer()
+        for i in range(10):
+            with timer:
+                viewport.repaint()
+        results['zoom_{}'.format(zoom)] = timer.stats()
+    paint.close()
+    return results
+
+
+@benchmark('adaptive_quality')
+def bench_adaptive_quality(ctx):
+    results = {}
+    paint = ctx.make_paint()
+    fill_strokes(ctx, paint, ctx.sizes(500, 120), length=2000)
+    view = paint._paint_view
+    viewport = view.viewport()
+    for tiled in (False, True):
+        tiles = paint.paint_scene.set_tiled_rendering(tiled)
+        if tiles is not None:
+            tiles.render_all()
+        quality = view.set_adaptive_quality(idle_ms=60000, min_strokes=0)
+        for i in range(10):
+            view.zoom_by(1.1 if i % 2 else 1 / 1.1)
+            viewport.repaint()
+        quality.refine()
+        for i in range(10):
+            viewport.repaint()
+        results['tiled' if tiled else 'live'] = quality.stats()
+    paint.paint_scene.set_tiled_rendering(False)
+    paint.close()
+    return results
+
+
+@benchmark('proxy_scale')
+def bench_proxy_scale(ctx):
+    paint = ctx.make_paint(7680, 4320)
+    fill_strokes(ctx, paint, ctx.sizes(300, 30), length=2000)
+    scene = paint.paint_scene
+    viewport = paint._paint_view.viewport()
+    results = {}
+    for scale in (None, 0.5, 0.25):
+        paint.set_proxy_scale(scale)
+        label = 'full' if scale is None else scale
+        if scene.tile_cache is not None:
+            rasterize = Timer()
+            with rasterize:
+                scene.tile_cache.render_all()
+            results['rasterize_{}'.format(label)] = rasterize.stats()
+            results['tile_bytes_{}'.format(label)] = (
+                scene.tile_cache.memory_usage())
+        ctx.flush()
+        timer = Timer()
+        for i in range(10):
+            with timer:
+                viewport.repaint()
+        results['repaint_{}'.format(label)] = timer.stats()
+    # exports ignore the proxy
+    timer = Timer()
+    for i in range(ctx.sizes(3, 1)):
+        with timer:
+            paint.get_img()
+    results['get_img_proxy'] = timer.stats()
+    paint.close()
+    return results
+
+
+@benchmark('add_strokes')
+def bench_add_strokes(ctx):
+    from strokes import make_stroke
+    results = {}
+    for count in ctx.sizes((100, 1000), (50,)):
+        points = [[(p.x(), p.y()) for p in synthetic_stroke(
+            100, 1920, 1080, seed=i)] for i in range(count)]
+        try:
+            import numpy
+            points = [numpy.array(stroke) for stroke in points]
+        except ImportError:
+            pass
+
+        # one command, signal & layer index update per stroke
+        paint = ctx.make_paint()
+        scene = paint.paint_scene
+        start = time.time()
+        for stroke in points:
+            scene.push_stroke(make_stroke(stroke, scene.pen_color,
+                                          scene.pen_size))
+        ctx.flush()
+        single = time.time() - start
+        paint.close()
+
+        paint = ctx.make_paint()
+        start = time.time()
+        paint.add_strokes(points)
+        ctx.flush()
+        bulk = time.time() - start
+        paint.close()
+
+        results['{}_strokes'.format(count)] = {
+            'push_stroke_per_s': count / max(single, 1e-9),
+            'add_strokes_per_s': count / max(bulk, 1e-9)}
+    return results
+
+
+@benchmark('tile_rasterize')
+def bench_tile_rasterize(ctx):
+    cores = QtCore.QThread.idealThreadCount()
+    threads = sorted(set([1, 2, 4, cores]))
+    threads = [n for n in threads if n <= max(1, cores)]
+    paint = ctx.make_paint(3840, 2160)
+    fill_strokes(ctx, paint, ctx.sizes(500, 50), length=500)
+    scene = paint.paint_scene
+    tiles = scene.set_tiled_rendering(True)
+
+    results = {'cores': cores, 'tiles': len(tiles)}
+    single = None
+    for count in threads:
+        tiles.set_threads(count)
+        timer = Timer()
+        for i in range(ctx.sizes(5, 2)):
+            tiles.invalidate()
+            with timer:
+                tiles.render_all()
+        stats = timer.stats()
+        if single is None:
+            single = stats['median']
+        results['threads_{}'.format(count)] = stats
+        results['speedup_{}'.format(count)] = single / max(stats['median'],
+                                                           1e-6)
+
+    # gui thread render of the same canvas for reference
+    scene.set_tiled_rendering(False)
+    timer = Timer()
+    for i in range(ctx.sizes(5, 2)):
+        with timer:
+            paint.get_img()
+    results['gui_thread'] = timer.stats()
+    paint.close()
+    return results
+
+
+@benchmark('stroke_memory')
+def bench_stroke_memory(ctx):
+    from strokes import StrokeItem, path_cache
+    from memory import PATH_ELEMENT_BYTES
+    paint = ctx.make_paint()
+    fill_strokes(ctx, paint, ctx.sizes(200, 20), length=2000)
+    compressed = 0
+    uncompressed = 0
+    for stroke in paint.paint_scene.strokes.values():
+        item = stroke['stroke']
+        if isinstance(item, StrokeItem):
+            compressed += item.geometry.nbytes
+            uncompressed += len(item.geometry) * PATH_ELEMENT_BYTES
+    result = {'geometry_bytes': compressed,
+              'qpainterpath_bytes': uncompressed,
+              'ratio': uncompressed / float(max(compressed, 1)),
+              'path_cache_elements': path_cache.elements}
+    paint.close()
+    return result
+
+
+@benchmark('replay')
+def bench_replay(ctx):
+    paint = ctx.make_paint()
+    view = paint._paint_view
+    scene = paint.paint_scene
+    handle, filepath = tempfile.mkstemp(suffix='.pqr')
+    os.close(handle)
+
+    paint.start_recording(filepath)
+    for i in range(ctx.sizes(100, 10)):
+        points = synthetic_stroke(50, scene.width, scene.height, seed=i)
+        send_mouse(view, QtCore.QEvent.MouseButtonPress, points[0])
+        for point in points[1:]:
+            send_mouse(view, QtCore.QEvent.MouseMove, point)
+        send_mouse(view, QtCore.QEvent.MouseButtonRelease, points[-1])
+        if i % 10 == 9:
+            paint.undo_action.trigger()
+    paint.stop_recording()
+    paint.close()
+
+    from recording import InputReplayer
+    replayer = InputReplayer(filepath)
+    target = ctx.make_paint(replayer.width, replayer.height)
+    result = replayer.replay(target)
+    target.close()
+    result['events_per_sec'] = result['events'] / max(result['seconds'],
+                                                      1e-9)
+    result['file_bytes'] = os.path.getsize(filepath)
+    os.remove(filepath)
+    return result
+
+
+def flatten(results, prefix=''):
+    """
+    flattens nested result dicts to {'a/b/median': value}
+
+    Args:
+        results (dict): nested benchmark results
+        prefix (str): key prefix
+
+    Returns:
+        dict: flat mapping of metric paths to numbers
+    """
+    flat = {}
+    for key, value in results.items():
+        path = prefix + key
+        if isinstance(value, dict):
+            flat.update(flatten(value, path + '/'))
+        elif isinstance(value, (int, float)) and \
+                not isinstance(value, bool):
+            flat[path] = value
+    return flat
+
+
+def compare(results, baseline, tolerance):
+    """
+    compares median timings against baseline
+
+    Args:
+        results (dict): current benchmark results
+        baseline (dict): stored benchmark results
+        tolerance (float): allowed relative slowdown, 0.25 = 25%
+
+    Returns:
+        list: (metric, baseline, current, ratio) for every regression
+    """
+    current = flatten(results)
+    previous = flatten(baseline)
+    regressions = []
+    for key in sorted(current):
+        if not key.endswith('/median') or key not in previous:
+            continue
+        if previous[key] <= 0:
+            continue
+        ratio = current[key] / previous[key]
+        if ratio > 1.0 + tolerance:
+            regressions.append((key, previous[key], current[key], ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--output', default='bench_output.json')
+    parser.add_argument('--baseline', default='benchmark_baseline.json')
+    parser.add_argument('--save-baseline', action='store_true')
+    parser.add_argument('--tolerance', type=float, default=0.25)
+    parser.add_argument('--only', action='append', default=[])
+    parser.add_argument('--quick', action='store_true')
+    args = parser.parse_args(argv)
+
+    app = QtGui.QApplication.instance() or QtGui.QApplication(sys.argv)
+    ctx = Context(app, quick=args.quick)
+
+    results = {}
+    for name, func in BENCHMARKS:
+        if args.only and name not in args.only:
+            continue
+        sys.stdout.write('{} ... '.format(name))
+        sys.stdout.flush()
+        start = time.time()
+        results[name] = func(ctx)
+        sys.stdout.write('{:.1f}s\n'.format(time.time() - start))
+
+    report = {'meta': {'python': platform.python_version(),
+                       'qt': QtCore.QT_VERSION_STR,
+                       'pyqt': QtCore.PYQT_VERSION_STR,
+                       'platform': platform.platform(),
+                       'quick': args.quick,
+                       'timestamp': time.time()},
+              'results': results}
+
+    with open(args.output, 'w') as handle:
+        json.dump(report, handle, indent=2, sort_keys=True)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as handle:
+            json.dump(report, handle, indent=2, sort_keys=True)
+        return 0
+
+    if not os.path.exists(args.baseline):
+        return 0
+
+    with open(args.baseline) as handle:
+        baseline = json.load(handle)
+    regressions = compare(results, baseline.get('results', {}),
+                          args.tolerance)
+    for key, before, after, ratio in regressions:
+        sys.stdout.write('REGRESSION {}: {:.3f}ms -> {:.3f}ms ({:.0%})\n'
+                         .format(key, before, after, ratio - 1.0))
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
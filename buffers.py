@@ -0,0 +1,241 @@
+"""
+Zero-copy NumPy access to rendered canvas pixels.
+
+A RenderBuffer is one NumPy allocation with a QImage wrapped around it, so
+painting into the image writes straight into the array. Pixels are 32 bit
+ARGB words, which on little endian machines are laid out in memory as
+B, G, R, A bytes; CHANNEL_ORDER names the byte order of the running
+machine. rgb_view gives an RGB ordered view without copying.
+"""
+import sys
+import sip
+from PyQt4 import QtGui, QtCore
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# byte order of a pixel in memory
+CHANNEL_ORDER = 'BGRA' if sys.byteorder == 'little' else 'ARGB'
+
+
+def _require_numpy():
+    if numpy is None:
+        raise ImportError('numpy is required for array access to renders')
+
+
+def _image_format(premultiplied):
+    if premultiplied:
+        return QtGui.QImage.Format_ARGB32_Premultiplied
+    return QtGui.QImage.Format_ARGB32
+
+
+class _ImageMemory(object):
+    # exposes a QImage's pixels to numpy, arrays made from it keep the
+    # image alive through their base
+    def __init__(self, image):
+        self.image = image
+        self.__array_interface__ = {
+            'version': 3,
+            'typestr': '|u1',
+            'shape': (image.height(), image.bytesPerLine()),
+            'data': (int(image.bits()), False),
+        }
+
+
+def image_array(image):
+    """
+    array sharing memory with a 32 bit QImage, the array keeps a reference
+    to the image
+
+    Args:
+        image (QImage): RGB32, ARGB32 or ARGB32_Premultiplied image
+
+    Returns:
+        numpy.ndarray: (height, width, 4) uint8 view, see CHANNEL_ORDER
+    """
+    _require_numpy()
+    if image.depth() != 32:
+        raise ValueError('expected a 32 bit image, got {} bits'.format(
+            image.depth()))
+    rows = numpy.asarray(_ImageMemory(image))
+    return rows[:, :image.width() * 4].reshape(image.height(),
+                                                image.width(), 4)
+
+
+def rgb_view(array):
+    """
+    RGB ordered view of a buffer array, no pixels are copied
+
+    Args:
+        array (numpy.ndarray): (height, width, 4) array in CHANNEL_ORDER
+
+    Returns:
+        numpy.ndarray: (height, width, 3) view
+    """
+    if CHANNEL_ORDER == 'BGRA':
+        return array[..., 2::-1]
+    return array[..., 1:]
+
+
+class RenderBuffer(object):
+    """
+    NumPy array & QImage sharing one allocation. Existing arrays can be
+    wrapped so repeated renders reuse the caller's memory.
+
+    Attributes:
+        array (numpy.ndarray): (height, width, 4) uint8 pixels, see
+                               CHANNEL_ORDER
+        image (QImage): image painting into array
+        premultiplied (bool): color channels are premultiplied by alpha
+    """
+    def __init__(self, width=None, height=None, premultiplied=True,
+                 array=None):
+        """
+        Args:
+            width (int, optional): pixels, ignored when array is given
+            height (int, optional): pixels, ignored when array is given
+            premultiplied (bool, optional): premultiplied alpha format
+            array (numpy.ndarray, optional): C contiguous (height, width, 4)
+                                             uint8 array to render into
+        """
+        _require_numpy()
+        if array is None:
+            array = numpy.zeros((height, width, 4), dtype=numpy.uint8)
+        if (array.dtype != numpy.uint8 or array.ndim != 3 or
+                array.shape[2] != 4 or not array.flags['C_CONTIGUOUS'] or
+                not array.flags['WRITEABLE']):
+            raise ValueError('expected a writeable C contiguous '
+                             '(height, width, 4) uint8 array')
+        self.array = array
+        self.premultiplied = premultiplied
+        height, width = array.shape[:2]
+        # QImage does not own the memory, self.array keeps it alive
+        self.image = QtGui.QImage(sip.voidptr(array.ctypes.data), width,
+                                  height, width * 4,
+                                  _image_format(premultiplied))
+
+    @property
+    def size(self):
+        """
+        buffer size
+
+        Returns:
+            QSize: width & height in pixels
+        """
+        return QtCore.QSize(self.image.width(), self.image.height())
+
+    @property
+    def nbytes(self):
+        """
+        bytes held by the pixels
+
+        Returns:
+            int: bytes
+        """
+        return self.array.nbytes
+
+    def matches(self, width, height, premultiplied):
+        """
+        whether the buffer can hold a render of the given size & format
+
+        Returns:
+            bool: buffer is reusable
+        """
+        return (self.image.width() == width and
+                self.image.height() == height and
+                self.premultiplied == premultiplied)
+
+
+class BufferPool(object):
+    """
+    Reuses render buffers by size & format. A pooled buffer is overwritten
+    by the next render of the same size, copy its array to keep it.
+
+    Attributes:
+        max_buffers (int): buffers kept
+    """
+    def __init__(self, max_buffers=4):
+        self.max_buffers = max_buffers
+        self._buffers = []
+
+    def acquire(self, width, height, premultiplied=True):
+        """
+        buffer for a render, allocated when no pooled buffer matches
+
+        Args:
+            width (int): pixels
+            height (int): pixels
+            premultiplied (bool, optional): premultiplied alpha format
+
+        Returns:
+            RenderBuffer: most recently used matching buffer
+        """
+        for i, buffer in enumerate(self._buffers):
+            if buffer.matches(width, height, premultiplied):
+                self._buffers.append(self._buffers.pop(i))
+                return buffer
+        buffer = RenderBuffer(width, height, premultiplied)
+        self._buffers.append(buffer)
+        while len(self._buffers) > self.max_buffers:
+            self._buffers.pop(0)
+        return buffer
+
+    @property
+    def nbytes(self):
+        """
+        bytes held by pooled buffers
+
+        Returns:
+            int: bytes
+        """
+        return sum(buffer.nbytes for buffer in self._buffers)
+
+    def clear(self):
+        """
+        drops every pooled buffer
+        """
+        self._buffers = []
+
+
+buffer_pool = BufferPool()
+
+
+def render_to_array(scene, rect=None, scale=1.0, out=None,
+                    premultiplied=True):
+    """
+    renders canvas pixels straight into a NumPy array, no copies are made
+
+    Args:
+        scene (PaintScene): scene to render
+        rect (QRectF, optional): scene rect, defaults to whole canvas
+        scale (float, optional): array pixels per scene pixel
+        out (RenderBuffer or numpy.ndarray, optional): render target,
+                                                      a pooled buffer is
+                                                      used when omitted
+        premultiplied (bool, optional): premultiplied alpha format, used
+                                        when out is not a RenderBuffer
+
+    Returns:
+        numpy.ndarray: (height, width, 4) uint8 pixels, see CHANNEL_ORDER
+    """
+    _require_numpy()
+    if rect is None:
+        rect = QtCore.QRectF(0, 0, scene.width, scene.height)
+    rect = QtCore.QRectF(rect)
+    width = max(1, int(round(rect.width() * scale)))
+    height = max(1, int(round(rect.height() * scale)))
+
+    if out is None:
+        buffer = buffer_pool.acquire(width, height, premultiplied)
+    elif isinstance(out, RenderBuffer):
+        buffer = out
+    else:
+        buffer = RenderBuffer(array=out, premultiplied=premultiplied)
+    if buffer.image.width() != width or buffer.image.height() != height:
+        raise ValueError('render is {}x{}, buffer is {}x{}'.format(
+            width, height, buffer.image.width(), buffer.image.height()))
+
+    scene.render_into(buffer.image, rect)
+    return buffer.array
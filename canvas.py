@@ -1,5 +1,19 @@
+import math
+import time
+from contextlib import contextmanager
 from PyQt4 import QtGui, QtCore
 from layers import Layer, Folder
+from metrics import FrameMetrics
+from tracing import Tracer, span
+from shared import registry
+import recording
+from strokes import StrokeGeometry, StrokeItem, RasterItem, path_cache
+from strokes import make_stroke, duplicate_stroke, symmetry_transforms
+from strokes import StrokeBlurEffect
+from tiles import TileCache
+from background import ReferenceImage
+from history import HistoryView
+from quality import AdaptiveQuality, IDLE_MS, MIN_STROKES
 
 
 class PaintScene(QtGui.QGraphicsScene):
@@ -9,21 +23,47 @@ class PaintScene(QtGui.QGraphicsScene):
     and LayerPanel. Makes calls to QUndoFramework.
 
     Attributes:
+        blur_scale (float): device pixels per scene pixel soft strokes are
+                            blurred at, the view zoom, see set_blur_scale
         brushChanged (SIGNAL): emitted when brush settings change
         height (int): Height of scene
+        history (HistoryCheckpoints): checkpoints for fast history jumps,
+                                      None when jumps step every command
+        memory (MemoryMonitor): memory accounting, None when not measured
+        metrics (FrameMetrics): instrumentation, None when disabled
+        mirror (StreamPublisher): live mirroring publisher, None when not
+                                  publishing
         next_stroke (int): Stores index of next stroke
         pen_blur (int): Controls brush hardness
         pen_color (QColor): Color of brush
         pen_size (int): Controls brush size
+        proxy_scale (float): display pixels per scene pixel while editing,
+                             None when drawing at full resolution
+        reference (ReferenceImage): plate drawn under strokes, None when
+                                    not loaded
+        restoring (bool): undo commands skip redo/undo while the undo stack
+                          is moved to a history checkpoint
         strokeAdded (SIGNAL): emitted when new stroke added
+        strokeChanged (SIGNAL): emitted with stroke index when a stroke's
+                                geometry is replaced
         strokeRemoved (SIGNAL): emitted when stroked deleted
+        strokesAdded (SIGNAL): emitted with (index, name) list when strokes
+                               are added in bulk
+        strokesRemoved (SIGNAL): emitted with index list when bulk added
+                                 strokes are removed
+        tile_cache (TileCache): threaded stroke rasterizer, None when tiled
+                                rendering is disabled
+        tracer (Tracer): pipeline tracer, None when disabled
         undo_stack (QUndoStack): contains histroy of paint scene
-        undo_view (QUndoView): history panel; currently hidden from users
+        undo_view (HistoryView): history panel; currently hidden from users
         width (int): width of scene
     """
 
     strokeAdded = QtCore.pyqtSignal(int, str)
+    strokeChanged = QtCore.pyqtSignal(int)
     strokeRemoved = QtCore.pyqtSignal(int)
+    strokesAdded = QtCore.pyqtSignal(list)
+    strokesRemoved = QtCore.pyqtSignal(list)
     brushChanged = QtCore.pyqtSignal()
 
     def __init__(self, *args, **kwargs):
@@ -41,43 +81,63 @@ class PaintScene(QtGui.QGraphicsScene):
         self._paint_layer = None
         self._is_painting = False
 
-        # undo framework
+        # instrumentation, set by PaintView.enable_metrics
+        self.metrics = None
+        self.tracer = None
+        # live mirroring, set by start_mirror
+        self.mirror = None
+        # shared memory frames, set by start_frame_publishing
+        self.frames = None
+        self._render_excluded = ()
+
+        # committed strokes rasterized off the gui thread, see
+        # set_tiled_rendering
+        self.tile_cache = None
+        # reduced resolution editing, see set_proxy_scale
+        self.proxy_scale = None
+        self._proxy_tiles = False
+
+        # undo framework, history panel is created on first use
         self.undo_stack = QtGui.QUndoStack(self)
-        self.undo_view = QtGui.QUndoView(self.undo_stack)
-        self.undo_view.setEmptyLabel(QtCore.QString('New'))
+        self._undo_view = None
+        # history checkpoints & memory accounting, set by PyQtPaint
+        self.history = None
+        self.memory = None
+        self.restoring = False
 
         # brush properites
         self.pen_size = 30
         self.pen_color = QtGui.QColor(255, 0, 0, 255)
         self.pen_blur = 0
-
-        # scene ui styling
-        border = QtGui.QPen()
-        border.setWidthF(0.01)
-        border.setColor(QtGui.QColor(128, 128, 128, 255))
-        self.addRect(0, 0, self.width, self.height, border, QtGui.QBrush(
-            QtGui.QColor(255, 255, 255, 255), QtCore.Qt.SolidPattern))
+        # view zoom soft strokes are blurred for, see set_blur_scale
+        self.blur_scale = 1.0
+        self._soft = set()
+        # transforms of extra copies made of each drawn stroke, see
+        # set_symmetry
+        self.symmetry = []
+        self._symmetry_previews = []
+
+        # scene ui styling, canvas is drawn in drawBackground so cached
+        # tiles sit between it & live items
+        self._border = QtGui.QPen()
+        self._border.setWidthF(0.01)
+        self._border.setColor(QtGui.QColor(128, 128, 128, 255))
+        self._canvas_color = QtGui.QColor(255, 255, 255, 255)
+        self.reference = None
 
         # cursor preview
-        pen = QtGui.QPen(QtGui.QColor(0, 0, 0, 255), .5,
-                         QtCore.Qt.SolidLine, QtCore.Qt.RoundCap,
-                         QtCore.Qt.RoundJoin)
+        pen = registry().pen(QtGui.QColor(0, 0, 0, 255), .5)
         brush = QtGui.QBrush(QtGui.QColor(0, 0, 0, 0), QtCore.Qt.SolidPattern)
         self._cursor_outline = self.addEllipse(-15, -15, 30, 30, pen, brush)
 
-        pen = QtGui.QPen(QtGui.QColor(255, 255, 255, 0), 1,
-                         QtCore.Qt.SolidLine, QtCore.Qt.RoundCap,
-                         QtCore.Qt.RoundJoin)
-        brush = QtGui.QBrush(QtGui.QColor(255, 0, 0, 255),
-                             QtCore.Qt.SolidPattern)
-        self._cursor_fill = self.addEllipse(-15, -15, 30, 30, pen, brush)
+        # fill is a shared pre-blurred sprite rather than a per scene
+        # ellipse with its own blur effect
+        self._cursor_fill = self.addPixmap(QtGui.QPixmap())
         self._cursor_fill.setOpacity(.5)
-
-        effect = QtGui.QGraphicsBlurEffect()
-        effect.setBlurRadius(self.pen_blur)
-        self._cursor_fill.setGraphicsEffect(effect)
+        self._cursor_fill.setTransformationMode(QtCore.Qt.SmoothTransformation)
         self._cursor_fill.setZValue(1000)
         self._cursor_outline.setZValue(1001)
+        self._update_cursor_sprite()
 
     @property
     def is_painting(self):
@@ -90,6 +150,53 @@ class PaintScene(QtGui.QGraphicsScene):
         if self._current_path is None:
             return self._current_path
 
+    @property
+    def undo_view(self):
+        """
+        history panel; currently hidden from users, created on first use
+
+        Returns:
+            HistoryView: view of undo_stack
+        """
+        if self._undo_view is None:
+            self._undo_view = HistoryView(self.undo_stack)
+            self._undo_view.setEmptyLabel(QtCore.QString('New'))
+            self._undo_view.jumpRequested.connect(self.jump_to_history)
+        return self._undo_view
+
+    def jump_to_history(self, index):
+        """
+        moves the undo stack to index, through the nearest history
+        checkpoint when available
+
+        Args:
+            index (int): undo stack index, 0 is the empty canvas
+        """
+        if self.history is not None:
+            self.history.jump(index)
+        else:
+            self.undo_stack.setIndex(index)
+
+    def release_caches(self):
+        """
+        drops caches that can be rebuilt on demand, used while the widget is
+        idle. Shared resources are left untouched.
+        """
+        if self._undo_view is not None and not self._undo_view.isVisible():
+            self._undo_view.setParent(None)
+            self._undo_view.deleteLater()
+            self._undo_view = None
+
+        for stroke in self._strokes.values():
+            item = stroke['stroke']
+            if isinstance(item, StrokeItem):
+                path_cache.discard(item.geometry)
+
+        if self.tile_cache is not None:
+            self.tile_cache.clear()
+        if self.reference is not None:
+            self.reference.clear()
+
     @property
     def strokes(self):
         """
@@ -100,16 +207,410 @@ class PaintScene(QtGui.QGraphicsScene):
         """
         return self._strokes
 
+    def enable_tracing(self, enabled=True, capacity=65536):
+        """
+        turns input-to-pixel pipeline tracing on or off
+
+        Args:
+            enabled (bool): record trace events
+            capacity (int): size of the trace ring buffer
+
+        Returns:
+            Tracer: active tracer, None when disabled
+        """
+        if enabled and self.tracer is None:
+            self.tracer = Tracer(capacity)
+            self.changed.connect(self._trace_changed)
+        elif not enabled and self.tracer is not None:
+            self.changed.disconnect(self._trace_changed)
+            self.tracer = None
+        return self.tracer
+
+    def set_tiled_rendering(self, enabled=True, threads=None):
+        """
+        turns threaded tile rasterization of committed strokes on or off
+
+        Args:
+            enabled (bool): rasterize strokes into cached tiles
+            threads (int, optional): worker count, defaults to core count
+
+        Returns:
+            TileCache: active tile cache, None when disabled
+        """
+        self._proxy_tiles = False
+        if enabled and self.tile_cache is None:
+            self.tile_cache = TileCache(self, threads)
+            if self.proxy_scale is not None:
+                self.tile_cache.set_scale(self.proxy_scale, proxy=True)
+        elif enabled:
+            self.tile_cache.set_threads(threads)
+        elif self.tile_cache is not None:
+            self.tile_cache.deleteLater()
+            self.tile_cache = None
+        self.update()
+        return self.tile_cache
+
+    def set_proxy_scale(self, scale=None, threads=None):
+        """
+        edits at reduced resolution. Committed strokes are displayed from
+        tiles rasterized at scale & the reference image is decoded at the
+        matching level. Stroke geometry stays in scene coordinates, renders
+        inside full_resolution ignore the proxy.
+
+        Args:
+            scale (float, optional): display pixels per scene pixel, None or
+                                     1.0 edits at full resolution
+            threads (int, optional): tile worker count, defaults to core
+                                     count
+
+        Returns:
+            float: active proxy scale, None when disabled
+        """
+        if scale is not None and not 0 < scale < 1:
+            scale = None
+        self.proxy_scale = scale
+        if scale is None:
+            if self._proxy_tiles:
+                # tiles were only enabled for the proxy
+                self.set_tiled_rendering(False)
+            elif self.tile_cache is not None:
+                self.tile_cache.set_scale(1.0)
+        else:
+            if self.tile_cache is None:
+                self.set_tiled_rendering(True, threads)
+                self._proxy_tiles = True
+            self.tile_cache.set_scale(scale, proxy=True)
+        self.update()
+        return self.proxy_scale
+
+    @contextmanager
+    def full_resolution(self, scale=1.0):
+        """
+        renders at scene resolution while active, ignoring proxy tiles &
+        reference levels, e.g. for get_img & exports. Soft strokes are
+        blurred for the render scale rather than the view zoom.
+
+        Args:
+            scale (float, optional): render pixels per scene pixel
+        """
+        proxy_scale = self.proxy_scale
+        tiles = self.tile_cache
+        proxy = tiles is not None and tiles.proxy
+        self.proxy_scale = None
+        if proxy:
+            tiles.proxy = False
+        swapped = self._scale_blur(self._soft_items(), scale)
+        try:
+            yield
+        finally:
+            self.proxy_scale = proxy_scale
+            if proxy:
+                tiles.proxy = True
+            self._scale_blur(swapped, self.blur_scale)
+
+    def _scale_blur(self, items, scale):
+        # rescales soft strokes, returns the items that changed. Changing
+        # the radius dirties items, publishers are told those repaints are
+        # not canvas changes
+        changed = []
+        for item in items:
+            effect = item.graphicsEffect()
+            if not isinstance(effect, StrokeBlurEffect):
+                continue
+            effect.blockSignals(True)
+            if effect.set_device_scale(scale):
+                changed.append(item)
+            effect.blockSignals(False)
+        if changed and self.frames is not None:
+            self.frames.ignore_changes([item.sceneBoundingRect()
+                                        for item in changed])
+        return changed
+
+    def set_blur_scale(self, scale):
+        """
+        blurs soft strokes for a view zoom, called by PaintView when zoom
+        changes
+
+        Args:
+            scale (float): device pixels per scene pixel
+        """
+        if scale <= 0 or scale == self.blur_scale:
+            return
+        self.blur_scale = scale
+        self._scale_blur(self._soft_items(), scale)
+
+    def _soft_items(self):
+        # items drawn with a blur effect, committed strokes & previews
+        return list(self._soft) + [item for item in self.overlay_items()
+                                   if item.graphicsEffect() is not None]
+
+    def start_mirror(self, name):
+        """
+        publishes edits to local subscribers, see mirror.py
+
+        Args:
+            name (str): local server name
+
+        Returns:
+            StreamPublisher: active publisher
+        """
+        from mirror import StreamPublisher
+        self.stop_mirror()
+        self.mirror = StreamPublisher(self, name)
+        return self.mirror
+
+    def stop_mirror(self):
+        """
+        stops publishing edits
+        """
+        if self.mirror is not None:
+            self.mirror.close()
+            self.mirror.deleteLater()
+            self.mirror = None
+
+    def start_frame_publishing(self, name, fps=60, slots=3):
+        """
+        publishes composited frames to shared memory, see framebuffer.py
+
+        Args:
+            name (str): shared memory key
+            fps (int, optional): maximum frames per second
+            slots (int, optional): frame slots
+
+        Returns:
+            FramePublisher: active publisher
+        """
+        from framebuffer import FramePublisher
+        self.stop_frame_publishing()
+        self.frames = FramePublisher(self, name, fps, slots)
+        return self.frames
+
+    def stop_frame_publishing(self):
+        """
+        stops publishing frames & releases the shared memory
+        """
+        if self.frames is not None:
+            self.frames.close()
+            self.frames.deleteLater()
+            self.frames = None
+
+    def set_reference_image(self, filepath, opacity=1.0):
+        """
+        loads a reference plate under the strokes, placed at the canvas
+        origin at full resolution
+
+        Args:
+            filepath (str): image path, None removes the reference
+            opacity (float, optional): draw opacity
+
+        Returns:
+            ReferenceImage: loaded reference, None when removed
+        """
+        self.reference = None
+        if filepath:
+            self.reference = ReferenceImage(filepath, opacity=opacity)
+        self.update()
+        return self.reference
+
+    def _invalidate_tiles(self, item):
+        if (self.tile_cache is None or
+                not isinstance(item, (StrokeItem, RasterItem))):
+            return
+        rect = item.sceneBoundingRect()
+        effect = item.graphicsEffect()
+        if effect is not None:
+            pad = effect.blurRadius()
+            rect.adjust(-pad, -pad, pad, pad)
+        self.tile_cache.invalidate(rect)
+
+    def addItem(self, item):
+        super(PaintScene, self).addItem(item)
+        effect = item.graphicsEffect()
+        if isinstance(effect, StrokeBlurEffect) and effect.blurRadius() > 0:
+            effect.set_device_scale(self.blur_scale)
+            self._soft.add(item)
+        self._invalidate_tiles(item)
+        if self.mirror is not None:
+            self.mirror.item_added(item)
+
+    def removeItem(self, item):
+        self._soft.discard(item)
+        self._invalidate_tiles(item)
+        if self.mirror is not None:
+            self.mirror.item_removed(item)
+        super(PaintScene, self).removeItem(item)
+
+    def drawBackground(self, painter, rect):
+        """
+        draws canvas, reference image & finished stroke tiles
+        """
+        canvas = QtCore.QRectF(0, 0, self.width, self.height)
+        painter.fillRect(canvas.intersected(rect), self._canvas_color)
+        painter.setPen(self._border)
+        painter.setBrush(QtCore.Qt.NoBrush)
+        painter.drawRect(canvas)
+
+        lod = QtGui.QStyleOptionGraphicsItem.levelOfDetailFromTransform(
+            painter.worldTransform())
+        if self.reference is not None:
+            level_lod = lod
+            if self.proxy_scale is not None:
+                level_lod = min(lod, self.proxy_scale)
+            self.reference.draw(painter, rect.intersected(canvas), level_lod)
+
+        tiles = self.tile_cache
+        if tiles is not None and tiles.usable(lod):
+            tiles.draw(painter, rect)
+
+    def render_image(self, rect=None, scale=1.0,
+                     image_format=QtGui.QImage.Format_RGB32):
+        """
+        renders part of the canvas at full resolution, only items
+        intersecting rect are drawn
+
+        Args:
+            rect (QRectF, optional): scene rect, defaults to whole canvas
+            scale (float, optional): image pixels per scene pixel
+            image_format (QImage.Format, optional): image format
+
+        Returns:
+            QImage: rendered pixels
+        """
+        if rect is None:
+            rect = QtCore.QRectF(0, 0, self.width, self.height)
+        rect = QtCore.QRectF(rect)
+        img = QtGui.QImage(max(1, int(math.ceil(rect.width() * scale))),
+                           max(1, int(math.ceil(rect.height() * scale))),
+                           image_format)
+        return self.render_into(img, rect)
+
+    def render_into(self, img, rect=None):
+        """
+        renders part of the canvas at full resolution into an existing
+        image, scaled to fill it. See buffers.render_to_array.
+
+        Args:
+            img (QImage): render target, cleared first
+            rect (QRectF, optional): scene rect, defaults to whole canvas
+
+        Returns:
+            QImage: img
+        """
+        if rect is None:
+            rect = QtCore.QRectF(0, 0, self.width, self.height)
+        img.fill(0)
+        painter = QtGui.QPainter(img)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        with self.full_resolution(img.width() / max(rect.width(), 1e-6)):
+            self.render(painter, QtCore.QRectF(img.rect()),
+                        QtCore.QRectF(rect))
+        painter.end()
+        return img
+
+    def sample_color(self, position, radius=0):
+        """
+        average composited color around a point, read from a finished tile
+        when the tile cache holds one, otherwise rendered. Cursor & stroke
+        previews are left out.
+
+        Args:
+            position (QPointF): scene position
+            radius (int, optional): sampling radius in scene pixels
+
+        Returns:
+            QColor: opaque average color
+        """
+        radius = max(0, int(radius))
+        rect = QtCore.QRectF(int(position.x()) - radius,
+                             int(position.y()) - radius,
+                             radius * 2 + 1, radius * 2 + 1)
+        tile = None
+        if self.tile_cache is not None and self.reference is None:
+            tile = self.tile_cache.ready_tile(rect)
+
+        if tile is not None:
+            tile_rect, img = tile
+            scale = self.tile_cache.scale
+            left = (rect.x() - tile_rect.x()) * scale
+            top = (rect.y() - tile_rect.y()) * scale
+            size = max(1, int(round(rect.width() * scale)))
+            canvas = self._canvas_color
+        else:
+            with self.overlays_hidden():
+                img = self.render_image(rect)
+            left = top = 0
+            size = img.width()
+            canvas = None
+
+        centre = (size - 1) / 2.0
+        limit = (centre + .5) ** 2
+        totals = [0, 0, 0]
+        count = 0
+        for y in range(size):
+            for x in range(size):
+                if (x - centre) ** 2 + (y - centre) ** 2 > limit:
+                    continue
+                pixel = img.pixel(min(img.width() - 1, int(left) + x),
+                                  min(img.height() - 1, int(top) + y))
+                color = QtGui.QColor.fromRgba(pixel)
+                rgb = [color.red(), color.green(), color.blue()]
+                if canvas is not None:
+                    # premultiplied tile pixel over the canvas
+                    rest = (255 - color.alpha()) / 255.0
+                    rgb = [rgb[0] + canvas.red() * rest,
+                           rgb[1] + canvas.green() * rest,
+                           rgb[2] + canvas.blue() * rest]
+                for i in range(3):
+                    totals[i] += rgb[i]
+                count += 1
+        count = max(1, count)
+        return QtGui.QColor(*[min(255, int(round(total / count)))
+                              for total in totals])
+
+    def _trace_changed(self, region):
+        if self.tracer is not None:
+            self.tracer.instant('PaintScene.changed',
+                                {'rects': len(region)})
+
     def push_stroke(self, stroke):
         """
         creates AddStroke object & adds it to history
 
         Args:
-            stroke (QPath): path of stroke, also contains pen/color information
+            stroke (StrokeItem): stroke item, also contains pen/color
+                                 information
         """
         command = AddStroke(self, stroke)
         self.undo_stack.push(command)
 
+    def add_strokes(self, points, color=None, size=None, blur=None):
+        """
+        adds many strokes as a single undo entry, e.g. for generated
+        annotations. Layers are created in one pass.
+
+        Args:
+            points (list): (n, 2) numpy arrays or sequences of (x, y) pairs,
+                           one per stroke
+            color (QColor, optional): stroke color, defaults to pen_color
+            size (float, optional): brush diameter, defaults to pen_size
+            blur (int, optional): brush softness, defaults to pen_blur
+
+        Returns:
+            list: indices of new strokes
+        """
+        color = self.pen_color if color is None else color
+        size = self.pen_size if size is None else size
+        blur = self.pen_blur if blur is None else blur
+
+        with span(self.tracer, 'PaintScene.add_strokes'):
+            strokes = [make_stroke(stroke, color, size, blur)
+                       for stroke in points if len(stroke)]
+            if not strokes:
+                return []
+            command = AddStrokes(self, strokes)
+            self.undo_stack.push(command)
+        return command.stroke_ids
+
     def removeStroke(self, stroke_id):
         """
         removes stroke from paint scene
@@ -123,6 +624,27 @@ class PaintScene(QtGui.QGraphicsScene):
         except KeyError:
             pass
 
+    def set_symmetry(self, mode=None, count=2, center=None):
+        """
+        paints mirrored or rotated copies of every stroke. Copies share the
+        stroke's geometry & only differ by transform, so an N way stroke
+        costs about the same to commit as one.
+
+        Args:
+            mode (str, optional): 'vertical', 'horizontal' or 'radial', None
+                                  turns symmetry off
+            count (int, optional): copies for radial symmetry, original
+                                   included
+            center (QPointF, optional): axis or rotation center, defaults to
+                                        canvas center
+        """
+        if mode is None:
+            self.symmetry = []
+            return
+        if center is None:
+            center = QtCore.QPointF(self.width / 2.0, self.height / 2.0)
+        self.symmetry = symmetry_transforms(mode, center, count)
+
     def start_paintstroke(self, position, layer=None):
         """
         creates new QPath with appropriate brush settings
@@ -139,30 +661,36 @@ class PaintScene(QtGui.QGraphicsScene):
                 self.complete_paintstroke()
 
         self._current_path = QtGui.QGraphicsPathItem(QtGui.QPainterPath())
-        pen = QtGui.QPen(self.pen_color, self.pen_size, QtCore.Qt.SolidLine,
-                         QtCore.Qt.RoundCap, QtCore.Qt.RoundJoin)
+        pen = registry().pen(self.pen_color, self.pen_size)
         self._current_path.setPen(pen)
         path = QtGui.QPainterPath(position)
         self._current_path.setPath(path)
 
         # brush hardness
-        effect = QtGui.QGraphicsBlurEffect()
-        effect.setBlurRadius(self.pen_blur)
-        self._current_path.setGraphicsEffect(effect)
+        self._current_path.setGraphicsEffect(
+            StrokeBlurEffect(self.pen_blur, scale=self.blur_scale))
 
         # draw preview
         # preview is temp version of stroke to display while drawing
         # preview is deleted when stroke is finalized
-        pen = QtGui.QPen(self.pen_color, self.pen_size,
-                         QtCore.Qt.SolidLine, QtCore.Qt.RoundCap,
-                         QtCore.Qt.RoundJoin)
         self._path_preview = self.addPath(QtGui.QPainterPath(), pen)
         self._path_preview.setPath(path)
-        preview_effect = QtGui.QGraphicsBlurEffect()
-        preview_effect.setBlurRadius(self.pen_blur)
-        self._path_preview.setGraphicsEffect(preview_effect)
+        self._path_preview.setGraphicsEffect(
+            StrokeBlurEffect(self.pen_blur, scale=self.blur_scale))
         self._path_preview.setZValue(self.next_stroke + 1)
 
+        # symmetry copies draw the same path through their transform
+        for transform in self.symmetry:
+            preview = self.addPath(path, pen)
+            preview.setTransform(transform)
+            preview.setGraphicsEffect(
+                StrokeBlurEffect(self.pen_blur, scale=self.blur_scale))
+            preview.setZValue(self.next_stroke + 1)
+            self._symmetry_previews.append(preview)
+
+        if self.mirror is not None:
+            self.mirror.begin_stroke(position, pen, self.pen_blur)
+
     def update_paintstroke(self, position):
         """
         Update stroke on mouse move
@@ -170,13 +698,41 @@ class PaintScene(QtGui.QGraphicsScene):
         Args:
             position (QPoint): new position of mouse, draw to this point
         """
-        try:
-            path = self._current_path.path()
-            path.lineTo(position)
-            self._current_path.setPath(path)
-            self._path_preview.setPath(path)
-        except AttributeError:
-            pass
+        metrics = self.metrics
+        if metrics is not None:
+            metrics.moves_received += 1
+        with span(self.tracer, 'PaintScene.update_paintstroke'):
+            try:
+                path = self._current_path.path()
+                # coalesce moves that would not change the stroke
+                previous = path.currentPosition()
+                if previous == position:
+                    return
+                path.lineTo(position)
+                self._current_path.setPath(path)
+                self._path_preview.setPath(path)
+                for preview in self._symmetry_previews:
+                    preview.setPath(path)
+            except AttributeError:
+                return
+        if self.frames is not None:
+            self._publish_segment(previous, position)
+        if metrics is not None:
+            metrics.moves_applied += 1
+        if self.mirror is not None:
+            self.mirror.stroke_point(position)
+
+    def _publish_segment(self, start, end):
+        # frames only need the new segment, not the whole live stroke
+        pad = self.pen_size / 2.0 + self.pen_blur * 2.5 + 2
+        segment = QtCore.QRectF(start, end).normalized().adjusted(
+            -pad, -pad, pad, pad)
+        items = [self._current_path, self._path_preview]
+        items += self._symmetry_previews
+        self.frames.stroke_moved(
+            [segment] + [preview.transform().mapRect(segment)
+                         for preview in self._symmetry_previews],
+            [item.sceneBoundingRect() for item in items])
 
     def complete_paintstroke(self, position=None):
         """
@@ -186,18 +742,37 @@ class PaintScene(QtGui.QGraphicsScene):
         Args:
             position (None, optional): End position
         """
+        if self._current_path is None:
+            return
+
         if position:
             position.setX(position.x() + .0001)
             self.update_paintstroke(position)
 
-        # add stroke
-        stroke = self._current_path
-        self.push_stroke(stroke)
+        # add stroke, committed strokes keep compressed geometry & rebuild
+        # their path only when drawn
+        live = self._current_path
+        stroke = StrokeItem(StrokeGeometry.from_path(live.path()), live.pen())
+        stroke.setGraphicsEffect(live.graphicsEffect())
+        # outline & bounds are asked for by indexing & every hit test
+        stroke.precompute_outline()
+        if self.mirror is not None:
+            self.mirror.end_stroke(stroke)
+        if self.symmetry:
+            strokes = [stroke] + [duplicate_stroke(stroke, transform)
+                                  for transform in self.symmetry]
+            self.undo_stack.push(AddStrokes(self, strokes,
+                                            'Symmetry Stroke'))
+        else:
+            self.push_stroke(stroke)
 
         # delete preview stroke
         self._current_path = None
         self.removeItem(self._path_preview)
         self._path_preview = None
+        for preview in self._symmetry_previews:
+            self.removeItem(preview)
+        self._symmetry_previews = []
 
     def toggle_layer_visibility(self, stroke_id, toggle):
         """
@@ -206,7 +781,33 @@ class PaintScene(QtGui.QGraphicsScene):
             stroke_id (int): index of stroke
             toggle (bool): visibility toggle
         """
-        self.strokes[stroke_id]['stroke'].setVisible(toggle)
+        item = self.strokes[stroke_id]['stroke']
+        if item.isVisible() != toggle:
+            item.setVisible(toggle)
+            self._invalidate_tiles(item)
+            if self.mirror is not None:
+                self.mirror.visibility_changed(item)
+
+    def set_stroke_geometry(self, stroke_id, geometry):
+        """
+        replaces a stroke's points as an undoable edit. Duplicates sharing
+        its old geometry keep it, see StrokeItem.set_geometry
+
+        Args:
+            stroke_id (int): stroke index
+            geometry (StrokeGeometry): new stroke points
+        """
+        self.undo_stack.push(SetStrokeGeometry(self, stroke_id, geometry))
+
+    def _apply_stroke_geometry(self, stroke_id, geometry):
+        item = self.strokes[stroke_id]['stroke']
+        self._invalidate_tiles(item)
+        item.set_geometry(geometry)
+        self._invalidate_tiles(item)
+        if self.mirror is not None and item.scene() is self:
+            # subscribers replace the stroke with the same index
+            self.mirror.item_added(item)
+        self.strokeChanged.emit(stroke_id)
 
     def update_layer_name(self, stroke_id, name):
         """
@@ -226,7 +827,73 @@ class PaintScene(QtGui.QGraphicsScene):
             stroke_id (int): stroke index
             index (int): stacking position
         """
-        self.strokes[stroke_id]['stroke'].setZValue(index)
+        item = self.strokes[stroke_id]['stroke']
+        if item.zValue() != index:
+            item.setZValue(index)
+            self._invalidate_tiles(item)
+            if self.mirror is not None:
+                self.mirror.z_changed(item)
+
+    def overlay_items(self):
+        """
+        items that are not part of the painting: cursor preview & the stroke
+        being drawn
+
+        Returns:
+            list: overlay items
+        """
+        return [item for item in [self._cursor_outline, self._cursor_fill,
+                                  self._current_path, self._path_preview] +
+                self._symmetry_previews if item is not None]
+
+    @contextmanager
+    def overlays_hidden(self):
+        """
+        hides cursor & stroke preview while rendering the canvas for output
+        """
+        overlays = [item for item in self.overlay_items()
+                    if item.scene() is self and item.isVisible()]
+        for item in overlays:
+            item.setVisible(False)
+        try:
+            yield
+        finally:
+            for item in overlays:
+                item.setVisible(True)
+
+    @contextmanager
+    def cursor_excluded(self):
+        """
+        leaves the brush cursor out of render calls while active. Unlike
+        overlays_hidden the cursor stays visible, so no repaint is scheduled
+        """
+        self._render_excluded = (self._cursor_outline, self._cursor_fill)
+        try:
+            yield
+        finally:
+            self._render_excluded = ()
+
+    def drawItems(self, painter, items, options, widget=None):
+        """
+        draws items for render, skipping any excluded by cursor_excluded
+        """
+        if self._render_excluded:
+            kept = [(item, option) for item, option in zip(items, options)
+                    if not any(item is excluded
+                               for excluded in self._render_excluded)]
+            items = [item for item, option in kept]
+            options = [option for item, option in kept]
+        super(PaintScene, self).drawItems(painter, items, options, widget)
+
+    def set_cursor_visible(self, visible):
+        """
+        shows or hides the brush cursor preview, e.g. for read-only mirrors
+
+        Args:
+            visible (bool): cursor visibility
+        """
+        self._cursor_outline.setVisible(visible)
+        self._cursor_fill.setVisible(visible)
 
     def move_cursor_preview(self, position):
         """
@@ -235,8 +902,22 @@ class PaintScene(QtGui.QGraphicsScene):
         Args:
             position (QPoint): position of cursor
         """
+        cursor = (self._cursor_outline, self._cursor_fill)
+        if self.frames is not None:
+            moved = [item.sceneBoundingRect() for item in cursor]
         self._cursor_outline.setPos(position)
         self._cursor_fill.setPos(position)
+        if self.frames is not None:
+            # hovering is not a canvas change, see FramePublisher
+            self.frames.ignore_changes(
+                moved + [item.sceneBoundingRect() for item in cursor])
+
+    def _update_cursor_sprite(self):
+        sprite = registry().cursor_sprite(self.pen_size, self.pen_blur,
+                                          self.pen_color)
+        self._cursor_fill.setPixmap(sprite)
+        self._cursor_fill.setOffset(-sprite.width() / 2.0,
+                                    -sprite.height() / 2.0)
 
     def set_pen_size(self, size):
         """
@@ -247,7 +928,7 @@ class PaintScene(QtGui.QGraphicsScene):
         """
         self.pen_size = size
         self._cursor_outline.setRect(-size/2, -size/2, size, size)
-        self._cursor_fill.setRect(-size/2, -size/2, size, size)
+        self._update_cursor_sprite()
 
     def increment_pen_size(self, inc):
         """
@@ -270,7 +951,7 @@ class PaintScene(QtGui.QGraphicsScene):
 
         """
         self.pen_blur = blur
-        self._cursor_fill.graphicsEffect().setBlurRadius(blur)
+        self._update_cursor_sprite()
 
     def increment_pen_blur(self, inc):
         """
@@ -293,13 +974,29 @@ class PaintScene(QtGui.QGraphicsScene):
 
         """
         self.pen_color = color
-        self._cursor_fill.setBrush(QtGui.QBrush(color, QtCore.Qt.SolidPattern))
+        self._update_cursor_sprite()
 
 
 class PaintView(QtGui.QGraphicsView):
     """
     Display/input for Paint Scene
+
+    Attributes:
+        colorSampled (SIGNAL): emitted with the color under the cursor while
+                               dragging in eyedropper mode
+        eyedropper (bool): left button samples colors instead of painting
+        max_zoom (float): largest zoom factor, 1.0 is one screen pixel per
+                          canvas pixel
+        metrics (FrameMetrics): frame instrumentation, None when disabled
+        quality (AdaptiveQuality): render quality policy, None when render
+                                   hints are fixed
+        recorder (InputRecorder): input recorder, None when not recording
+        sample_radius (int): eyedropper radius in scene pixels
+        zoomChanged (SIGNAL): emitted with new zoom factor
     """
+    zoomChanged = QtCore.pyqtSignal(float)
+    colorSampled = QtCore.pyqtSignal(QtGui.QColor)
+
     def __init__(self, *args, **kwargs):
         super(PaintView, self).__init__(*args, **kwargs)
         self.setMouseTracking(True)
@@ -307,8 +1004,33 @@ class PaintView(QtGui.QGraphicsView):
         self.setBackgroundBrush(
             QtGui.QBrush(QtGui.QColor(128, 128, 128, 128),
                          QtCore.Qt.SolidPattern))
+        self.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
+        self.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
+        # set_zoom keeps its own anchor point fixed
+        self.setTransformationAnchor(QtGui.QGraphicsView.NoAnchor)
         self._current_layer = None
 
+        # navigation, canvas is refit on resize until user zooms
+        self.max_zoom = 32.0
+        self._fit = True
+        self._pan_origin = None
+
+        # color picking, see set_eyedropper
+        self.eyedropper = False
+        self.sample_radius = 1
+
+        # instrumentation
+        self.metrics = None
+        self.recorder = None
+        self._hud = False
+        self._hud_timer = None
+
+        # render quality, see set_adaptive_quality
+        self.quality = None
+
+        # soft strokes are blurred for the current zoom
+        self.zoomChanged.connect(self._zoom_changed)
+
     @property
     def current_layer(self):
         """
@@ -323,50 +1045,366 @@ class PaintView(QtGui.QGraphicsView):
     def current_layer(self, value):
         self._current_layer = value
 
-    def mousePressEvent(self, event):
+    def enable_metrics(self, enabled=True, hud=False, window=120):
         """
-        Starts paint stroke on user's initial click
+        turns frame timing & hot path instrumentation on or off
+
+        Args:
+            enabled (bool): record metrics
+            hud (bool): draw metrics on top of the canvas
+            window (int): number of samples kept for rolling statistics
         """
-        if event.button() == QtCore.Qt.LeftButton:
-            scene_pos = self.mapToScene(event.pos())
-            # self.scene().start_paintstroke(scene_pos)
-            self.scene().start_paintstroke(scene_pos, layer=self.current_layer)
-        super(PaintView, self).mousePressEvent(event)
+        if enabled:
+            if self.metrics is None:
+                self.metrics = FrameMetrics(window)
+        else:
+            self.metrics = None
+            hud = False
+        if self.scene():
+            self.scene().metrics = self.metrics
+
+        self._hud = hud
+        if hud and self._hud_timer is None:
+            # hud is redrawn on a timer so it doesn't drive its own repaints
+            self._hud_timer = QtCore.QTimer(self)
+            self._hud_timer.timeout.connect(self._update_hud)
+            self._hud_timer.start(250)
+        elif not hud and self._hud_timer is not None:
+            self._hud_timer.stop()
+            self._hud_timer = None
+        self.viewport().update()
+
+    def set_adaptive_quality(self, enabled=True, idle_ms=IDLE_MS,
+                             min_strokes=MIN_STROKES,
+                             interactive_hints=None):
+        """
+        lowers render quality while the user interacts & refines once input
+        is idle, see AdaptiveQuality. The current render hints are used as
+        full quality.
+
+        Args:
+            enabled (bool, optional): use adaptive quality
+            idle_ms (int, optional): ms without interaction before refining
+            min_strokes (int, optional): documents with fewer strokes are
+                                         always drawn at full quality
+            interactive_hints (QPainter.RenderHints, optional): hints while
+                                                                interacting
+
+        Returns:
+            AdaptiveQuality: active policy, None when disabled
+        """
+        if self.quality is not None:
+            self.quality.close()
+            self.quality.deleteLater()
+            self.quality = None
+        if enabled:
+            self.quality = AdaptiveQuality(self, idle_ms, min_strokes,
+                                           interactive_hints)
+        return self.quality
+
+    def _interacting(self):
+        if self.quality is not None:
+            self.quality.interact()
+
+    def frame_stats(self):
+        """
+        rolling statistics recorded since metrics were enabled
+
+        Returns:
+            dict: metric name to value/summary, empty if metrics disabled
+        """
+        if self.metrics is None:
+            return {}
+        stats = self.metrics.stats()
+        stats['undo_stack_size'] = (self.scene().undo_stack.count()
+                                    if self.scene() else 0)
+        if self.quality is not None:
+            stats['quality'] = self.quality.stats()
+        return stats
+
+    def _hud_rect(self):
+        return QtCore.QRect(8, 8, 300, 16 * 6 + 8)
+
+    def _update_hud(self):
+        self.viewport().update(self._hud_rect())
+
+    def _tracer(self):
+        scene = self.scene()
+        return scene.tracer if scene is not None else None
+
+    def paintEvent(self, event):
+        """
+        times frame painting when metrics, tracing or adaptive quality are
+        enabled
+        """
+        metrics = self.metrics
+        tracer = self._tracer()
+        quality = self.quality
+        if metrics is None and tracer is None and quality is None:
+            return super(PaintView, self).paintEvent(event)
+
+        start = time.time()
+        with span(tracer, 'PaintView.paintEvent'):
+            super(PaintView, self).paintEvent(event)
+        elapsed = (time.time() - start) * 1000.0
+        if quality is not None:
+            quality.record_frame(elapsed)
+        if metrics is None:
+            return
+        metrics.paint_time.add(elapsed)
+
+        exposed = self.mapToScene(event.rect()).boundingRect()
+        items = self.scene().items(exposed,
+                                   QtCore.Qt.IntersectsItemBoundingRect)
+        metrics.items_drawn.add(len([i for i in items if i.isVisible()]))
+
+    def drawBackground(self, painter, rect):
+        """
+        fills view background, then lets the scene draw the canvas
+        """
+        super(PaintView, self).drawBackground(painter, rect)
+        if self.scene() is not None:
+            self.scene().drawBackground(painter, rect)
+
+    def drawForeground(self, painter, rect):
+        """
+        draws metrics hud in viewport coordinates
+        """
+        super(PaintView, self).drawForeground(painter, rect)
+        if not self._hud or self.metrics is None:
+            return
+
+        hud_rect = self._hud_rect()
+        painter.save()
+        painter.resetTransform()
+        painter.fillRect(hud_rect, QtGui.QColor(0, 0, 0, 160))
+        painter.setPen(QtGui.QColor(255, 255, 255, 230))
+        lines = self.metrics.hud_lines(self.frame_stats())
+        for i, line in enumerate(lines):
+            painter.drawText(hud_rect.x() + 6, hud_rect.y() + 18 + i * 16,
+                             line)
+        painter.restore()
+
+    @property
+    def zoom(self):
+        """
+        current zoom factor, screen pixels per canvas pixel
+
+        Returns:
+            float: zoom
+        """
+        return self.transform().m11()
+
+    def _zoom_changed(self, zoom):
+        if self.scene() is not None:
+            self.scene().set_blur_scale(zoom)
+
+    def _fit_zoom(self):
+        canvas = QtCore.QRectF(0, 0, self.scene().width, self.scene().height)
+        viewport = self.viewport().rect()
+        if canvas.isEmpty() or viewport.isEmpty():
+            return 1.0
+        return min(viewport.width() / canvas.width(),
+                   viewport.height() / canvas.height())
+
+    def fit_canvas(self):
+        """
+        scales view so whole canvas is visible & keeps it fitted on resize
+        """
+        self._fit = True
+        self.fitInView(0, 0, self.scene().width, self.scene().height,
+                       QtCore.Qt.KeepAspectRatio)
+        self.zoomChanged.emit(self.zoom)
+
+    def set_zoom(self, zoom, anchor=None):
+        """
+        sets zoom factor, keeping anchor point fixed on screen
+
+        Args:
+            zoom (float): screen pixels per canvas pixel, clamped between a
+                          quarter of the fitted zoom & max_zoom
+            anchor (QPoint, optional): viewport position to zoom around,
+                                       defaults to viewport center
+        """
+        zoom = max(self._fit_zoom() * .25, min(zoom, self.max_zoom))
+        self._interacting()
+        if anchor is None:
+            anchor = self.viewport().rect().center()
+        scene_anchor = self.mapToScene(anchor)
+
+        self._fit = False
+        self.setTransform(QtGui.QTransform.fromScale(zoom, zoom))
+        # keep point under anchor in place
+        delta = self.mapFromScene(scene_anchor) - anchor
+        self.horizontalScrollBar().setValue(
+            self.horizontalScrollBar().value() + delta.x())
+        self.verticalScrollBar().setValue(
+            self.verticalScrollBar().value() + delta.y())
+        self.zoomChanged.emit(self.zoom)
+
+    def zoom_by(self, factor, anchor=None):
+        """
+        multiplies zoom factor
+
+        Args:
+            factor (float): zoom multiplier
+            anchor (QPoint, optional): viewport position to zoom around
+        """
+        self.set_zoom(self.zoom * factor, anchor)
+
+    def pan_by(self, dx, dy):
+        """
+        scrolls view
+
+        Args:
+            dx (int): horizontal screen pixels
+            dy (int): vertical screen pixels
+        """
+        self._interacting()
+        self.horizontalScrollBar().setValue(
+            self.horizontalScrollBar().value() + dx)
+        self.verticalScrollBar().setValue(
+            self.verticalScrollBar().value() + dy)
+
+    def set_eyedropper(self, enabled):
+        """
+        switches left button between painting & sampling colors
+
+        Args:
+            enabled (bool): sample colors
+        """
+        self.eyedropper = enabled
+        if enabled:
+            self.viewport().setCursor(QtCore.Qt.CrossCursor)
+        else:
+            self.viewport().unsetCursor()
+        if self.scene() is not None:
+            self.scene().set_cursor_visible(not enabled)
+
+    def _sample(self, position):
+        color = self.scene().sample_color(self.mapToScene(position),
+                                          self.sample_radius)
+        self.colorSampled.emit(color)
+
+    def mousePressEvent(self, event):
+        """
+        Starts paint stroke on user's initial click, pans on middle click
+        """
+        if self.metrics is not None:
+            self.metrics.record_input()
+        if event.button() == QtCore.Qt.MidButton:
+            self._pan_origin = event.pos()
+            self.viewport().setCursor(QtCore.Qt.ClosedHandCursor)
+            return
+        if self.eyedropper:
+            if event.button() == QtCore.Qt.LeftButton:
+                self._sample(event.pos())
+            return
+        with span(self._tracer(), 'PaintView.mousePressEvent'):
+            if event.button() == QtCore.Qt.LeftButton:
+                scene_pos = self.mapToScene(event.pos())
+                if self.recorder is not None:
+                    scene = self.scene()
+                    self.recorder.brush(scene.pen_size, scene.pen_blur,
+                                        scene.pen_color)
+                    self.recorder.mouse(recording.PRESS, scene_pos)
+                # self.scene().start_paintstroke(scene_pos)
+                self._interacting()
+                self.scene().start_paintstroke(scene_pos,
+                                               layer=self.current_layer)
+            super(PaintView, self).mousePressEvent(event)
 
     def mouseMoveEvent(self, event):
         """
         updates cursor preview, updates stroke if drawing
         """
-        # use event modifiers (?)
-        scene_pos = self.mapToScene(event.pos())
-        if event.buttons() & QtCore.Qt.LeftButton:
-            self.scene().update_paintstroke(scene_pos)
-        self.scene().move_cursor_preview(scene_pos)
+        if self.metrics is not None:
+            self.metrics.record_input()
+        if self._pan_origin is not None:
+            delta = self._pan_origin - event.pos()
+            self._pan_origin = event.pos()
+            self.pan_by(delta.x(), delta.y())
+            return
+        if self.eyedropper:
+            if event.buttons() & QtCore.Qt.LeftButton:
+                self._sample(event.pos())
+            return
+        with span(self._tracer(), 'PaintView.mouseMoveEvent'):
+            # use event modifiers (?)
+            scene_pos = self.mapToScene(event.pos())
+            drawing = event.buttons() & QtCore.Qt.LeftButton
+            if self.recorder is not None:
+                self.recorder.mouse(recording.DRAG if drawing
+                                    else recording.HOVER, scene_pos)
+            if drawing:
+                self._interacting()
+                self.scene().update_paintstroke(scene_pos)
+            self.scene().move_cursor_preview(scene_pos)
 
     def mouseReleaseEvent(self, event):
         """
         comeplete paint stroke on mouse release
         """
-        if event.button() == QtCore.Qt.LeftButton:
-            scene_pos = self.mapToScene(event.pos())
-            self.scene().complete_paintstroke(scene_pos)
+        if self.metrics is not None:
+            self.metrics.record_input()
+        if event.button() == QtCore.Qt.MidButton:
+            self._pan_origin = None
+            if self.eyedropper:
+                self.viewport().setCursor(QtCore.Qt.CrossCursor)
+            else:
+                self.viewport().unsetCursor()
+            return
+        if self.eyedropper:
+            return
+        with span(self._tracer(), 'PaintView.mouseReleaseEvent'):
+            if event.button() == QtCore.Qt.LeftButton:
+                scene_pos = self.mapToScene(event.pos())
+                if self.recorder is not None:
+                    self.recorder.mouse(recording.RELEASE, scene_pos)
+                self.scene().complete_paintstroke(scene_pos)
 
     def wheelEvent(self, event):
         """
-        change brush properties based off of keypress & user scroll
+        change brush properties based off of keypress & user scroll,
+        zooms around cursor when no modifier is held
+        """
+        if self.metrics is not None:
+            self.metrics.record_input()
+        if not event.modifiers() & (QtCore.Qt.ControlModifier |
+                                    QtCore.Qt.ShiftModifier):
+            if event.delta():
+                self.zoom_by(1.25 if event.delta() > 0 else 0.8, event.pos())
+            return
+        if self.recorder is not None:
+            self.recorder.wheel(event.delta(), event.modifiers())
+        self.apply_wheel(event.delta(), event.modifiers())
+
+    def apply_wheel(self, delta, modifiers):
+        """
+        change brush properties from wheel delta & modifiers, shared by
+        wheelEvent & input replay
+
+        Args:
+            delta (int): wheel delta
+            modifiers (Qt.KeyboardModifiers): keyboard modifiers
         """
-        if event.modifiers() & QtCore.Qt.ControlModifier:
-            self.scene().increment_pen_blur(event.delta()/abs(event.delta()))
-        elif event.modifiers() & QtCore.Qt.ShiftModifier:
-            self.scene().increment_pen_size(
-                event.delta() / abs(event.delta()) * 2)
+        if not delta:
+            return
+        self._interacting()
+        if modifiers & QtCore.Qt.ControlModifier:
+            self.scene().increment_pen_blur(delta/abs(delta))
+        elif modifiers & QtCore.Qt.ShiftModifier:
+            self.scene().increment_pen_size(delta / abs(delta) * 2)
 
     def resizeEvent(self, event):
         """
-        scale paint viewer so canvas is in view, maintain aspect ratip
+        scale paint viewer so canvas is in view, maintain aspect ratip.
+        Once the user has zoomed the current zoom is kept instead.
         """
-        self.fitInView(0, 0, self.scene().width, self.scene().height,
-                       QtCore.Qt.KeepAspectRatio)
+        self._interacting()
+        super(PaintView, self).resizeEvent(event)
+        if self._fit:
+            self.fit_canvas()
 
 
 class AddStroke(QtGui.QUndoCommand):
@@ -377,7 +1415,7 @@ class AddStroke(QtGui.QUndoCommand):
         """
         Args:
             parent (QGraphicsScene): paint_scene stroke belongs to
-            stroke (QPath): Stroke information
+            stroke (StrokeItem): Stroke information
         """
         super(AddStroke, self).__init__()
         self._stroke_path = stroke
@@ -399,19 +1437,124 @@ class AddStroke(QtGui.QUndoCommand):
         """
         Adds stroke to scene
         """
-        self._parent.addItem(self._stroke_path)
-        self._parent.strokes[self._stroke_id] = self._stroke_properties
-        temp_name = self._parent.strokes[self._stroke_id]['name']
-        self._parent.strokeAdded.emit(self._stroke_id, temp_name)
+        if self._parent.restoring:
+            return
+        tracer = self._parent.tracer
+        with span(tracer, 'AddStroke.redo', {'stroke': self._stroke_id}):
+            self._parent.addItem(self._stroke_path)
+            self._parent.strokes[self._stroke_id] = self._stroke_properties
+            temp_name = self._parent.strokes[self._stroke_id]['name']
+            with span(tracer, 'PaintScene.strokeAdded'):
+                self._parent.strokeAdded.emit(self._stroke_id, temp_name)
 
     def undo(self):
         """
         Removes stroke from scene
         """
+        if self._parent.restoring:
+            return
         self._parent.removeItem(self._stroke_path)
         self._parent.strokeRemoved.emit(self._stroke_id)
 
 
+class AddStrokes(QtGui.QUndoCommand):
+    """
+    Adds several strokes to paint_scene as one history entry
+    """
+    def __init__(self, parent, strokes, text=None):
+        """
+        Args:
+            parent (QGraphicsScene): paint_scene strokes belong to
+            strokes (list): StrokeItems, in drawing order
+            text (str, optional): history entry, defaults to stroke count
+        """
+        super(AddStrokes, self).__init__()
+        self._parent = parent
+        self._strokes = []
+        for stroke in strokes:
+            self._parent.next_stroke += 1
+            stroke_id = self._parent.next_stroke
+            name = 'Stroke {:02}'.format(stroke_id)
+            effect = stroke.graphicsEffect()
+            properties = {'stroke': stroke, 'name': name,
+                          'color': stroke.pen().color(),
+                          'size': stroke.pen().width(),
+                          'blur': effect.blurRadius() if effect else 0}
+            self._strokes.append((stroke_id, properties))
+
+        if text is None:
+            text = 'Add {} Strokes'.format(len(self._strokes))
+        self.setText(text)
+
+    @property
+    def stroke_ids(self):
+        """
+        indices of added strokes
+
+        Returns:
+            list: stroke indices
+        """
+        return [stroke_id for stroke_id, properties in self._strokes]
+
+    def redo(self):
+        """
+        Adds strokes to scene
+        """
+        if self._parent.restoring:
+            return
+        tracer = self._parent.tracer
+        with span(tracer, 'AddStrokes.redo', {'count': len(self._strokes)}):
+            for stroke_id, properties in self._strokes:
+                self._parent.addItem(properties['stroke'])
+                self._parent.strokes[stroke_id] = properties
+            added = [(stroke_id, properties['name'])
+                     for stroke_id, properties in self._strokes]
+            with span(tracer, 'PaintScene.strokesAdded'):
+                self._parent.strokesAdded.emit(added)
+
+    def undo(self):
+        """
+        Removes strokes from scene
+        """
+        if self._parent.restoring:
+            return
+        for stroke_id, properties in self._strokes:
+            self._parent.removeItem(properties['stroke'])
+        self._parent.strokesRemoved.emit(self.stroke_ids)
+
+
+class SetStrokeGeometry(QtGui.QUndoCommand):
+    """
+    Replaces the points of a stroke in paint_scene
+    """
+    def __init__(self, parent, stroke_id, geometry):
+        """
+        Args:
+            parent (QGraphicsScene): paint_scene stroke belongs to
+            stroke_id (int): stroke index
+            geometry (StrokeGeometry): new stroke points
+        """
+        super(SetStrokeGeometry, self).__init__()
+        self._parent = parent
+        self._stroke_id = stroke_id
+        self._geometry = geometry
+        self._previous = parent.strokes[stroke_id]['stroke'].geometry
+        self.setText('Edit {}'.format(parent.strokes[stroke_id]['name']))
+
+    def redo(self):
+        """
+        swaps in the new points
+        """
+        # applied even while restoring, checkpoints do not record geometry
+        self._parent._apply_stroke_geometry(self._stroke_id, self._geometry)
+
+    def undo(self):
+        """
+        swaps the previous points back in
+        """
+        self._parent._apply_stroke_geometry(self._stroke_id, self._previous)
+
+
 class DeleteStroke(QtGui.QUndoCommand):
     """
     Removes stroke from paint scene
@@ -442,6 +1585,9 @@ class DeleteStroke(QtGui.QUndoCommand):
         """
         removes stroke from scene
         """
+        if self._parent.paint_scene.restoring:
+            return
+        self._parent.flush_layer_updates()
         self._parent.paint_scene.removeStroke(self._stroke_id)
         self._parent.paint_scene.strokeRemoved.emit(self._stroke_id)
 
@@ -449,6 +1595,9 @@ class DeleteStroke(QtGui.QUndoCommand):
         """
         adds stroke back to scene
         """
+        if self._parent.paint_scene.restoring:
+            return
+        self._parent.flush_layer_updates()
         self._parent.paint_scene.addItem(self._stroke_inf['stroke'])
 
         if self._group:
@@ -486,6 +1635,9 @@ class DeleteGroup(QtGui.QUndoCommand):
         """
         deletes group & children
         """
+        if self._parent.paint_scene.restoring:
+            return
+        self._parent.flush_layer_updates()
         self._parent.paint_scene.strokeRemoved.emit(self._group.group_index)
         for i in range(self._group.childCount()):
             stroke_id = self._group.child(i).stroke_index
@@ -495,6 +1647,9 @@ class DeleteGroup(QtGui.QUndoCommand):
         """
         re adds group & children
         """
+        if self._parent.paint_scene.restoring:
+            return
+        self._parent.flush_layer_updates()
         self._parent.layers_tree.insertTopLevelItem(
             self._group_index, self._group)
 
@@ -535,6 +1690,9 @@ class GroupStrokes(QtGui.QUndoCommand):
         """
         groups strokes
         """
+        if self._parent.paint_scene.restoring:
+            return
+        self._parent.flush_layer_updates()
         iterator = QtGui.QTreeWidgetItemIterator(self._parent.layers_tree)
         while iterator.value():
             layer = iterator.value()
@@ -574,10 +1732,17 @@ class GroupStrokes(QtGui.QUndoCommand):
 
         self._group_item.setExpanded(True)
 
+        mirror = self._parent.paint_scene.mirror
+        if mirror is not None:
+            mirror.group(self._group_index, self._strokes)
+
     def undo(self):
         """
         ungroups strokes
         """
+        if self._parent.paint_scene.restoring:
+            return
+        self._parent.flush_layer_updates()
         move_these = []
         iterator = QtGui.QTreeWidgetItemIterator(self._group_item)
         while iterator.value():
@@ -607,3 +1772,166 @@ class GroupStrokes(QtGui.QUndoCommand):
                           QtCore.Qt.ItemIsDragEnabled)
 
         self._parent.paint_scene.strokeRemoved.emit(self._group_index)
+
+        mirror = self._parent.paint_scene.mirror
+        if mirror is not None:
+            mirror.ungroup(self._group_index)
+
+
+class FlattenStrokes(QtGui.QUndoCommand):
+    """
+    merges strokes into a single raster layer, undo restores the original
+    strokes & layers
+    """
+    def __init__(self, parent, layers):
+        """
+        Args:
+            parent (PyQtPaint): paint widget
+            layers (list): selected Layers & Folders, in panel order
+        """
+        super(FlattenStrokes, self).__init__()
+        self._parent = parent
+        self._layers = layers
+        self._raster = None
+
+        # stroke indices of every flattened layer, folders contribute their
+        # children
+        self._stroke_ids = []
+        for layer in layers:
+            if isinstance(layer, Folder):
+                children = [layer.child(i) for i in range(layer.childCount())]
+            else:
+                children = [layer]
+            for child in children:
+                if child.stroke_index not in self._stroke_ids:
+                    self._stroke_ids.append(child.stroke_index)
+
+        scene = self._parent.paint_scene
+        scene.next_stroke += 1
+        self._stroke_id = scene.next_stroke
+        self._layer_name = 'Flattened {:02}'.format(self._stroke_id)
+        self._layer = Layer(['', self._layer_name],
+                            stroke_index=self._stroke_id)
+        self._positions = []
+
+        self.setText('Flatten Layers')
+
+    def _render(self):
+        # render strokes on their own, blur effects included. Strokes have
+        # already been removed from the paint scene
+        scene = self._parent.paint_scene
+        items = [scene.strokes[i]['stroke'] for i in self._stroke_ids]
+        canvas = QtCore.QRectF(0, 0, scene.width, scene.height)
+        bounds = QtCore.QRectF()
+        for item in items:
+            rect = item.sceneBoundingRect()
+            effect = item.graphicsEffect()
+            if effect is not None:
+                pad = effect.blurRadius()
+                rect.adjust(-pad, -pad, pad, pad)
+            bounds = bounds.united(rect)
+        bounds = bounds.intersected(canvas).toAlignedRect()
+        if bounds.isEmpty():
+            bounds = QtCore.QRect(0, 0, 1, 1)
+
+        image = QtGui.QImage(bounds.size(),
+                             QtGui.QImage.Format_ARGB32_Premultiplied)
+        image.fill(0)
+        staging = QtGui.QGraphicsScene(canvas)
+        for item in items:
+            effect = item.graphicsEffect()
+            if isinstance(effect, StrokeBlurEffect):
+                # blurred for the view zoom while in the paint scene
+                effect.set_device_scale(1.0)
+            staging.addItem(item)
+        painter = QtGui.QPainter(image)
+        painter.setRenderHints(QtGui.QPainter.HighQualityAntialiasing)
+        staging.render(painter, QtCore.QRectF(image.rect()),
+                       QtCore.QRectF(bounds))
+        painter.end()
+        for item in items:
+            staging.removeItem(item)
+
+        raster = RasterItem(image, QtCore.QPointF(bounds.topLeft()))
+        raster.setZValue(max(item.zValue() for item in items))
+        return raster
+
+    def _take_layers(self):
+        tree = self._parent.layers_tree
+        self._positions = []
+        for layer in self._layers:
+            parent = layer.parent()
+            if parent is not None and parent in self._layers:
+                # removed along with its folder
+                continue
+            if parent is not None:
+                index = parent.indexOfChild(layer)
+            else:
+                index = tree.indexOfTopLevelItem(layer)
+            if index != -1:
+                self._positions.append((index, parent, layer))
+
+        # positions stay in panel order, the raster layer takes the first.
+        # Rows are only compared within a parent: removing from the bottom
+        # up keeps each parent's recorded indices valid
+        for index, parent, layer in sorted(self._positions,
+                                           key=lambda position: position[0],
+                                           reverse=True):
+            if parent is not None:
+                parent.takeChild(index)
+            else:
+                tree.takeTopLevelItem(index)
+
+    def redo(self):
+        """
+        replaces strokes & their layers with one raster layer
+        """
+        if self._parent.paint_scene.restoring:
+            return
+        self._parent.flush_layer_updates()
+        scene = self._parent.paint_scene
+        tree = self._parent.layers_tree
+        for stroke_id in self._stroke_ids:
+            scene.removeStroke(stroke_id)
+        if self._raster is None:
+            self._raster = self._render()
+            self._stroke_properties = {'stroke': self._raster,
+                                       'name': self._layer_name,
+                                       'color': QtGui.QColor(0, 0, 0, 0),
+                                       'size': 0, 'blur': 0}
+        self._take_layers()
+
+        index, parent, layer = self._positions[0]
+        if parent is not None:
+            parent.insertChild(index, self._layer)
+        else:
+            tree.insertTopLevelItem(index, self._layer)
+        scene.strokes[self._stroke_id] = self._stroke_properties
+        scene.addItem(self._raster)
+        self._parent.update_layer_index()
+
+    def undo(self):
+        """
+        restores flattened strokes & layers
+        """
+        if self._parent.paint_scene.restoring:
+            return
+        self._parent.flush_layer_updates()
+        scene = self._parent.paint_scene
+        tree = self._parent.layers_tree
+        scene.removeItem(self._raster)
+        parent = self._layer.parent()
+        if parent is not None:
+            parent.takeChild(parent.indexOfChild(self._layer))
+        else:
+            tree.takeTopLevelItem(tree.indexOfTopLevelItem(self._layer))
+
+        for index, parent, layer in sorted(self._positions,
+                                           key=lambda position: position[0]):
+            if parent is not None:
+                parent.insertChild(index, layer)
+            else:
+                tree.insertTopLevelItem(index, layer)
+        for stroke_id in self._stroke_ids:
+            scene.addItem(scene.strokes[stroke_id]['stroke'])
+        self._parent.update_layer_index()
@@ -1,7 +1,35 @@
 from PyQt4 import QtGui, QtCore
+from shared import registry
+
+
+def _line_pen(color):
+    # hairline for the row & column separators
+    return registry().pen(color, 0, QtCore.Qt.SolidLine, QtCore.Qt.SquareCap,
+                          QtCore.Qt.BevelJoin)
 
 
 class TreeDelegate(QtGui.QStyledItemDelegate):
+    def _draw_thumbnail(self, painter, option, index, x):
+        # layer preview from the panel's ThumbnailCache, a placeholder is
+        # drawn until it has rendered. Returns width used.
+        panel = option.widget
+        thumbnails = getattr(panel, 'thumbnails', None)
+        if thumbnails is None:
+            return 0
+        size = thumbnails.size
+        rect = QtCore.QRect(option.rect.x() + int(x),
+                            option.rect.center().y() - size.height() // 2,
+                            size.width(), size.height())
+        img = thumbnails.thumbnail(panel.itemFromIndex(index))
+        painter.save()
+        painter.fillRect(rect, QtGui.QColor(255, 255, 255, 200))
+        if img is not None:
+            painter.drawImage(rect.topLeft(), img)
+        painter.setPen(QtGui.QColor(0, 0, 0, 40))
+        painter.drawRect(rect.adjusted(0, 0, -1, -1))
+        painter.restore()
+        return size.width() + 6
+
     def createEditor(self, parent, option, index):
         col_num = index.column()
         if col_num == 0:
@@ -33,14 +61,12 @@ class TreeDelegate(QtGui.QStyledItemDelegate):
                                           option, painter, option.widget)
                         painter.setPen(QtCore.Qt.black)
 
-                    img = QtGui.QPixmap('img/eye.png')
+                    img = registry().pixmap(':/img/eye.png')
                     icon_rect = QtCore.QRect(option.rect)
                     painter.drawPixmap(icon_rect.center().x() - icon_dim / 2,
                                        icon_rect.center().y() - icon_dim / 2,
                                        icon_dim, icon_dim, img)
-                    painter.setPen(QtGui.QPen(line_color, 0,
-                                              QtCore.Qt.SolidLine,
-                                              QtCore.Qt.SquareCap))
+                    painter.setPen(_line_pen(line_color))
                     painter.pen().setWidthF(0)
                     painter.drawLine(option.rect.x(), option.rect.y() +
                                      option.rect.height(), option.rect.x() +
@@ -65,9 +91,7 @@ class TreeDelegate(QtGui.QStyledItemDelegate):
                         painter.setPen(QtCore.Qt.black)
 
                     painter.save()
-                    painter.setPen(QtGui.QPen(line_color, 0,
-                                              QtCore.Qt.SolidLine,
-                                              QtCore.Qt.SquareCap))
+                    painter.setPen(_line_pen(line_color))
                     painter.pen().setWidthF(0)
                     painter.drawLine(option.rect.x(), option.rect.y() +
                                      option.rect.height(), option.rect.x() +
@@ -92,8 +116,7 @@ class TreeDelegate(QtGui.QStyledItemDelegate):
                 painter.fillRect(option.rect, background)
                 painter.setPen(QtGui.QColor(0, 0, 0, 180))
                 painter.drawText(br, 0, text)
-                painter.setPen(QtGui.QPen(line_color, 0, QtCore.Qt.SolidLine,
-                                          QtCore.Qt.SquareCap))
+                painter.setPen(_line_pen(line_color))
                 painter.pen().setWidthF(0)
                 painter.drawLine(option.rect.x(), option.rect.y() +
                                  option.rect.height(), option.rect.x() +
@@ -125,9 +148,9 @@ class TreeDelegate(QtGui.QStyledItemDelegate):
                     painter.setPen(QtCore.Qt.black)
 
                 if option.state & QtGui.QStyle.State_Open:
-                    img = QtGui.QPixmap('img/arrow-down.png')
+                    img = registry().pixmap(':/img/arrow-down.png')
                 elif option.state:
-                    img = QtGui.QPixmap('img/arrow-right.png')
+                    img = registry().pixmap(':/img/arrow-right.png')
 
                 icon_rect = QtCore.QRect(option.rect)
 
@@ -136,7 +159,7 @@ class TreeDelegate(QtGui.QStyledItemDelegate):
 
                 painter.drawPixmap(x, y, icon_dim, icon_dim, img)
 
-                img = QtGui.QPixmap('img/folder.png')
+                img = registry().pixmap(':/img/folder.png')
                 icon_rect = QtCore.QRect(option.rect)
 
                 x = icon_rect.x() + icon_dim * 2
@@ -145,15 +168,16 @@ class TreeDelegate(QtGui.QStyledItemDelegate):
                 painter.drawPixmap(x, y, icon_dim, icon_dim, img)
                 # painter.restore()
 
-                br = option.rect.adjusted(icon_dim * 3.5, 0, 0, 0)
+                left = icon_dim * 3.5
+                left += self._draw_thumbnail(painter, option, index, left)
+                br = option.rect.adjusted(left, 0, 0, 0)
                 flags = QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter
                 fm = painter.fontMetrics()
                 text = index.data(QtCore.Qt.DisplayRole).toPyObject()
                 text = fm.elidedText(text, QtCore.Qt.ElideRight, br.width())
                 br = painter.boundingRect(br, int(flags), text)
                 painter.drawText(br, 0, text)
-                painter.setPen(QtGui.QPen(line_color, 0, QtCore.Qt.SolidLine,
-                                          QtCore.Qt.SquareCap))
+                painter.setPen(_line_pen(line_color))
                 painter.pen().setWidthF(0)
                 painter.drawLine(option.rect.x(), option.rect.y() +
                                  option.rect.height(), option.rect.x() +
@@ -181,7 +205,9 @@ class TreeDelegate(QtGui.QStyledItemDelegate):
 
                 # painter.restore()
 
-                br = option.rect.adjusted(icon_dim * 2, 0, 0, 0)
+                left = icon_dim * 2
+                left += self._draw_thumbnail(painter, option, index, left)
+                br = option.rect.adjusted(left, 0, 0, 0)
                 flags = QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter
                 fm = painter.fontMetrics()
                 text = index.data(QtCore.Qt.DisplayRole).toPyObject()
@@ -189,8 +215,7 @@ class TreeDelegate(QtGui.QStyledItemDelegate):
                 text = fm.elidedText(text, QtCore.Qt.ElideRight, br.width())
                 br = painter.boundingRect(br, int(flags), text)
                 painter.drawText(br, 0, text)
-                painter.setPen(QtGui.QPen(line_color, 0, QtCore.Qt.SolidLine,
-                                          QtCore.Qt.SquareCap))
+                painter.setPen(_line_pen(line_color))
                 painter.pen().setWidthF(0)
                 painter.drawLine(option.rect.x(), option.rect.y() +
                                  option.rect.height(), option.rect.x() +
@@ -217,7 +242,10 @@ class TreeDelegate(QtGui.QStyledItemDelegate):
                         painter.setPen(QtCore.Qt.black)
                     icon_rect = QtCore.QRect(option.rect)
 
-                    br = option.rect.adjusted(icon_dim * 3, 0, 0, 0)
+                    left = icon_dim * 3
+                    left += self._draw_thumbnail(painter, option, index,
+                                                 left)
+                    br = option.rect.adjusted(left, 0, 0, 0)
                     flags = QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter
                     fm = painter.fontMetrics()
                     text = index.data(QtCore.Qt.DisplayRole).toPyObject()
@@ -226,9 +254,7 @@ class TreeDelegate(QtGui.QStyledItemDelegate):
                                          br.width())
                     br = painter.boundingRect(br, int(flags), text)
                     painter.drawText(br, 0, text)
-                    painter.setPen(QtGui.QPen(line_color, 0,
-                                              QtCore.Qt.SolidLine,
-                                              QtCore.Qt.SquareCap))
+                    painter.setPen(_line_pen(line_color))
                     painter.pen().setWidthF(0)
                     painter.drawLine(option.rect.x(), option.rect.y() +
                                      option.rect.height(), option.rect.x() +
@@ -245,7 +271,10 @@ class TreeDelegate(QtGui.QStyledItemDelegate):
                     painter.save()
                     icon_rect = QtCore.QRect(option.rect)
 
-                    br = option.rect.adjusted(icon_dim * 3, 0, 0, 0)
+                    left = icon_dim * 3
+                    left += self._draw_thumbnail(painter, option, index,
+                                                 left)
+                    br = option.rect.adjusted(left, 0, 0, 0)
                     flags = QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter
                     fm = painter.fontMetrics()
                     text = index.data(QtCore.Qt.DisplayRole).toPyObject()
@@ -256,9 +285,7 @@ class TreeDelegate(QtGui.QStyledItemDelegate):
                     painter.fillRect(option.rect, background)
                     painter.setPen(QtGui.QColor(0, 0, 0, 100))
                     painter.drawText(br, 0, text)
-                    painter.setPen(QtGui.QPen(line_color, 0,
-                                              QtCore.Qt.SolidLine,
-                                              QtCore.Qt.SquareCap))
+                    painter.setPen(_line_pen(line_color))
                     painter.pen().setWidthF(0)
                     painter.drawLine(option.rect.x(), option.rect.y() +
                                      option.rect.height(), option.rect.x() +
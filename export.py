@@ -0,0 +1,344 @@
+"""
+Vector export of PyQtPaint canvases.
+
+Strokes are streamed to SVG one element at a time in stacking order, so
+memory does not grow with the size of the document. PDF export renders the
+scene through QPrinter, which keeps hard strokes as vectors.
+"""
+import base64
+from xml.sax.saxutils import quoteattr
+from PyQt4 import QtGui, QtCore
+from layers import Layer, Folder
+from strokes import StrokeItem, RasterItem, DOT_OFFSET
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def _num(value):
+    # strokes are quantized to 1/16 px, 4 decimals are exact
+    text = '{:.4f}'.format(value).rstrip('0').rstrip('.')
+    return text if text not in ('', '-0') else '0'
+
+
+def _text(value):
+    # layer names may be QStrings
+    return quoteattr('{}'.format(value))
+
+
+def _color(color):
+    return '#{:02x}{:02x}{:02x}'.format(color.red(), color.green(),
+                                        color.blue())
+
+
+def _path_data(points):
+    points = iter(points)
+    x, y = next(points)
+    yield 'M{} {}'.format(_num(x), _num(y))
+    degenerate = True
+    for px, py in points:
+        if px != x or py != y:
+            degenerate = False
+        yield 'L{} {}'.format(_num(px), _num(py))
+    if degenerate:
+        # zero length strokes still need a dot, see StrokeGeometry.to_path
+        yield 'L{} {}'.format(_num(x + DOT_OFFSET), _num(y))
+
+
+class SvgWriter(object):
+    """
+    Writes SVG elements to a file handle as they are produced
+
+    Args:
+        handle (file): writable text handle
+        width (int): canvas width
+        height (int): canvas height
+    """
+    def __init__(self, handle, width, height):
+        self._handle = handle
+        self._width = width
+        self._height = height
+        self._filters = set()
+        self._depth = 1
+        self._write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        self._write('<svg xmlns="http://www.w3.org/2000/svg" '
+                    'xmlns:xlink="http://www.w3.org/1999/xlink" '
+                    'version="1.1" width="{0}" height="{1}" '
+                    'viewBox="0 0 {0} {1}">\n'.format(_num(width),
+                                                      _num(height)))
+        self._line('<rect width="{}" height="{}" fill="#ffffff"/>'.format(
+            _num(width), _num(height)))
+
+    def _write(self, text):
+        self._handle.write(text)
+
+    def _line(self, text):
+        self._write('  ' * self._depth + text + '\n')
+
+    def _blur_filter(self, radius):
+        # QGraphicsBlurEffect radius is roughly two standard deviations
+        key = _num(radius)
+        name = 'blur' + key.replace('.', '_')
+        if key not in self._filters:
+            self._filters.add(key)
+            self._line('<filter id="{}" filterUnits="userSpaceOnUse" x="0" '
+                       'y="0" width="{}" height="{}"><feGaussianBlur '
+                       'stdDeviation="{}"/></filter>'.format(
+                           name, _num(self._width), _num(self._height),
+                           _num(radius / 2.0)))
+        return name
+
+    def _transform(self, item):
+        transform = item.sceneTransform()
+        if transform.isIdentity():
+            return ''
+        return ' transform="matrix({} {} {} {} {} {})"'.format(
+            *[_num(v) for v in (transform.m11(), transform.m12(),
+                                transform.m21(), transform.m22(),
+                                transform.dx(), transform.dy())])
+
+    def begin_group(self, name):
+        """
+        opens a <g> element
+
+        Args:
+            name (str): group label
+        """
+        self._line('<g class="folder" data-name={}>'.format(_text(name)))
+        self._depth += 1
+
+    def end_group(self):
+        """
+        closes the current <g> element
+        """
+        self._depth -= 1
+        self._line('</g>')
+
+    def stroke(self, item, name, blur=0):
+        """
+        writes one stroke as a path
+
+        Args:
+            item (StrokeItem): committed stroke
+            name (str): layer name
+            blur (float): blur radius
+        """
+        pen = item.pen()
+        color = pen.color()
+        attributes = ['d="{}"'.format(''.join(_path_data(
+                          item.geometry.points()))),
+                      'fill="none"',
+                      'stroke="{}"'.format(_color(color)),
+                      'stroke-width="{}"'.format(_num(pen.widthF())),
+                      'stroke-linecap="round"',
+                      'stroke-linejoin="round"',
+                      'data-name={}'.format(_text(name))]
+        if color.alpha() != 255:
+            attributes.append('stroke-opacity="{}"'.format(
+                _num(color.alphaF())))
+        if blur > 0:
+            attributes.append('filter="url(#{})"'.format(
+                self._blur_filter(blur)))
+        self._line('<path {}{}/>'.format(' '.join(attributes),
+                                         self._transform(item)))
+
+    def raster(self, item, name):
+        """
+        writes a raster layer as an embedded png
+
+        Args:
+            item (RasterItem): raster layer
+            name (str): layer name
+        """
+        data = QtCore.QByteArray()
+        buffer = QtCore.QBuffer(data)
+        buffer.open(QtCore.QIODevice.WriteOnly)
+        item.image.save(buffer, 'PNG')
+        buffer.close()
+        encoded = base64.b64encode(bytes(data)).decode('ascii')
+        offset = item.offset
+        self._line('<image x="{}" y="{}" width="{}" height="{}" '
+                   'data-name={} xlink:href="data:image/png;base64,{}"{}/>'
+                   .format(_num(offset.x()), _num(offset.y()),
+                           item.image.width(), item.image.height(),
+                           _text(name), encoded, self._transform(item)))
+
+    def close(self):
+        """
+        ends the document
+        """
+        self._write('</svg>\n')
+
+
+def _layer_folders(paint):
+    # stroke index to enclosing folder, None for top level layers
+    folders = {}
+    iterator = QtGui.QTreeWidgetItemIterator(paint.layers_tree)
+    while iterator.value():
+        item = iterator.value()
+        if isinstance(item, Layer):
+            parent = item.parent()
+            folders[item.stroke_index] = (parent if isinstance(parent, Folder)
+                                          else None)
+        iterator += 1
+    return folders
+
+
+def export_svg(paint, filepath):
+    """
+    writes visible committed strokes as SVG in stacking order. Consecutive
+    strokes of a Folder are wrapped in a <g> element.
+
+    Args:
+        paint (PyQtPaint): widget to export
+        filepath (str): output path
+
+    Returns:
+        int: number of strokes written
+    """
+    scene = paint.paint_scene
+    folders = _layer_folders(paint)
+    layers = {}
+    for stroke_id, stroke in scene.strokes.items():
+        if stroke_id in folders:
+            layers[id(stroke['stroke'])] = (stroke_id, stroke)
+
+    written = 0
+    with open(filepath, 'w') as handle:
+        writer = SvgWriter(handle, scene.width, scene.height)
+        group = None
+        for item in scene.items(QtCore.Qt.AscendingOrder):
+            if id(item) not in layers or not item.isVisible():
+                continue
+            stroke_id, stroke = layers[id(item)]
+            folder = folders[stroke_id]
+            if folder is not group:
+                if group is not None:
+                    writer.end_group()
+                if folder is not None:
+                    writer.begin_group(folder.text(1))
+                group = folder
+
+            if isinstance(item, StrokeItem):
+                effect = item.graphicsEffect()
+                writer.stroke(item, stroke['name'],
+                              effect.blurRadius() if effect else 0)
+            elif isinstance(item, RasterItem):
+                writer.raster(item, stroke['name'])
+            else:
+                continue
+            written += 1
+        if group is not None:
+            writer.end_group()
+        writer.close()
+    return written
+
+
+def export_pdf(paint, filepath):
+    """
+    writes canvas as PDF, hard strokes stay vectors
+
+    Args:
+        paint (PyQtPaint): widget to export
+        filepath (str): output path
+    """
+    scene = paint.paint_scene
+    printer = QtGui.QPrinter(QtGui.QPrinter.HighResolution)
+    printer.setOutputFormat(QtGui.QPrinter.PdfFormat)
+    printer.setOutputFileName(filepath)
+    printer.setFullPage(True)
+    printer.setPaperSize(QtCore.QSizeF(scene.width, scene.height),
+                         QtGui.QPrinter.Point)
+
+    painter = QtGui.QPainter(printer)
+    painter.setRenderHint(QtGui.QPainter.Antialiasing)
+    page = QtCore.QRectF(printer.pageRect())
+    with scene.overlays_hidden(), \
+            scene.full_resolution(page.width() / float(scene.width)):
+        scene.render(painter, page,
+                     QtCore.QRectF(0, 0, scene.width, scene.height))
+    painter.end()
+
+
+def rasterize_svg(filepath, width, height):
+    """
+    renders an SVG file with QtSvg
+
+    Args:
+        filepath (str): svg path
+        width (int): output width
+        height (int): output height
+
+    Returns:
+        QImage: RGB32 render
+    """
+    from PyQt4 import QtSvg
+    renderer = QtSvg.QSvgRenderer(filepath)
+    img = QtGui.QImage(width, height, QtGui.QImage.Format_RGB32)
+    img.fill(QtGui.QColor(255, 255, 255).rgb())
+    painter = QtGui.QPainter(img)
+    painter.setRenderHint(QtGui.QPainter.Antialiasing)
+    renderer.render(painter)
+    painter.end()
+    return img
+
+
+def image_difference(first, second):
+    """
+    per channel difference of two equally sized RGB32 images
+
+    Args:
+        first (QImage): image
+        second (QImage): image
+
+    Returns:
+        dict: mean & max channel error (0-255) & fraction of pixels off by
+              more than 32 in any channel
+    """
+    size = first.byteCount()
+    a = first.constBits().asstring(size)
+    b = second.constBits().asstring(size)
+    if numpy is not None:
+        a = numpy.frombuffer(a, dtype=numpy.uint8).reshape(-1, 4)[:, :3]
+        b = numpy.frombuffer(b, dtype=numpy.uint8).reshape(-1, 4)[:, :3]
+        diff = numpy.abs(a.astype(numpy.int16) - b.astype(numpy.int16))
+        return {'mean_error': float(diff.mean()),
+                'max_error': int(diff.max()),
+                'mismatched': float((diff.max(axis=1) > 32).mean())}
+
+    a = bytearray(a)
+    b = bytearray(b)
+    total = peak = mismatched = 0
+    for i in range(0, size, 4):
+        worst = 0
+        for channel in range(3):
+            error = abs(a[i + channel] - b[i + channel])
+            total += error
+            worst = max(worst, error)
+        peak = max(peak, worst)
+        if worst > 32:
+            mismatched += 1
+    pixels = size // 4
+    return {'mean_error': total / float(pixels * 3), 'max_error': peak,
+            'mismatched': mismatched / float(pixels)}
+
+
+def verify_svg(paint, filepath):
+    """
+    rasterizes an exported SVG & compares it against get_img. Blur filters
+    only approximate QGraphicsBlurEffect, so soft strokes differ slightly.
+
+    Args:
+        paint (PyQtPaint): exported widget
+        filepath (str): svg path written by export_svg
+
+    Returns:
+        dict: see image_difference
+    """
+    scene = paint.paint_scene
+    with scene.overlays_hidden():
+        expected = paint.get_img()
+    actual = rasterize_svg(filepath, expected.width(), expected.height())
+    return image_difference(expected, actual)
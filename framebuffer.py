@@ -0,0 +1,409 @@
+"""
+Live canvas frames in shared memory for external viewers.
+
+Usage:
+    python framebuffer.py NAME
+
+Opens a window showing the frames published under NAME with
+PyQtPaint.start_frame_publishing.
+
+The publisher keeps the composited canvas in a named QSharedMemory segment
+holding a header & a ring of frame slots, three by default. Each frame is
+written to the slot after the latest, so the slot a reader is most likely
+copying is never touched. Only the region that changed since a slot was
+last written is updated: stale areas are copied from the latest slot & the
+scene's dirty region is rendered straight into shared memory.
+
+Layout, little endian:
+    header (64 bytes): magic, version, slot count, width, height, stride,
+                       latest slot, latest frame
+    slots: slot header (64 bytes) followed by height * stride bytes of
+           ARGB32 premultiplied pixels, see buffers.CHANNEL_ORDER
+    slot header: frame, dirty x, y, width, height, publish time
+
+Writers never lock the segment. A slot's frame number is zeroed while it is
+written, so readers check it before & after copying & retry on mismatch.
+The dirty rect is relative to the previous frame; a reader that skipped
+frames must copy the whole slot.
+"""
+import sys
+import math
+import time
+import ctypes
+import struct
+import sip
+from PyQt4 import QtGui, QtCore
+from metrics import RollingStat
+
+MAGIC = b'PQPF'
+VERSION = 1
+DEFAULT_SLOTS = 3
+
+_HEADER = struct.Struct('<4sIIIIIiQ')
+_SLOT = struct.Struct('<Qiiiid')
+HEADER_BYTES = 64
+SLOT_HEADER_BYTES = 64
+_FORMAT = QtGui.QImage.Format_ARGB32_Premultiplied
+# scene pixels added around ignored rects, covers the antialiasing margin
+# QGraphicsScene adds to dirty item rects
+IGNORE_MARGIN = 2
+# regions split into more rects are handled as their bounding rect
+MAX_RECTS = 32
+
+
+def _buffer(memory):
+    # writable view of a QSharedMemory segment, for struct pack/unpack
+    return (ctypes.c_char * memory.size()).from_address(int(memory.data()))
+
+
+def _slot_offset(slot, height, stride):
+    return HEADER_BYTES + slot * (SLOT_HEADER_BYTES + height * stride)
+
+
+def _copy_rect(dst, src, stride, rect):
+    # copies rows of rect between two images sharing the same stride
+    left = rect.x() * 4
+    length = rect.width() * 4
+    for y in range(rect.y(), rect.y() + rect.height()):
+        ctypes.memmove(dst + y * stride + left, src + y * stride + left,
+                       length)
+
+
+def _simplified(region):
+    # fragmented regions cost a copy or render per rect
+    if len(region.rects()) > MAX_RECTS:
+        return QtGui.QRegion(region.boundingRect())
+    return region
+
+
+class FramePublisher(QtCore.QObject):
+    """
+    Publishes composited canvas frames to shared memory when the scene
+    changes. Changes are collected from PaintScene.changed & published at
+    most fps times a second, so bursts of edits cost one frame. Changed
+    rects are kept as a region & rendered one by one, a live stroke only
+    contributes its new segments, see stroke_moved. Committed strokes are
+    composited from the tile cache when there is one. The brush cursor is
+    not drawn & changes caused only by moving it are ignored.
+
+    Attributes:
+        bytes_copied (int): pixel bytes written to shared memory
+        fps (int): maximum frames per second
+        frame (int): last published frame number, 0 before the first frame
+        publish_time (RollingStat): ms spent publishing each frame
+    """
+    def __init__(self, scene, name, fps=60, slots=DEFAULT_SLOTS):
+        """
+        Args:
+            scene (PaintScene): scene to publish
+            name (str): shared memory key
+            fps (int, optional): maximum frames per second
+            slots (int, optional): frame slots, at least 2
+        """
+        super(FramePublisher, self).__init__(scene)
+        self._scene = scene
+        self.fps = fps
+        self.frame = 0
+        self.bytes_copied = 0
+        self.publish_time = RollingStat(1000)
+
+        self._canvas = QtCore.QRect(0, 0, int(math.ceil(scene.width)),
+                                    int(math.ceil(scene.height)))
+        self._slots = max(2, slots)
+        self._stride = self._canvas.width() * 4
+        height = self._canvas.height()
+        size = _slot_offset(self._slots, height, self._stride)
+
+        self._memory = QtCore.QSharedMemory(name, self)
+        if not self._memory.create(size):
+            if self._memory.error() != QtCore.QSharedMemory.AlreadyExists:
+                raise IOError('cannot create shared memory {}: {}'.format(
+                    name, self._memory.errorString()))
+            # stale segment left by a publisher that did not close
+            self._memory.attach()
+            self._memory.detach()
+            if not self._memory.create(size):
+                raise IOError('cannot create shared memory {}: {}'.format(
+                    name, self._memory.errorString()))
+
+        self._data = _buffer(self._memory)
+        self._address = int(self._memory.data())
+        self._latest = -1
+        # region each slot is missing, every slot starts blank
+        self._stale = [QtGui.QRegion(self._canvas)
+                       for i in range(self._slots)]
+        self._dirty = QtGui.QRegion(self._canvas)
+        # areas repainted without a canvas change since the last scene
+        # change, see ignore_changes
+        self._ignored = QtGui.QRegion()
+        self._images = [self._slot_image(slot)
+                        for slot in range(self._slots)]
+        self._write_header()
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.publish)
+        scene.changed.connect(self._changed)
+        self._timer.start(0)
+
+    def close(self):
+        """
+        stops publishing & releases the shared memory segment
+        """
+        self._timer.stop()
+        self._scene.changed.disconnect(self._changed)
+        self._images = []
+        self._data = None
+        self._memory.detach()
+
+    def _pixels(self, slot):
+        return (self._address + SLOT_HEADER_BYTES +
+                _slot_offset(slot, self._canvas.height(), self._stride))
+
+    def _slot_image(self, slot):
+        # image painting straight into a slot's shared pixels
+        return QtGui.QImage(sip.voidptr(self._pixels(slot)),
+                            self._canvas.width(), self._canvas.height(),
+                            self._stride, _FORMAT)
+
+    def _write_header(self):
+        _HEADER.pack_into(self._data, 0, MAGIC, VERSION, self._slots,
+                          self._canvas.width(), self._canvas.height(),
+                          self._stride, self._latest, self.frame)
+
+    def ignore_changes(self, rects):
+        """
+        notes areas repainted without changing the canvas, e.g. the brush
+        cursor moving or soft strokes rescaled for a render. Scene changes
+        inside them alone do not publish a frame
+
+        Args:
+            rects (list): QRectF scene rects
+        """
+        for rect in rects:
+            rect = rect.toAlignedRect().adjusted(
+                -IGNORE_MARGIN, -IGNORE_MARGIN, IGNORE_MARGIN, IGNORE_MARGIN)
+            self._ignored = self._ignored.united(QtGui.QRegion(rect))
+
+    def stroke_moved(self, segments, items):
+        """
+        notes the part of the live stroke that changed. The live stroke
+        dirties its whole bounding rect on every move, only the new segments
+        are published
+
+        Args:
+            segments (list): QRectF scene rects covering the new segments,
+                             brush & blur included
+            items (list): QRectF scene rects of the live stroke items
+        """
+        self.ignore_changes(items)
+        self._mark_dirty(rect.toAlignedRect() for rect in segments)
+
+    def _mark_dirty(self, rects):
+        for rect in rects:
+            rect = rect.intersected(self._canvas)
+            if not rect.isEmpty():
+                self._dirty = self._dirty.united(QtGui.QRegion(rect))
+        if not self._dirty.isEmpty() and not self._timer.isActive():
+            self._timer.start(int(1000 / max(1, self.fps)))
+
+    def _changed(self, region):
+        ignored, self._ignored = self._ignored, QtGui.QRegion()
+        self._mark_dirty(
+            rect for rect in (rect.toAlignedRect() for rect in region)
+            if not QtGui.QRegion(rect).subtracted(ignored).isEmpty())
+
+    def publish(self):
+        """
+        writes the region changed since the last frame to the next slot,
+        does nothing when the scene has not changed
+        """
+        dirty = _simplified(self._dirty)
+        if dirty.isEmpty() or self._data is None:
+            return
+        start = time.time()
+        self._dirty = QtGui.QRegion()
+        bounds = dirty.boundingRect()
+        slot = (self._latest + 1) % self._slots
+        self.frame += 1
+        header = _slot_offset(slot, self._canvas.height(), self._stride)
+        _SLOT.pack_into(self._data, header, 0, 0, 0, 0, 0, 0.0)
+
+        # bring the rest of the slot up to date from the latest frame
+        # readers copy the bounding rect, so all of it must be current
+        stale = _simplified(self._stale[slot].subtracted(dirty))
+        if self._latest >= 0:
+            for rect in stale.rects():
+                _copy_rect(self._pixels(slot), self._pixels(self._latest),
+                           self._stride, rect)
+                self.bytes_copied += rect.width() * rect.height() * 4
+        rects = dirty.rects()
+        self._render(self._images[slot], rects)
+        self.bytes_copied += sum(rect.width() * rect.height() * 4
+                                 for rect in rects)
+
+        self._stale[slot] = QtGui.QRegion()
+        for other in range(self._slots):
+            if other != slot:
+                self._stale[other] = _simplified(
+                    self._stale[other].united(dirty))
+        _SLOT.pack_into(self._data, header, self.frame, bounds.x(),
+                        bounds.y(), bounds.width(), bounds.height(),
+                        time.time())
+        self._latest = slot
+        self._write_header()
+        self.publish_time.add((time.time() - start) * 1000.0)
+
+    def _render(self, image, rects):
+        # renders each changed rect on its own, committed strokes are
+        # composited from the tile cache at whatever scale it holds
+        painter = QtGui.QPainter(image)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        scene = self._scene
+        tiles = scene.tile_cache
+        with scene.full_resolution(), scene.cursor_excluded():
+            proxy = tiles is not None and tiles.proxy
+            if tiles is not None:
+                tiles.proxy = True
+            try:
+                for rect in rects:
+                    painter.setClipRect(rect)
+                    painter.setCompositionMode(
+                        QtGui.QPainter.CompositionMode_Source)
+                    painter.fillRect(rect, QtCore.Qt.transparent)
+                    painter.setCompositionMode(
+                        QtGui.QPainter.CompositionMode_SourceOver)
+                    scene.render(painter, QtCore.QRectF(rect),
+                                 QtCore.QRectF(rect))
+            finally:
+                if tiles is not None:
+                    tiles.proxy = proxy
+        painter.end()
+
+
+class FrameReader(object):
+    """
+    Reads frames published by FramePublisher into a local image, copying
+    only what changed since the last frame read.
+
+    Attributes:
+        frame (int): last frame read, 0 before the first
+        image (QImage): latest frame, None until attached
+        latency (RollingStat): ms from publish to read per frame
+    """
+    def __init__(self, name):
+        """
+        Args:
+            name (str): shared memory key
+        """
+        self.frame = 0
+        self.image = None
+        self.latency = RollingStat(1000)
+        self._memory = QtCore.QSharedMemory(name)
+        self._data = None
+
+    def attach(self):
+        """
+        attaches to the publisher's segment
+
+        Returns:
+            bool: attached, False while nothing is published under name
+        """
+        if self._data is not None:
+            return True
+        if not self._memory.attach(QtCore.QSharedMemory.ReadOnly):
+            return False
+        data = _buffer(self._memory)
+        magic, version, slots, width, height, stride, latest, frame = \
+            _HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            self._memory.detach()
+            raise IOError('{} is not a version {} frame buffer'.format(
+                self._memory.key(), VERSION))
+        self._data = data
+        self._address = int(self._memory.data())
+        self._height = height
+        self._stride = stride
+        self.image = QtGui.QImage(width, height, _FORMAT)
+        self.image.fill(0)
+        return True
+
+    def detach(self):
+        """
+        detaches from the publisher's segment
+        """
+        self._data = None
+        self._memory.detach()
+
+    def read(self, retries=3):
+        """
+        copies the latest frame into image when it is newer than the last
+        one read
+
+        Args:
+            retries (int, optional): attempts when the publisher overwrites
+                                     the slot while it is being copied
+
+        Returns:
+            QRect: area of image that changed, None without a new frame
+        """
+        if not self.attach():
+            return None
+        for attempt in range(retries):
+            latest, frame = _HEADER.unpack_from(self._data, 0)[6:]
+            if latest < 0 or frame == self.frame:
+                return None
+            header = _slot_offset(latest, self._height, self._stride)
+            slot = _SLOT.unpack_from(self._data, header)
+            if slot[0] == 0:
+                continue
+            if slot[0] == self.frame + 1:
+                rect = QtCore.QRect(*slot[1:5])
+            else:
+                rect = self.image.rect()
+
+            pixels = self._address + header + SLOT_HEADER_BYTES
+            _copy_rect(int(self.image.bits()), pixels, self._stride, rect)
+            if _SLOT.unpack_from(self._data, header)[0] != slot[0]:
+                continue
+            self.frame = slot[0]
+            self.latency.add((time.time() - slot[5]) * 1000.0)
+            return rect
+        return None
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(
+        description=__doc__.strip().split('\n\n')[0])
+    parser.add_argument('name')
+    parser.add_argument('--fps', type=int, default=60)
+    args = parser.parse_args(argv)
+
+    app = QtGui.QApplication.instance() or QtGui.QApplication(sys.argv)
+    label = QtGui.QLabel()
+    label.setAlignment(QtCore.Qt.AlignCenter)
+    label.setWindowTitle('Frames: {}'.format(args.name))
+    label.resize(1200, 800)
+    label.show()
+
+    reader = FrameReader(args.name)
+
+    def poll():
+        if reader.read() is None:
+            return
+        pixmap = QtGui.QPixmap.fromImage(reader.image)
+        label.setPixmap(pixmap.scaled(label.size(), QtCore.Qt.KeepAspectRatio,
+                                      QtCore.Qt.SmoothTransformation))
+        label.setWindowTitle('Frames: {} #{} {:.1f} ms'.format(
+            args.name, reader.frame,
+            reader.latency.stats().get('mean', 0.0)))
+
+    timer = QtCore.QTimer()
+    timer.timeout.connect(poll)
+    timer.start(int(1000 / max(1, args.fps)))
+    return app.exec_()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,281 @@
+import sip
+from PyQt4 import QtGui, QtCore
+from layers import Layer, Folder
+
+# commands between automatic checkpoints
+CHECKPOINT_INTERVAL = 50
+# rows laid out per pass by HistoryView
+HISTORY_BATCH_SIZE = 200
+
+
+def _tree_state(item):
+    # (item, expanded, children) for every child of item, recursively
+    return tuple((child, child.isExpanded(), _tree_state(child))
+                 for child in [item.child(i)
+                               for i in range(item.childCount())])
+
+
+def _flatten(state):
+    for item, expanded, children in state:
+        yield item, children
+        for entry in _flatten(children):
+            yield entry
+
+
+class Checkpoint(object):
+    """
+    Scene & layer panel state after the first index commands of the undo
+    stack. Holds references only, the strokes & layer items themselves are
+    shared with the undo commands.
+
+    Attributes:
+        command (QUndoCommand): last command applied, None at index 0
+        index (int): undo stack index
+        strokes (frozenset): indices of strokes in the scene
+        tree (tuple): nested (item, expanded, children) layer panel state
+    """
+    __slots__ = ('index', 'command', 'strokes', 'tree')
+
+    def __init__(self, index, command, strokes, tree):
+        self.index = index
+        self.command = command
+        self.strokes = strokes
+        self.tree = tree
+
+
+class HistoryCheckpoints(QtCore.QObject):
+    """
+    Periodic snapshots of the scene & layer panel used to jump across long
+    stretches of history. A jump restores the checkpoint nearest to the
+    target & only replays the remaining commands, with layer panel updates
+    batched. Commands skip their redo/undo while the undo stack is moved to
+    a checkpoint, see PaintScene.restoring.
+
+    Reordering layers by drag & drop is not an undoable edit, so checkpoints
+    taken before it are dropped.
+
+    Attributes:
+        interval (int): commands between checkpoints
+    """
+    def __init__(self, paint, interval=CHECKPOINT_INTERVAL):
+        """
+        Args:
+            paint (PyQtPaint): widget whose history is checkpointed
+            interval (int, optional): commands between checkpoints
+        """
+        super(HistoryCheckpoints, self).__init__(paint)
+        self._paint = paint
+        self._scene = paint.paint_scene
+        self.interval = interval
+        self._checkpoints = {}
+        self._jumping = False
+
+        self._stack = self._scene.undo_stack
+        self._stack.indexChanged.connect(self._index_changed)
+        paint.layers_tree.layerOrderChanged.connect(self.clear)
+        self.capture()
+
+    def close(self):
+        """
+        stops checkpointing & drops every checkpoint
+        """
+        if not sip.isdeleted(self._stack):
+            self._stack.indexChanged.disconnect(self._index_changed)
+        self.interval = 0
+        self.clear()
+
+    def __len__(self):
+        return len(self._checkpoints)
+
+    def _command(self, index):
+        if index <= 0:
+            return None
+        return self._scene.undo_stack.command(index - 1)
+
+    def _valid(self, checkpoint):
+        # commands after a checkpoint are replaced when pushing after undo
+        stack = self._scene.undo_stack
+        return (checkpoint.index <= stack.count() and
+                self._command(checkpoint.index) is checkpoint.command)
+
+    def _index_changed(self, index):
+        if self._jumping or not self.interval or index % self.interval:
+            return
+        # QUndoStack clears itself while being destroyed
+        if sip.isdeleted(self._stack) or sip.isdeleted(self._paint):
+            return
+        checkpoint = self._checkpoints.get(index)
+        if checkpoint is None or not self._valid(checkpoint):
+            self.capture()
+
+    def capture(self):
+        """
+        snapshots current state at the current undo stack index
+
+        Returns:
+            Checkpoint: new checkpoint
+        """
+        scene = self._scene
+        index = scene.undo_stack.index()
+        strokes = frozenset(stroke_id
+                            for stroke_id, stroke in scene.strokes.items()
+                            if stroke['stroke'].scene() is scene)
+        tree = _tree_state(self._paint.layers_tree.invisibleRootItem())
+        checkpoint = Checkpoint(index, self._command(index), strokes, tree)
+        self._checkpoints[index] = checkpoint
+        return checkpoint
+
+    def clear(self):
+        """
+        drops every checkpoint
+        """
+        self._checkpoints = {}
+
+    def nearest(self, index):
+        """
+        valid checkpoint closest to an undo stack index, stale checkpoints
+        are dropped
+
+        Args:
+            index (int): undo stack index
+
+        Returns:
+            Checkpoint: closest checkpoint, None when there is none
+        """
+        best = None
+        for key, checkpoint in list(self._checkpoints.items()):
+            if not self._valid(checkpoint):
+                del self._checkpoints[key]
+                continue
+            if (best is None or
+                    abs(checkpoint.index - index) < abs(best.index - index)):
+                best = checkpoint
+        return best
+
+    def jump(self, index):
+        """
+        moves the undo stack to index, restoring the nearest checkpoint when
+        that replays fewer commands than stepping from the current index
+
+        Args:
+            index (int): target undo stack index
+        """
+        stack = self._scene.undo_stack
+        index = max(0, min(index, stack.count()))
+        current = stack.index()
+        if index == current:
+            return
+
+        checkpoint = self.nearest(index)
+        self._jumping = True
+        try:
+            with self._paint.batched_layer_updates():
+                if (checkpoint is not None and abs(checkpoint.index - index) <
+                        abs(current - index)):
+                    self._scene.restoring = True
+                    try:
+                        stack.setIndex(checkpoint.index)
+                    finally:
+                        self._scene.restoring = False
+                    self._restore(checkpoint)
+                stack.setIndex(index)
+        finally:
+            self._jumping = False
+        self._index_changed(index)
+
+    def _restore(self, checkpoint):
+        scene = self._scene
+        for stroke_id, stroke in scene.strokes.items():
+            item = stroke['stroke']
+            in_scene = item.scene() is scene
+            if stroke_id in checkpoint.strokes and not in_scene:
+                scene.addItem(item)
+            elif in_scene and stroke_id not in checkpoint.strokes:
+                scene.removeItem(item)
+
+        # detach everything first, items can only be inserted parentless
+        tree = self._paint.layers_tree
+        groups = None
+        if scene.mirror is not None:
+            groups = [group_index for group_index, stroke_ids
+                      in self._groups(_tree_state(tree.invisibleRootItem()))]
+        tree.invisibleRootItem().takeChildren()
+        for item, children in _flatten(checkpoint.tree):
+            item.takeChildren()
+            parent = item.parent()
+            if parent is not None:
+                parent.removeChild(item)
+
+        tree.addTopLevelItems([item for item, expanded, children
+                               in checkpoint.tree])
+        for item, expanded, children in checkpoint.tree:
+            self._restore_children(item, expanded, children)
+        if groups is not None:
+            self._publish_groups(groups, checkpoint.tree)
+
+    def _groups(self, state):
+        # group index to stroke indices of its layers, for every folder
+        for item, children in _flatten(state):
+            if isinstance(item, Folder):
+                yield item.group_index, [child.stroke_index
+                                         for child, expanded, grandchildren
+                                         in children
+                                         if isinstance(child, Layer)]
+
+    def _publish_groups(self, previous, state):
+        # commands skip their mirror updates while restoring, send the
+        # restored group structure instead
+        mirror = self._scene.mirror
+        restored = dict(self._groups(state))
+        for group_index in previous:
+            if group_index not in restored:
+                mirror.ungroup(group_index)
+        for group_index, stroke_ids in restored.items():
+            mirror.group(group_index, stroke_ids)
+
+    def _restore_children(self, item, expanded, children):
+        if children:
+            item.addChildren([child for child, child_expanded, grandchildren
+                              in children])
+            for child in children:
+                self._restore_children(*child)
+        if expanded:
+            item.setExpanded(True)
+
+
+class HistoryView(QtGui.QUndoView):
+    """
+    Undo history list that requests jumps instead of letting QUndoView step
+    the stack one command at a time, see HistoryCheckpoints. Rows are laid
+    out in batches so very long stacks populate lazily.
+
+    Attributes:
+        jumpRequested (SIGNAL): emitted with the undo stack index clicked
+    """
+    jumpRequested = QtCore.pyqtSignal(int)
+
+    def __init__(self, stack, batch_size=HISTORY_BATCH_SIZE, parent=None):
+        """
+        Args:
+            stack (QUndoStack): history shown
+            batch_size (int, optional): rows laid out per pass
+            parent (QWidget, optional): parent widget
+        """
+        super(HistoryView, self).__init__(stack, parent)
+        self.setUniformItemSizes(True)
+        self.setLayoutMode(QtGui.QListView.Batched)
+        self.setBatchSize(batch_size)
+
+        # QUndoModel moves the stack itself when the current row changes
+        selection = self.selectionModel()
+        QtCore.QObject.disconnect(
+            selection,
+            QtCore.SIGNAL('currentChanged(QModelIndex,QModelIndex)'),
+            self.model(), QtCore.SLOT('setStackCurrentIndex(QModelIndex)'))
+        selection.currentChanged.connect(self._current_changed)
+
+    def _current_changed(self, current, previous):
+        stack = self.stack()
+        if current.isValid() and stack is not None:
+            if current.row() != stack.index():
+                self.jumpRequested.emit(current.row())
@@ -1,3 +1,4 @@
+from collections import OrderedDict
 from PyQt4 import QtGui, QtCore
 
 
@@ -7,6 +8,8 @@ class LayerPanel(QtGui.QTreeWidget):
 
     Attributes:
         layerOrderChanged (SIGNAL): Emitted when layers change
+        thumbnails (ThumbnailCache): row previews drawn by the delegate,
+                                     None when disabled
     """
     layerOrderChanged = QtCore.pyqtSignal()
 
@@ -18,6 +21,20 @@ class LayerPanel(QtGui.QTreeWidget):
         super(LayerPanel, self).__init__(*args, **kwargs)
         self.setIndentation(0)
         self._setup_panel()
+        self.thumbnails = None
+
+        # selection cache, kept in sync from selection model signals
+        self._selection = OrderedDict()
+        self._selection_dirty = False
+        self._topmost_folder = None
+        self._topmost_dirty = False
+        self.selectionModel().selectionChanged.connect(
+            self._selection_changed)
+        model = self.model()
+        model.rowsInserted.connect(self._rows_inserted)
+        model.rowsRemoved.connect(self._rows_removed)
+        model.layoutChanged.connect(self._rows_removed)
+        model.modelReset.connect(self._rows_removed)
 
     def _setup_panel(self):
         """
@@ -41,6 +58,94 @@ class LayerPanel(QtGui.QTreeWidget):
         self.header().resizeSection(0, 30)
         self.header().setResizeMode(QtGui.QHeaderView.Fixed)
 
+    def _selection_changed(self, selected, deselected):
+        if self._selection_dirty:
+            return
+        for index in deselected.indexes():
+            if index.column() == 0:
+                self._selection.pop(self.itemFromIndex(index), None)
+        for index in selected.indexes():
+            if index.column() == 0:
+                self._selection[self.itemFromIndex(index)] = True
+        self._topmost_dirty = True
+
+    def _rows_inserted(self, *args):
+        # new rows are unselected but can change which folder is topmost
+        self._topmost_dirty = True
+
+    def _rows_removed(self, *args):
+        # selection model drops removed rows without selectionChanged
+        self._selection_dirty = True
+        self._topmost_dirty = True
+
+    def _sync_selection(self):
+        if self._selection_dirty:
+            self._selection = OrderedDict(
+                (item, True) for item in self.selectedItems())
+            self._selection_dirty = False
+
+    def selected_items(self):
+        """
+        selected items from the selection cache, cheaper than selectedItems
+
+        Returns:
+            list: selected items in selection order
+        """
+        self._sync_selection()
+        return list(self._selection)
+
+    def is_selected(self, item):
+        """
+        constant time selection test
+
+        Args:
+            item (QTreeWidgetItem): layer or folder
+
+        Returns:
+            bool: item is selected
+        """
+        self._sync_selection()
+        return item in self._selection
+
+    def has_selection(self):
+        """
+        whether anything is selected
+
+        Returns:
+            bool: selection is not empty
+        """
+        self._sync_selection()
+        return bool(self._selection)
+
+    def _tree_position(self, item):
+        position = []
+        while item is not None:
+            parent = item.parent()
+            if parent is not None:
+                position.append(parent.indexOfChild(item))
+            else:
+                position.append(self.indexOfTopLevelItem(item))
+            item = parent
+        return tuple(reversed(position))
+
+    def topmost_selected_folder(self):
+        """
+        selected Folder highest in the panel, cached until the selection or
+        rows change
+
+        Returns:
+            Folder: topmost selected folder, None if no folder is selected
+        """
+        self._sync_selection()
+        if self._topmost_dirty:
+            folders = [item for item in self._selection
+                       if isinstance(item, Folder)]
+            self._topmost_folder = None
+            if folders:
+                self._topmost_folder = min(folders, key=self._tree_position)
+            self._topmost_dirty = False
+        return self._topmost_folder
+
     def mousePressEvent(self, event):
         """
         Toggles visibility, expands/contracts folders
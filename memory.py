@@ -0,0 +1,328 @@
+import weakref
+from PyQt4 import QtGui, QtCore
+from shared import registry
+from strokes import StrokeItem, RasterItem, path_cache
+from buffers import buffer_pool
+
+# rough sizes of Qt internals, in bytes
+PATH_ELEMENT_BYTES = 24
+GRAPHICS_ITEM_BYTES = 400
+EFFECT_BYTES = 200
+PEN_BYTES = 64
+TREE_ITEM_BYTES = 300
+UNDO_COMMAND_BYTES = 150
+# scene.strokes dict entry & its name/color values
+STROKE_ENTRY_BYTES = 250
+
+
+def stroke_breakdown(item):
+    """
+    estimated bytes held by a committed stroke item, by component
+
+    Args:
+        item (QGraphicsItem): stroke item
+
+    Returns:
+        dict: item, geometry, path, outline, pen, effect & raster bytes
+    """
+    usage = {'item': GRAPHICS_ITEM_BYTES, 'geometry': 0, 'path': 0,
+             'outline': 0, 'pen': 0, 'effect': 0, 'raster': 0}
+    if isinstance(item, StrokeItem):
+        usage['pen'] = PEN_BYTES
+        usage['geometry'] = item.geometry.nbytes
+        usage['outline'] = item.outline_elements * PATH_ELEMENT_BYTES
+        if item.geometry in path_cache:
+            usage['path'] = len(item.geometry) * PATH_ELEMENT_BYTES
+    elif isinstance(item, RasterItem):
+        usage['raster'] = item.image.byteCount()
+    elif isinstance(item, QtGui.QGraphicsPixmapItem):
+        pixmap = item.pixmap()
+        usage['raster'] = pixmap.width() * pixmap.height() * 4
+    elif isinstance(item, QtGui.QAbstractGraphicsShapeItem):
+        usage['pen'] = PEN_BYTES
+        if isinstance(item, QtGui.QGraphicsPathItem):
+            usage['path'] = item.path().elementCount() * PATH_ELEMENT_BYTES
+    if item.graphicsEffect() is not None:
+        usage['effect'] = EFFECT_BYTES
+    return usage
+
+
+def stroke_bytes(item):
+    """
+    estimated bytes held by a committed stroke item
+
+    Args:
+        item (QGraphicsItem): stroke item
+
+    Returns:
+        int: bytes
+    """
+    return sum(stroke_breakdown(item).values())
+
+
+def _owned(item, breakdown, geometries, rasters):
+    # duplicates share geometry, cached path or pixels, the first item
+    # measured owns them & the rest count them as zero. Geometry is keyed on
+    # the object itself, an id could be reused once it is freed
+    if isinstance(item, StrokeItem):
+        owners, key, shared = geometries, item.geometry, ('geometry', 'path')
+    elif isinstance(item, RasterItem):
+        owners, key, shared = rasters, item.image.cacheKey(), ('raster',)
+    else:
+        return breakdown
+    if owners.setdefault(key, item) is item:
+        return breakdown
+    owned = dict(breakdown)
+    for name in shared:
+        owned[name] = 0
+    return owned
+
+
+def command_bytes(command):
+    """
+    estimated bytes held by an undo command itself, strokes it references
+    are counted with the strokes
+
+    Args:
+        command (QUndoCommand): undo command
+
+    Returns:
+        int: bytes
+    """
+    total = UNDO_COMMAND_BYTES + len(command.text()) * 2
+    for i in range(command.childCount()):
+        total += command_bytes(command.child(i))
+    return total
+
+
+def layer_item_bytes(item):
+    """
+    estimated bytes held by a layer panel row
+
+    Args:
+        item (QTreeWidgetItem): Layer or Folder
+
+    Returns:
+        int: bytes
+    """
+    return TREE_ITEM_BYTES + len(item.text(1)) * 2
+
+
+def _tree_items(tree):
+    iterator = QtGui.QTreeWidgetItemIterator(tree)
+    while iterator.value():
+        yield iterator.value()
+        iterator += 1
+
+
+def _overlay_bytes(scene):
+    # cursor preview, live stroke & its preview
+    total = 0
+    for item in scene.overlay_items():
+        total += stroke_bytes(item)
+    return total
+
+
+def _thumbnail_bytes(paint):
+    thumbnails = paint.layers_tree.thumbnails
+    return thumbnails.memory_usage() if thumbnails is not None else 0
+
+
+def instance_memory(paint):
+    """
+    estimated memory held by one PyQtPaint instance, split by subsystem.
+    Process wide shared resources are reported separately & geometry
+    shared by duplicated strokes is counted once.
+
+    Args:
+        paint (PyQtPaint): widget to measure
+
+    Returns:
+        dict: subsystem name to bytes, 'total' excludes 'shared'
+    """
+    scene = paint.paint_scene
+    strokes = 0
+    geometries, rasters = {}, {}
+    for stroke in scene.strokes.values():
+        item = stroke['stroke']
+        breakdown = _owned(item, stroke_breakdown(item), geometries, rasters)
+        strokes += sum(breakdown.values()) + STROKE_ENTRY_BYTES
+
+    layers = sum(layer_item_bytes(item)
+                 for item in _tree_items(paint.layers_tree))
+
+    undo = 0
+    for i in range(scene.undo_stack.count()):
+        undo += command_bytes(scene.undo_stack.command(i))
+
+    usage = {'strokes': strokes, 'layers': layers, 'undo': undo,
+             'overlays': _overlay_bytes(scene), 'tiles': 0, 'reference': 0,
+             'thumbnails': _thumbnail_bytes(paint)}
+    if scene.tile_cache is not None:
+        usage['tiles'] = scene.tile_cache.memory_usage()
+    if scene.reference is not None:
+        usage['reference'] = scene.reference.memory_usage()
+    usage['total'] = sum(usage.values())
+    usage['shared'] = (registry().memory_usage() +
+                       path_cache.elements * PATH_ELEMENT_BYTES +
+                       buffer_pool.nbytes)
+    return usage
+
+
+class MemoryMonitor(QtCore.QObject):
+    """
+    Incremental memory accounting for one PyQtPaint instance, cheap enough
+    to poll from a status bar. Stroke sizes are computed once & kept as a
+    running total; strokes report outline & geometry changes through
+    PaintScene.memory, see stroke_changed.
+
+    Attributes:
+        budget (int): bytes, 0 disables budget checks
+        memoryBudgetExceeded (SIGNAL): emitted with (used, budget) bytes
+                                       when usage crosses warn_ratio of the
+                                       budget
+        warn_ratio (float): fraction of budget that triggers the signal
+    """
+    memoryBudgetExceeded = QtCore.pyqtSignal(object, object)
+
+    def __init__(self, paint, budget=0, warn_ratio=0.9):
+        """
+        Args:
+            paint (PyQtPaint): widget to measure
+            budget (int, optional): bytes, 0 disables budget checks
+            warn_ratio (float, optional): fraction of budget that triggers
+                                          memoryBudgetExceeded
+        """
+        super(MemoryMonitor, self).__init__(paint)
+        self._paint = paint
+        self.budget = budget
+        self.warn_ratio = warn_ratio
+        self._stroke_sizes = {}
+        self._stroke_ids = {}
+        self._stroke_total = 0
+        # weak, replaced geometry must not be kept alive for accounting
+        self._geometry_owners = weakref.WeakKeyDictionary()
+        self._raster_owners = {}
+        self._exceeded = False
+        self._timer = None
+
+    def _stroke_size(self, item):
+        breakdown = _owned(item, stroke_breakdown(item),
+                           self._geometry_owners, self._raster_owners)
+        # cached paths come & go, they are counted as shared
+        return (sum(breakdown.values()) - breakdown['path'] +
+                STROKE_ENTRY_BYTES)
+
+    def _strokes(self):
+        strokes = self._paint.paint_scene.strokes
+        if len(self._stroke_sizes) != len(strokes):
+            # entries are only ever added
+            for stroke_id, stroke in strokes.items():
+                if stroke_id not in self._stroke_sizes:
+                    size = self._stroke_size(stroke['stroke'])
+                    self._stroke_sizes[stroke_id] = size
+                    self._stroke_ids[stroke['stroke']] = stroke_id
+                    self._stroke_total += size
+        return self._stroke_total
+
+    def stroke_changed(self, item):
+        """
+        updates the running total after a stroke's outline or geometry
+        changed, strokes not measured yet are measured on the next report
+
+        Args:
+            item (QGraphicsItem): stroke item
+        """
+        stroke_id = self._stroke_ids.get(item)
+        if stroke_id is None:
+            return
+        size = self._stroke_size(item)
+        self._stroke_total += size - self._stroke_sizes[stroke_id]
+        self._stroke_sizes[stroke_id] = size
+
+    def report(self, detail=False):
+        """
+        estimated memory by subsystem
+
+        Args:
+            detail (bool, optional): include per stroke, per undo command &
+                                     per layer figures, walks everything
+
+        Returns:
+            dict: subsystem name to bytes plus 'total', 'shared' &
+                  'budget'. With detail, 'per_stroke', 'per_command' &
+                  'per_layer' hold the individual estimates.
+        """
+        scene = self._paint.paint_scene
+        tree = self._paint.layers_tree
+
+        rows = tree.topLevelItemCount()
+        for i in range(tree.topLevelItemCount()):
+            rows += tree.topLevelItem(i).childCount()
+
+        usage = {'strokes': self._strokes(),
+                 'layers': rows * TREE_ITEM_BYTES,
+                 'undo': scene.undo_stack.count() * UNDO_COMMAND_BYTES,
+                 'overlays': _overlay_bytes(scene),
+                 'tiles': 0, 'reference': 0,
+                 'thumbnails': _thumbnail_bytes(self._paint)}
+        if scene.tile_cache is not None:
+            usage['tiles'] = scene.tile_cache.memory_usage()
+        if scene.reference is not None:
+            usage['reference'] = scene.reference.memory_usage()
+        usage['total'] = sum(usage.values())
+        usage['shared'] = (registry().memory_usage() +
+                           path_cache.elements * PATH_ELEMENT_BYTES +
+                           buffer_pool.nbytes)
+        usage['budget'] = self.budget
+
+        if detail:
+            usage['per_stroke'] = dict(
+                (stroke_id, stroke_breakdown(stroke['stroke']))
+                for stroke_id, stroke in scene.strokes.items())
+            usage['per_command'] = [
+                ('{}'.format(scene.undo_stack.command(i).text()),
+                 command_bytes(scene.undo_stack.command(i)))
+                for i in range(scene.undo_stack.count())]
+            usage['per_layer'] = [
+                ('{}'.format(item.text(1)), layer_item_bytes(item))
+                for item in _tree_items(tree)]
+        return usage
+
+    def check(self):
+        """
+        compares usage against the budget, emitting memoryBudgetExceeded
+        once per crossing
+
+        Returns:
+            dict: report, see report
+        """
+        usage = self.report()
+        if self.budget:
+            near = usage['total'] >= self.budget * self.warn_ratio
+            if near and not self._exceeded:
+                self.memoryBudgetExceeded.emit(usage['total'], self.budget)
+            self._exceeded = near
+        return usage
+
+    def set_budget(self, budget, warn_ratio=0.9, interval=1000):
+        """
+        sets budget & checks it on a timer
+
+        Args:
+            budget (int): bytes, 0 disables budget checks
+            warn_ratio (float, optional): fraction of budget that triggers
+                                          memoryBudgetExceeded
+            interval (int, optional): ms between checks
+        """
+        self.budget = budget
+        self.warn_ratio = warn_ratio
+        self._exceeded = False
+        if budget and self._timer is None:
+            self._timer = QtCore.QTimer(self)
+            self._timer.timeout.connect(self.check)
+        if self._timer is not None:
+            if budget:
+                self._timer.start(interval)
+            else:
+                self._timer.stop()
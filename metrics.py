@@ -0,0 +1,148 @@
+import time
+from collections import deque
+
+
+class RollingStat(object):
+    """
+    Fixed size window of samples with summary statistics
+
+    Attributes:
+        total (int): number of samples ever added
+    """
+    def __init__(self, window=120):
+        self._samples = deque(maxlen=window)
+        self.total = 0
+
+    def add(self, value):
+        """
+        adds sample to window
+
+        Args:
+            value (float): sample value
+        """
+        self._samples.append(value)
+        self.total += 1
+
+    def clear(self):
+        """
+        empties window
+        """
+        self._samples.clear()
+        self.total = 0
+
+    def stats(self):
+        """
+        summary of samples currently in window
+
+        Returns:
+            dict: last/mean/min/max/p95 of window, empty if no samples
+        """
+        if not self._samples:
+            return {}
+        ordered = sorted(self._samples)
+        count = len(ordered)
+        return {'last': self._samples[-1],
+                'mean': sum(ordered) / float(count),
+                'min': ordered[0],
+                'max': ordered[-1],
+                'p95': ordered[min(count - 1, int(count * 0.95))]}
+
+
+class FrameMetrics(object):
+    """
+    Rolling canvas instrumentation shared by PaintView & PaintScene
+
+    Attributes:
+        items_drawn (RollingStat): items intersecting each painted frame
+        layer_index_time (RollingStat): ms spent in update_layer_index
+        moves_applied (int): stroke moves that extended the path
+        moves_received (int): stroke moves received by the scene
+        paint_time (RollingStat): ms spent painting each frame
+    """
+    def __init__(self, window=120):
+        self._window = window
+        self.paint_time = RollingStat(window)
+        self.items_drawn = RollingStat(window)
+        self.layer_index_time = RollingStat(window)
+        self._input_times = deque(maxlen=window)
+        self.moves_received = 0
+        self.moves_applied = 0
+
+    def record_input(self):
+        """
+        timestamps input event, used for input events per second
+        """
+        self._input_times.append(time.time())
+
+    def input_rate(self):
+        """
+        input events per second over the recent window
+
+        Returns:
+            float: events per second
+        """
+        if len(self._input_times) < 2:
+            return 0.0
+        span = time.time() - self._input_times[0]
+        if span <= 0:
+            return 0.0
+        return len(self._input_times) / span
+
+    @property
+    def moves_coalesced(self):
+        """
+        stroke moves dropped because they did not change the path
+
+        Returns:
+            int: coalesced move count
+        """
+        return self.moves_received - self.moves_applied
+
+    def reset(self):
+        """
+        clears all recorded metrics
+        """
+        self.paint_time.clear()
+        self.items_drawn.clear()
+        self.layer_index_time.clear()
+        self._input_times.clear()
+        self.moves_received = 0
+        self.moves_applied = 0
+
+    def stats(self):
+        """
+        snapshot of all metrics
+
+        Returns:
+            dict: metric name to value/summary
+        """
+        return {'paint_ms': self.paint_time.stats(),
+                'frames': self.paint_time.total,
+                'items_drawn': self.items_drawn.stats(),
+                'layer_index_ms': self.layer_index_time.stats(),
+                'input_per_sec': self.input_rate(),
+                'moves_received': self.moves_received,
+                'moves_applied': self.moves_applied,
+                'moves_coalesced': self.moves_coalesced}
+
+    def hud_lines(self, stats):
+        """
+        formats stats for on canvas display
+
+        Args:
+            stats (dict): result of stats() plus undo_stack_size
+
+        Returns:
+            list: lines of text
+        """
+        paint = stats['paint_ms']
+        fps = 1000.0 / paint['mean'] if paint.get('mean') else 0.0
+        layer = stats['layer_index_ms']
+        return ['paint {:.2f}ms (p95 {:.2f}ms, {:.0f} fps max)'.format(
+                    paint.get('mean', 0.0), paint.get('p95', 0.0), fps),
+                'items {:.0f}'.format(stats['items_drawn'].get('last', 0)),
+                'input {:.0f}/s'.format(stats['input_per_sec']),
+                'moves {} applied / {} coalesced'.format(
+                    stats['moves_applied'], stats['moves_coalesced']),
+                'layer index {:.2f}ms'.format(layer.get('last', 0.0)),
+                'undo stack {}'.format(stats['undo_stack_size'])]
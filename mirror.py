@@ -0,0 +1,502 @@
+"""
+Live mirroring of a PaintScene to other processes.
+
+Usage:
+    python mirror.py SERVER_NAME
+
+Opens a read-only window mirroring the canvas published under SERVER_NAME
+with PyQtPaint.start_mirror.
+
+The publisher streams compact binary deltas over a QLocalServer: live
+stroke points, committed strokes, removals, visibility, stacking order and
+grouping. Transformed strokes, e.g. duplicates & symmetry copies, are
+followed by their transform. Each message is a type byte, the send time &
+a payload length followed by the payload.
+"""
+import sys
+import time
+import struct
+from PyQt4 import QtGui, QtCore, QtNetwork
+from metrics import RollingStat
+from strokes import StrokeGeometry, StrokeItem, RasterItem, StrokeBlurEffect
+
+# message types
+HELLO = 1
+BEGIN = 2
+POINTS = 3
+COMMIT = 4
+ADD = 5
+RASTER = 6
+REMOVE = 7
+VISIBILITY = 8
+ZORDER = 9
+GROUP = 10
+UNGROUP = 11
+TRANSFORM = 12
+
+_HEADER = struct.Struct('<BdI')
+_HELLO = struct.Struct('<II')
+_BEGIN = struct.Struct('<IfHff')
+_POINT = struct.Struct('<ff')
+_COUNT = struct.Struct('<I')
+_COMMIT = struct.Struct('<iI')
+_ADD = struct.Struct('<iIfHf?')
+_RASTER = struct.Struct('<iffI')
+_ID = struct.Struct('<i')
+_VISIBILITY = struct.Struct('<i?')
+_ZORDER = struct.Struct('<if')
+_TRANSFORM = struct.Struct('<i6f')
+
+
+def _message(kind, payload=b''):
+    return _HEADER.pack(kind, time.time(), len(payload)) + payload
+
+
+def _name(value):
+    return '{}'.format(value).encode('utf-8')
+
+
+class StreamPublisher(QtCore.QObject):
+    """
+    Publishes a PaintScene's edits to local socket subscribers. PaintScene
+    reports edits through its mirror attribute; messages are batched &
+    written once per event loop pass.
+
+    Attributes:
+        bytes_sent (int): bytes written to all subscribers
+    """
+    def __init__(self, scene, name):
+        """
+        Args:
+            scene (PaintScene): scene to publish
+            name (str): local server name
+        """
+        super(StreamPublisher, self).__init__(scene)
+        self._scene = scene
+        self._sockets = []
+        self._queue = []
+        self._points = []
+        self._live = None
+        self._ids = {}
+        self._id_count = 0
+        self.bytes_sent = 0
+
+        self._server = QtNetwork.QLocalServer(self)
+        QtNetwork.QLocalServer.removeServer(name)
+        if not self._server.listen(name):
+            raise IOError('cannot listen on {}: {}'.format(
+                name, self._server.errorString()))
+        self._server.newConnection.connect(self._connect)
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.flush)
+
+    def close(self):
+        """
+        stops publishing & disconnects subscribers
+        """
+        self.flush()
+        for socket in self._sockets:
+            socket.disconnectFromServer()
+        self._sockets = []
+        self._server.close()
+
+    def _connect(self):
+        while self._server.hasPendingConnections():
+            socket = self._server.nextPendingConnection()
+            socket.disconnected.connect(socket.deleteLater)
+            self.flush()
+            snapshot = self._snapshot()
+            self.bytes_sent += len(snapshot)
+            socket.write(snapshot)
+            self._sockets.append(socket)
+
+    def _snapshot(self):
+        # current canvas for a new subscriber
+        scene = self._scene
+        data = [_message(HELLO, _HELLO.pack(int(scene.width),
+                                            int(scene.height)))]
+        for stroke_id in sorted(scene.strokes):
+            stroke = scene.strokes[stroke_id]
+            item = stroke['stroke']
+            if item.scene() is not scene:
+                continue
+            data.append(self._encode_item(stroke_id, stroke['name'], item))
+        if self._live is not None:
+            pen, blur, points = self._live
+            data.append(self._encode_begin(pen, blur, points[0]))
+            if len(points) > 1:
+                data.append(self._encode_points(points[1:]))
+        return b''.join(data)
+
+    def _encode_begin(self, pen, blur, point):
+        return _message(BEGIN, _BEGIN.pack(pen.color().rgba(), pen.widthF(),
+                                           int(blur), point[0], point[1]))
+
+    def _encode_points(self, points):
+        payload = [_COUNT.pack(len(points))]
+        payload.extend(_POINT.pack(x, y) for x, y in points)
+        return _message(POINTS, b''.join(payload))
+
+    def _encode_item(self, stroke_id, name, item):
+        name = _name(name)
+        if isinstance(item, RasterItem):
+            data = QtCore.QByteArray()
+            buffer = QtCore.QBuffer(data)
+            buffer.open(QtCore.QIODevice.WriteOnly)
+            item.image.save(buffer, 'PNG')
+            buffer.close()
+            png = bytes(data)
+            offset = item.offset
+            payload = (_RASTER.pack(stroke_id, offset.x(), offset.y(),
+                                    len(name)) + name + png)
+            message = _message(RASTER, payload)
+        else:
+            pen = item.pen()
+            effect = item.graphicsEffect()
+            blur = effect.blurRadius() if effect is not None else 0
+            payload = (_ADD.pack(stroke_id, pen.color().rgba(), pen.widthF(),
+                                 int(blur), item.zValue(), item.isVisible()) +
+                       _COUNT.pack(len(name)) + name +
+                       item.geometry.to_bytes())
+            message = _message(ADD, payload)
+        transform = item.transform()
+        if not transform.isIdentity():
+            message += _message(TRANSFORM, _TRANSFORM.pack(
+                stroke_id, transform.m11(), transform.m12(), transform.m21(),
+                transform.m22(), transform.dx(), transform.dy()))
+        return message
+
+    def _schedule(self):
+        if not self._timer.isActive():
+            self._timer.start(0)
+
+    def _queue_points(self):
+        if self._points:
+            self._queue.append((POINTS, self._points))
+            self._points = []
+
+    def _enqueue(self, kind, *args):
+        self._queue_points()
+        self._queue.append((kind,) + args)
+        self._schedule()
+
+    # hooks called by PaintScene
+
+    def begin_stroke(self, position, pen, blur):
+        point = (position.x(), position.y())
+        self._live = (pen, blur, [point])
+        self._enqueue(BEGIN, pen, blur, point)
+
+    def stroke_point(self, position):
+        if self._live is None:
+            return
+        point = (position.x(), position.y())
+        self._live[2].append(point)
+        self._points.append(point)
+        self._schedule()
+
+    def end_stroke(self, item):
+        self._live = None
+        self._enqueue(COMMIT, item)
+
+    def item_added(self, item):
+        if isinstance(item, (StrokeItem, RasterItem)):
+            self._enqueue(ADD, item)
+
+    def item_removed(self, item):
+        if isinstance(item, (StrokeItem, RasterItem)):
+            self._enqueue(REMOVE, item)
+
+    def visibility_changed(self, item):
+        self._enqueue(VISIBILITY, item)
+
+    def z_changed(self, item):
+        self._enqueue(ZORDER, item)
+
+    def group(self, group_id, stroke_ids):
+        self._enqueue(GROUP, group_id, list(stroke_ids))
+
+    def ungroup(self, group_id):
+        self._enqueue(UNGROUP, group_id)
+
+    def _stroke_ids(self):
+        # item id to stroke index, committed strokes are in scene.strokes by
+        # the time we flush. Entries are only ever added, so the map is only
+        # rebuilt when the scene gained strokes
+        strokes = self._scene.strokes
+        if len(strokes) != self._id_count:
+            self._ids = dict((id(stroke['stroke']), stroke_id)
+                             for stroke_id, stroke in strokes.items())
+            self._id_count = len(strokes)
+        return self._ids
+
+    def flush(self):
+        """
+        encodes queued edits & writes them to every subscriber
+        """
+        self._queue_points()
+        if not self._queue:
+            return
+        queue, self._queue = self._queue, []
+
+        if any(entry[0] not in (POINTS, BEGIN, GROUP, UNGROUP)
+               for entry in queue):
+            ids = self._stroke_ids()
+
+        data = []
+        committed = set()
+        for entry in queue:
+            kind = entry[0]
+            if kind == POINTS:
+                data.append(self._encode_points(entry[1]))
+            elif kind == BEGIN:
+                data.append(self._encode_begin(*entry[1:]))
+            elif kind == GROUP:
+                payload = [_ID.pack(entry[1]), _COUNT.pack(len(entry[2]))]
+                payload.extend(_ID.pack(i) for i in entry[2])
+                data.append(_message(GROUP, b''.join(payload)))
+            elif kind == UNGROUP:
+                data.append(_message(UNGROUP, _ID.pack(entry[1])))
+            else:
+                item = entry[1]
+                if id(item) not in ids:
+                    continue
+                stroke_id = ids[id(item)]
+                name = self._scene.strokes[stroke_id]['name']
+                if kind == COMMIT:
+                    # subscriber already has the points
+                    committed.add(id(item))
+                    name = _name(name)
+                    data.append(_message(COMMIT, _COMMIT.pack(
+                        stroke_id, len(name)) + name))
+                elif kind == ADD:
+                    if id(item) in committed:
+                        committed.discard(id(item))
+                        continue
+                    data.append(self._encode_item(stroke_id, name, item))
+                elif kind == REMOVE:
+                    data.append(_message(REMOVE, _ID.pack(stroke_id)))
+                elif kind == VISIBILITY:
+                    data.append(_message(VISIBILITY, _VISIBILITY.pack(
+                        stroke_id, item.isVisible())))
+                elif kind == ZORDER:
+                    data.append(_message(ZORDER, _ZORDER.pack(
+                        stroke_id, item.zValue())))
+
+        data = b''.join(data)
+        for socket in list(self._sockets):
+            if socket.state() != QtNetwork.QLocalSocket.ConnectedState:
+                self._sockets.remove(socket)
+                continue
+            socket.write(data)
+            self.bytes_sent += len(data)
+
+
+class StreamSubscriber(QtCore.QObject):
+    """
+    Applies a published stream to a local, read-only PaintScene
+
+    Attributes:
+        bytes_received (int): bytes read from the publisher
+        disconnected (SIGNAL): emitted when the publisher goes away
+        groups (dict): group index to stroke indices
+        latency (RollingStat): ms from publish to apply per message
+        scene (PaintScene): mirrored scene, created on the first message
+        sceneReady (SIGNAL): emitted once the mirrored scene exists
+    """
+    sceneReady = QtCore.pyqtSignal(object)
+    disconnected = QtCore.pyqtSignal()
+
+    def __init__(self, name, parent=None):
+        """
+        Args:
+            name (str): local server name to connect to
+            parent (QObject, optional): parent object
+        """
+        super(StreamSubscriber, self).__init__(parent)
+        self.scene = None
+        self.groups = {}
+        self.latency = RollingStat(1000)
+        self.bytes_received = 0
+        self._buffer = b''
+        self._live = None
+        self._live_points = []
+
+        self._socket = QtNetwork.QLocalSocket(self)
+        self._socket.readyRead.connect(self._read)
+        self._socket.disconnected.connect(self.disconnected)
+        self._socket.connectToServer(name)
+
+    def close(self):
+        """
+        disconnects from publisher
+        """
+        self._socket.disconnectFromServer()
+
+    def _read(self):
+        data = bytes(self._socket.readAll())
+        self.bytes_received += len(data)
+        self._buffer += data
+        offset = 0
+        while len(self._buffer) - offset >= _HEADER.size:
+            kind, sent, length = _HEADER.unpack_from(self._buffer, offset)
+            end = offset + _HEADER.size + length
+            if end > len(self._buffer):
+                break
+            self._apply(kind, self._buffer[offset + _HEADER.size:end])
+            self.latency.add((time.time() - sent) * 1000.0)
+            offset = end
+        self._buffer = self._buffer[offset:]
+
+    def _add(self, stroke_id, name, item):
+        scene = self.scene
+        old = scene.strokes.get(stroke_id)
+        if old is not None and old['stroke'].scene() is scene:
+            scene.removeItem(old['stroke'])
+        scene.strokes[stroke_id] = {'stroke': item, 'name': name,
+                                    'color': QtGui.QColor(0, 0, 0, 0),
+                                    'size': 0, 'blur': 0}
+        if isinstance(item, StrokeItem):
+            effect = item.graphicsEffect()
+            scene.strokes[stroke_id].update(
+                {'color': item.pen().color(), 'size': item.pen().width(),
+                 'blur': effect.blurRadius() if effect else 0})
+        scene.addItem(item)
+        scene.next_stroke = max(scene.next_stroke, stroke_id)
+
+    def _item(self, stroke_id):
+        stroke = self.scene.strokes.get(stroke_id)
+        return stroke['stroke'] if stroke is not None else None
+
+    def _apply(self, kind, payload):
+        if kind == HELLO:
+            from canvas import PaintScene
+            width, height = _HELLO.unpack(payload)
+            self.scene = PaintScene(0, 0, width, height, self)
+            self.scene.set_cursor_visible(False)
+            self.sceneReady.emit(self.scene)
+            return
+        if self.scene is None:
+            return
+
+        if kind == BEGIN:
+            rgba, width, blur, x, y = _BEGIN.unpack(payload)
+            self._end_live()
+            pen = QtGui.QPen(QtGui.QColor.fromRgba(rgba), width,
+                             QtCore.Qt.SolidLine, QtCore.Qt.RoundCap,
+                             QtCore.Qt.RoundJoin)
+            self._live = self.scene.addPath(
+                QtGui.QPainterPath(QtCore.QPointF(x, y)), pen)
+            self._live.setGraphicsEffect(StrokeBlurEffect(blur))
+            self._live.setZValue(self.scene.next_stroke + 1)
+            self._live_points = [(x, y)]
+        elif kind == POINTS:
+            if self._live is None:
+                return
+            count = _COUNT.unpack_from(payload)[0]
+            points = struct.unpack_from('<{}f'.format(count * 2), payload,
+                                        _COUNT.size)
+            path = self._live.path()
+            for i in range(0, len(points), 2):
+                path.lineTo(points[i], points[i + 1])
+                self._live_points.append((points[i], points[i + 1]))
+            self._live.setPath(path)
+        elif kind == COMMIT:
+            stroke_id, length = _COMMIT.unpack_from(payload)
+            name = payload[_COMMIT.size:_COMMIT.size + length].decode('utf-8')
+            if self._live is None:
+                return
+            live = self._live
+            stroke = StrokeItem(StrokeGeometry.from_points(self._live_points),
+                                live.pen())
+            stroke.setGraphicsEffect(
+                StrokeBlurEffect(live.graphicsEffect().blurRadius()))
+            self._end_live()
+            self._add(stroke_id, name, stroke)
+        elif kind == ADD:
+            stroke_id, rgba, width, blur, z, visible = _ADD.unpack_from(
+                payload)
+            offset = _ADD.size
+            length = _COUNT.unpack_from(payload, offset)[0]
+            offset += _COUNT.size
+            name = payload[offset:offset + length].decode('utf-8')
+            geometry = StrokeGeometry.from_bytes(payload, offset + length)[0]
+            pen = QtGui.QPen(QtGui.QColor.fromRgba(rgba), width,
+                             QtCore.Qt.SolidLine, QtCore.Qt.RoundCap,
+                             QtCore.Qt.RoundJoin)
+            stroke = StrokeItem(geometry, pen)
+            stroke.setGraphicsEffect(StrokeBlurEffect(blur))
+            stroke.setZValue(z)
+            stroke.setVisible(visible)
+            self._add(stroke_id, name, stroke)
+        elif kind == RASTER:
+            stroke_id, x, y, length = _RASTER.unpack_from(payload)
+            offset = _RASTER.size
+            name = payload[offset:offset + length].decode('utf-8')
+            image = QtGui.QImage.fromData(payload[offset + length:], 'PNG')
+            image = image.convertToFormat(
+                QtGui.QImage.Format_ARGB32_Premultiplied)
+            self._add(stroke_id, name,
+                      RasterItem(image, QtCore.QPointF(x, y)))
+        elif kind == TRANSFORM:
+            values = _TRANSFORM.unpack(payload)
+            item = self._item(values[0])
+            if item is not None:
+                item.setTransform(QtGui.QTransform(*values[1:]))
+        elif kind == REMOVE:
+            stroke_id = _ID.unpack(payload)[0]
+            self.groups.pop(stroke_id, None)
+            item = self._item(stroke_id)
+            if item is not None and item.scene() is self.scene:
+                self.scene.removeItem(item)
+        elif kind == VISIBILITY:
+            stroke_id, visible = _VISIBILITY.unpack(payload)
+            if self._item(stroke_id) is not None:
+                self.scene.toggle_layer_visibility(stroke_id, visible)
+        elif kind == ZORDER:
+            stroke_id, z = _ZORDER.unpack(payload)
+            if self._item(stroke_id) is not None:
+                self.scene.set_stroke_zindex(stroke_id, z)
+        elif kind == GROUP:
+            group_id = _ID.unpack_from(payload)[0]
+            count = _COUNT.unpack_from(payload, _ID.size)[0]
+            self.groups[group_id] = list(struct.unpack_from(
+                '<{}i'.format(count), payload, _ID.size + _COUNT.size))
+        elif kind == UNGROUP:
+            self.groups.pop(_ID.unpack(payload)[0], None)
+
+    def _end_live(self):
+        if self._live is not None:
+            self.scene.removeItem(self._live)
+            self._live = None
+            self._live_points = []
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n\n')[0])
+    parser.add_argument('name')
+    args = parser.parse_args(argv)
+
+    app = QtGui.QApplication.instance() or QtGui.QApplication(sys.argv)
+    view = QtGui.QGraphicsView()
+    view.setRenderHints(QtGui.QPainter.Antialiasing)
+    view.setInteractive(False)
+    view.setWindowTitle('Mirror: {}'.format(args.name))
+    view.resize(1200, 800)
+
+    subscriber = StreamSubscriber(args.name)
+
+    def show(scene):
+        view.setScene(scene)
+        view.fitInView(scene.sceneRect(), QtCore.Qt.KeepAspectRatio)
+        view.show()
+    subscriber.sceneReady.connect(show)
+    subscriber.disconnected.connect(app.quit)
+    return app.exec_()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
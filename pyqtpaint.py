@@ -1,12 +1,26 @@
 import sys
-from PyQt4 import QtGui, QtCore, uic
+import time
+from contextlib import contextmanager
+from PyQt4 import QtGui, QtCore
 from canvas import PaintScene, PaintView
-from canvas import DeleteStroke, GroupStrokes, DeleteGroup
+from canvas import DeleteStroke, GroupStrokes, DeleteGroup, FlattenStrokes
+from canvas import AddStrokes
 from layers import LayerPanel, Layer, Folder
+from strokes import duplicate_stroke
 from delegate import TreeDelegate
-
-
-class PyQtPaint(QtGui.QWidget):
+from tracing import span
+from memory import instance_memory, MemoryMonitor
+from history import HistoryCheckpoints
+from thumbnails import ThumbnailCache
+from quality import IDLE_MS, MIN_STROKES
+import export
+import buffers
+from recording import InputRecorder, RECORDED_ACTIONS
+from ui_pyqtpaint import Ui_Form
+import pyqtpaint_rc  # noqa: F401 registers :/img icons
+
+
+class PyQtPaint(QtGui.QWidget, Ui_Form):
     """
     Canvas based painting ui w/ brush control, layers, undo functionality
 
@@ -14,18 +28,36 @@ class PyQtPaint(QtGui.QWidget):
         color_dialog (QColorDialog): Color Picker
         file_dialog (QFileDialog): Filepath picker for saving img externally
         layers_tree (QTreeWidgetItem): Tree widget acting as a layers panel
+        memoryBudgetExceeded (SIGNAL): emitted with (used, budget) bytes when
+                                       the document nears its memory budget
         paint_scene (QGraphicsScene): graphics scene storing/maintaing stroke
                                       information
     Args:
         width (int): width of PyQtPaint
         height (int): height of PyQtPaint
     """
+    memoryBudgetExceeded = QtCore.pyqtSignal(object, object)
+
     def __init__(self, width, height, *args, **kwargs):
         super(PyQtPaint, self).__init__(*args, **kwargs)
-        uic.loadUi('ui/pyqtpaint.ui', self)
+        # ui is compiled ahead of time from ui/pyqtpaint.ui
+        self.setupUi(self)
+
+        # dialogs are created on first use
+        self._file_dialog = None
+        self._color_dialog = None
+
+        # input recording
+        self._recorder = None
+        self._record_slots = []
+
+        # queued layer panel updates, see batched_layer_updates
+        self._layer_batch = None
 
         self._paint_view = PaintView()
         self._paint_view.setRenderHints(QtGui.QPainter.HighQualityAntialiasing)
+        # cheaper hints while drawing, resizing or scrolling
+        self._paint_view.set_adaptive_quality()
 
         self.paint_scene = PaintScene(0, 0, width, height, None)
         self._paint_view.setScene(self.paint_scene)
@@ -34,17 +66,47 @@ class PyQtPaint(QtGui.QWidget):
         self._create_actions()
         self._make_connections()
 
+        self.paint_scene.history = HistoryCheckpoints(self)
+        self.layers_tree.thumbnails = ThumbnailCache(self)
+
+        self._memory_monitor = MemoryMonitor(self)
+        self.paint_scene.memory = self._memory_monitor
+        self._memory_monitor.memoryBudgetExceeded.connect(
+            self.memoryBudgetExceeded)
+
     def _setup_ui(self):
         self.viewport_widget.layout().addWidget(self._paint_view)
         self.layers_tree = LayerPanel(dragToggleColumns=[0], columns=['', ''])
-        self.layers_tree.setItemDelegate(TreeDelegate())
+        # one delegate per panel, its pixmaps & pens come from the registry
+        self.layers_tree.setItemDelegate(TreeDelegate(self.layers_tree))
         self.layers_widget.layout().addWidget(self.layers_tree)
 
-        self.file_dialog = QtGui.QFileDialog(self)
-        self.color_dialog = QtGui.QColorDialog()
-
         self._update_brush_ui()
 
+    @property
+    def file_dialog(self):
+        """
+        filepath picker for saving img externally, created on first use
+
+        Returns:
+            QFileDialog: file dialog
+        """
+        if self._file_dialog is None:
+            self._file_dialog = QtGui.QFileDialog(self)
+        return self._file_dialog
+
+    @property
+    def color_dialog(self):
+        """
+        color picker, created on first use
+
+        Returns:
+            QColorDialog: color dialog
+        """
+        if self._color_dialog is None:
+            self._color_dialog = QtGui.QColorDialog()
+        return self._color_dialog
+
     def _create_actions(self):
         self.undo_action = QtGui.QAction('Undo', self)
         self.undo_action.setShortcut('Ctrl+Z')
@@ -62,6 +124,23 @@ class PyQtPaint(QtGui.QWidget):
         self.group_action.setShortcut('Ctrl+G')
         self.addAction(self.group_action)
 
+        self.flatten_action = QtGui.QAction('Flatten', self)
+        self.flatten_action.setShortcut('Ctrl+E')
+        self.addAction(self.flatten_action)
+
+        self.duplicate_action = QtGui.QAction('Duplicate', self)
+        self.duplicate_action.setShortcut('Ctrl+J')
+        self.addAction(self.duplicate_action)
+
+        self.reference_action = QtGui.QAction('Open Reference', self)
+        self.reference_action.setShortcut('Ctrl+O')
+        self.addAction(self.reference_action)
+
+        self.eyedropper_action = QtGui.QAction('Eyedropper', self)
+        self.eyedropper_action.setShortcut('I')
+        self.eyedropper_action.setCheckable(True)
+        self.addAction(self.eyedropper_action)
+
         self.save_action = QtGui.QAction('Save', self)
         self.save_action.setShortcut('Ctrl+S')
         self.addAction(self.save_action)
@@ -82,9 +161,24 @@ class PyQtPaint(QtGui.QWidget):
         self.brush_harder_action.setShortcut('}')
         self.addAction(self.brush_harder_action)
 
+        self.zoom_in_action = QtGui.QAction('Zoom In', self)
+        self.zoom_in_action.setShortcut('Ctrl+=')
+        self.addAction(self.zoom_in_action)
+
+        self.zoom_out_action = QtGui.QAction('Zoom Out', self)
+        self.zoom_out_action.setShortcut('Ctrl+-')
+        self.addAction(self.zoom_out_action)
+
+        self.fit_canvas_action = QtGui.QAction('Fit Canvas', self)
+        self.fit_canvas_action.setShortcut('Ctrl+0')
+        self.addAction(self.fit_canvas_action)
+
     def _make_connections(self):
         self.paint_scene.strokeAdded.connect(self.create_layer_item)
         self.paint_scene.strokeRemoved.connect(self.remove_layer_item)
+        self.paint_scene.strokesAdded.connect(self.create_layer_items)
+        self.paint_scene.strokesRemoved.connect(self.remove_layer_items)
+        self.paint_scene.strokeChanged.connect(self._stroke_changed)
 
         self.paint_scene.brushChanged.connect(self._update_brush_ui)
         self.size_SLD.valueChanged.connect(lambda: self.set_pen_size(self.size_SLD.value()))
@@ -95,13 +189,24 @@ class PyQtPaint(QtGui.QWidget):
         self.brush_softer_action.triggered.connect(lambda: self.paint_scene.increment_pen_blur(1))
         self.brush_harder_action.triggered.connect(lambda: self.paint_scene.increment_pen_blur(-1))
 
+        self.zoom_in_action.triggered.connect(lambda: self._paint_view.zoom_by(1.25))
+        self.zoom_out_action.triggered.connect(lambda: self._paint_view.zoom_by(0.8))
+        self.fit_canvas_action.triggered.connect(self._paint_view.fit_canvas)
+
         self.redo_action.triggered.connect(self.paint_scene.undo_stack.redo)
         self.undo_action.triggered.connect(self.paint_scene.undo_stack.undo)
 
         self.delete_action.triggered.connect(self.delete_layer)
         self.group_action.triggered.connect(self.group_layers)
+        self.flatten_action.triggered.connect(self.flatten_layers)
+        self.duplicate_action.triggered.connect(self.duplicate_layers)
+
+        self.eyedropper_action.toggled.connect(
+            self._paint_view.set_eyedropper)
+        self._paint_view.colorSampled.connect(self.set_pen_color)
 
         self.save_action.triggered.connect(self.save_img)
+        self.reference_action.triggered.connect(self.open_reference)
 
         self.layers_tree.itemChanged.connect(self.layer_change)
         self.layers_tree.layerOrderChanged.connect(self.update_layer_index)
@@ -129,23 +234,38 @@ class PyQtPaint(QtGui.QWidget):
             layer_name (str): name of stroke layer
 
         """
-        stroke_info = ['', layer_name]
-        layer = Layer(stroke_info, stroke_index=stroke_id)
+        if self._layer_batch is not None:
+            self._layer_batch.append((True, stroke_id, layer_name))
+            return
+        with span(self.paint_scene.tracer, 'PyQtPaint.create_layer_item',
+                  {'stroke': stroke_id}):
+            stroke_info = ['', layer_name]
+            layer = Layer(stroke_info, stroke_index=stroke_id)
+
+            highest_group = self.layers_tree.topmost_selected_folder()
+            if highest_group:
+                highest_group.insertChild(0, layer)
+            else:
+                self.layers_tree.insertTopLevelItem(0, layer)
+            self.update_layer_index()
+
+    def create_layer_items(self, strokes):
+        """
+        Creates layer items for strokes added in bulk, the layer panel and
+        stacking order are updated once
 
-        highest_group = None
-        if self.layers_tree.selectedItems():
-            iterator = QtGui.QTreeWidgetItemIterator(self.layers_tree)
-            while iterator.value():
-                item = iterator.value()
-                if isinstance(item, Folder) and item in self.layers_tree.selectedItems():
-                    highest_group = item
-                    break
-                iterator += 1
-        if highest_group:
-            highest_group.insertChild(0, layer)
-        else:
-            self.layers_tree.insertTopLevelItem(0, layer)
-        self.update_layer_index()
+        Args:
+            strokes (list): (stroke index, layer name) pairs in drawing order
+
+        """
+        if self._layer_batch is not None:
+            self._layer_batch.extend((True, stroke_id, name)
+                                     for stroke_id, name in strokes)
+            return
+        with span(self.paint_scene.tracer, 'PyQtPaint.create_layer_items',
+                  {'count': len(strokes)}):
+            self._insert_layer_items(strokes)
+            self.update_layer_index()
 
     def remove_layer_item(self, stroke_id):
         """
@@ -155,6 +275,9 @@ class PyQtPaint(QtGui.QWidget):
             stroke_id (int): unique index of stroke to be removed
 
         """
+        if self._layer_batch is not None:
+            self._layer_batch.append((False, stroke_id, None))
+            return
         iterator = QtGui.QTreeWidgetItemIterator(self.layers_tree)
 
         while iterator.value():
@@ -182,6 +305,121 @@ class PyQtPaint(QtGui.QWidget):
                         self.layers_tree.takeTopLevelItem(idx)
             iterator += 1
 
+    def remove_layer_items(self, stroke_ids):
+        """
+        deletes layer items of several strokes or groups in one pass over
+        the panel
+
+        Args:
+            stroke_ids (list): unique indices of strokes/groups to be removed
+
+        """
+        if self._layer_batch is not None:
+            self._layer_batch.extend((False, stroke_id, None)
+                                     for stroke_id in stroke_ids)
+            return
+        stroke_ids = set(stroke_ids)
+        remove_these = []
+        iterator = QtGui.QTreeWidgetItemIterator(self.layers_tree)
+        while iterator.value():
+            item = iterator.value()
+            if ((isinstance(item, Layer) and
+                 item.stroke_index in stroke_ids) or
+                    (isinstance(item, Folder) and
+                     item.group_index in stroke_ids)):
+                remove_these.append(item)
+            iterator += 1
+
+        for item in remove_these:
+            parent = item.parent()
+            if parent:
+                parent.takeChild(parent.indexOfChild(item))
+            else:
+                self.layers_tree.takeTopLevelItem(
+                    self.layers_tree.indexOfTopLevelItem(item))
+
+    @contextmanager
+    def batched_layer_updates(self):
+        """
+        queues layer panel changes from scene signals & applies them once
+        the block exits, consecutive adds/removes in one pass each. Stacking
+        order is updated once at the end.
+        """
+        if self._layer_batch is not None:
+            yield
+            return
+        self._layer_batch = []
+        self.layers_tree.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self.flush_layer_updates()
+            self._layer_batch = None
+            self.update_layer_index()
+            self.layers_tree.setUpdatesEnabled(True)
+
+    def flush_layer_updates(self):
+        """
+        applies layer panel changes queued by batched_layer_updates, used by
+        commands that edit the layer panel directly so they find every layer
+        """
+        if not self._layer_batch:
+            return
+        batch, self._layer_batch = self._layer_batch, None
+        try:
+            run = []
+            for change in batch + [None]:
+                if run and (change is None or change[0] != run[0][0]):
+                    if run[0][0]:
+                        self._insert_layer_items([(stroke_id, name) for
+                                                  added, stroke_id, name
+                                                  in run])
+                    else:
+                        self.remove_layer_items([stroke_id for
+                                                 added, stroke_id, name
+                                                 in run])
+                    run = []
+                if change is not None:
+                    run.append(change)
+        finally:
+            self._layer_batch = []
+
+    def _insert_layer_items(self, strokes):
+        # newest stroke is on top
+        layers = [Layer(['', name], stroke_index=stroke_id)
+                  for stroke_id, name in reversed(strokes)]
+        highest_group = self.layers_tree.topmost_selected_folder()
+        if highest_group:
+            highest_group.insertChildren(0, layers)
+        else:
+            self.layers_tree.insertTopLevelItems(0, layers)
+
+    def add_strokes(self, points, color=None, size=None, blur=None):
+        """
+        adds generated strokes as one undo entry, see PaintScene.add_strokes
+
+        Args:
+            points (list): (n, 2) numpy arrays or sequences of (x, y) pairs,
+                           one per stroke
+            color (QColor, optional): stroke color, defaults to current pen
+            size (float, optional): brush diameter, defaults to current pen
+            blur (int, optional): brush softness, defaults to current pen
+
+        Returns:
+            list: indices of new strokes
+        """
+        return self.paint_scene.add_strokes(points, color, size, blur)
+
+    def jump_to_history(self, index):
+        """
+        moves to a point in history, restoring the nearest checkpoint & only
+        replaying the remaining commands, see HistoryCheckpoints
+
+        Args:
+            index (int): undo stack index, 0 is the empty canvas
+        """
+        self.paint_scene.jump_to_history(index)
+
     def layer_change(self, item, column):
         """
         updates stroke information, used when updating visibility or layer name
@@ -191,6 +429,9 @@ class PyQtPaint(QtGui.QWidget):
             column (int): column to change
         """
         if column == 0:
+            if self._recorder is not None:
+                self._recorder.visibility(self._layer_id(item), item.visible)
+
             if isinstance(item, Layer):
                 self.paint_scene.toggle_layer_visibility(item.stroke_index,
                                                          item.visible)
@@ -215,7 +456,7 @@ class PyQtPaint(QtGui.QWidget):
         """
         Deletes selected layers
         """
-        for item in self.layers_tree.selectedItems():
+        for item in self.layers_tree.selected_items():
             # remove item.stroke_index
             if isinstance(item, Layer):
                 if item.parent():
@@ -234,20 +475,116 @@ class PyQtPaint(QtGui.QWidget):
         groups seleted layers
 
         """
-        if self.layers_tree.selectedItems():
+        if self.layers_tree.has_selection():
             grab_items = []
-            for item in self.layers_tree.selectedItems():
+            for item in self.layers_tree.selected_items():
                 if isinstance(item, Layer):
                     grab_items.append(item.stroke_index)
 
             command = GroupStrokes(self, grab_items)
             self.paint_scene.undo_stack.push(command)
 
+    def flatten_layers(self):
+        """
+        merges selected layers & groups into one raster layer
+
+        """
+        if not self.layers_tree.has_selection():
+            return
+        # keep panel order so the merged layer takes the topmost position
+        layers = []
+        iterator = QtGui.QTreeWidgetItemIterator(self.layers_tree)
+        while iterator.value():
+            item = iterator.value()
+            if (isinstance(item, (Layer, Folder)) and
+                    self.layers_tree.is_selected(item)):
+                layers.append(item)
+            iterator += 1
+        if not any(isinstance(item, Layer) or item.childCount()
+                   for item in layers):
+            return
+
+        command = FlattenStrokes(self, layers)
+        self.paint_scene.undo_stack.push(command)
+
+    def duplicate_layers(self, transform=None):
+        """
+        duplicates selected layers & the layers of selected groups as one
+        undo entry. Duplicates share geometry with the originals.
+
+        Args:
+            transform (QTransform, optional): applied to the duplicates,
+                                              e.g. an offset
+
+        Returns:
+            list: indices of new strokes
+        """
+        if not self.layers_tree.has_selection():
+            return []
+        stroke_ids = []
+        iterator = QtGui.QTreeWidgetItemIterator(self.layers_tree)
+        while iterator.value():
+            item = iterator.value()
+            parent = item.parent()
+            if isinstance(item, Layer) and (
+                    self.layers_tree.is_selected(item) or
+                    (parent is not None and
+                     self.layers_tree.is_selected(parent))):
+                stroke_ids.append(item.stroke_index)
+            iterator += 1
+        if not stroke_ids:
+            return []
+
+        # panel lists topmost first, strokes are added bottom first
+        scene = self.paint_scene
+        strokes = [duplicate_stroke(scene.strokes[stroke_id]['stroke'],
+                                    transform)
+                   for stroke_id in reversed(stroke_ids)]
+        command = AddStrokes(scene, strokes,
+                             'Duplicate {} Strokes'.format(len(strokes)))
+        scene.undo_stack.push(command)
+        return command.stroke_ids
+
+    def set_stroke_geometry(self, stroke_id, geometry):
+        """
+        replaces a stroke's points as one undo entry, leaving duplicates
+        that share its old geometry untouched
+
+        Args:
+            stroke_id (int): stroke index
+            geometry (StrokeGeometry): new stroke points
+        """
+        self.paint_scene.set_stroke_geometry(stroke_id, geometry)
+
+    def _stroke_changed(self, stroke_id):
+        if self.layers_tree.thumbnails is not None:
+            self.layers_tree.thumbnails.invalidate(stroke_id)
+
+    def set_symmetry(self, mode=None, count=2, center=None):
+        """
+        paints mirrored or rotated copies of every stroke, see
+        PaintScene.set_symmetry
+
+        Args:
+            mode (str, optional): 'vertical', 'horizontal' or 'radial', None
+                                  turns symmetry off
+            count (int, optional): copies for radial symmetry
+            center (QPointF, optional): axis or rotation center, defaults to
+                                        canvas center
+        """
+        self.paint_scene.set_symmetry(mode, count, center)
+
     def update_layer_index(self):
         """
-        iterates through layer panel & updates stacking order of strokes
+        iterates through layer panel & updates stacking order of strokes,
+        deferred while layer updates are batched
 
         """
+        if self._layer_batch is not None:
+            return
+        metrics = self.paint_scene.metrics
+        start = time.time() if metrics is not None else 0
+
         iterator = QtGui.QTreeWidgetItemIterator(self.layers_tree)
         while iterator.value():
             item = iterator.value()
@@ -281,6 +618,249 @@ class PyQtPaint(QtGui.QWidget):
                     self.paint_scene.toggle_layer_visibility(item.child(i).stroke_index, item.visible)
             iterator += 1
 
+        if metrics is not None:
+            metrics.layer_index_time.add((time.time() - start) * 1000.0)
+
+    def enable_metrics(self, enabled=True, hud=False):
+        """
+        turns canvas instrumentation on or off
+
+        Args:
+            enabled (bool): record frame timing & hot path metrics
+            hud (bool): show metrics on top of the canvas
+        """
+        self._paint_view.enable_metrics(enabled, hud=hud)
+
+    def frame_stats(self):
+        """
+        rolling canvas statistics, see PaintView.frame_stats
+
+        Returns:
+            dict: metric name to value/summary, empty if metrics disabled
+        """
+        return self._paint_view.frame_stats()
+
+    def enable_tracing(self, enabled=True, capacity=65536):
+        """
+        turns input-to-pixel pipeline tracing on or off
+
+        Args:
+            enabled (bool): record trace events
+            capacity (int): number of events kept in the ring buffer
+        """
+        self.paint_scene.enable_tracing(enabled, capacity)
+
+    def dump_trace(self, filepath):
+        """
+        writes recorded trace as Chrome trace-event json
+
+        Args:
+            filepath (str): output path
+        """
+        if self.paint_scene.tracer is not None:
+            self.paint_scene.tracer.dump(filepath)
+
+    def set_tiled_rendering(self, enabled=True, threads=None):
+        """
+        rasterizes committed strokes into cached tiles on worker threads,
+        see PaintScene.set_tiled_rendering
+
+        Args:
+            enabled (bool): use tiled rendering
+            threads (int, optional): worker count, defaults to core count
+        """
+        self.paint_scene.set_tiled_rendering(enabled, threads)
+
+    def set_proxy_scale(self, scale=None, threads=None):
+        """
+        edits at reduced resolution, get_img & exports still render at full
+        resolution, see PaintScene.set_proxy_scale
+
+        Args:
+            scale (float, optional): display pixels per scene pixel, None
+                                     edits at full resolution
+            threads (int, optional): tile worker count, defaults to core
+                                     count
+        """
+        self.paint_scene.set_proxy_scale(scale, threads)
+
+    def set_adaptive_quality(self, enabled=True, idle_ms=IDLE_MS,
+                             min_strokes=MIN_STROKES):
+        """
+        renders with cheaper hints & scaled tiles while drawing, resizing or
+        scrolling & refines once input is idle, see
+        PaintView.set_adaptive_quality. On by default.
+
+        Args:
+            enabled (bool, optional): use adaptive quality
+            idle_ms (int, optional): ms without interaction before refining
+            min_strokes (int, optional): documents with fewer strokes are
+                                         always drawn at full quality
+        """
+        self._paint_view.set_adaptive_quality(enabled, idle_ms, min_strokes)
+
+    def start_mirror(self, name):
+        """
+        publishes canvas edits for live mirroring in other processes, see
+        mirror.py
+
+        Args:
+            name (str): local server name subscribers connect to
+        """
+        self.paint_scene.start_mirror(name)
+
+    def stop_mirror(self):
+        """
+        stops publishing canvas edits
+        """
+        self.paint_scene.stop_mirror()
+
+    def start_frame_publishing(self, name, fps=60, slots=3):
+        """
+        publishes the composited canvas to shared memory for external
+        viewers, see framebuffer.py
+
+        Args:
+            name (str): shared memory key readers attach to
+            fps (int, optional): maximum frames per second
+            slots (int, optional): frame slots, 3 for triple buffering
+        """
+        self.paint_scene.start_frame_publishing(name, fps, slots)
+
+    def stop_frame_publishing(self):
+        """
+        stops publishing frames
+        """
+        self.paint_scene.stop_frame_publishing()
+
+    def start_recording(self, filepath):
+        """
+        records canvas input, brush changes, layer selection/visibility and
+        actions to a binary file that can be replayed with InputReplayer
+
+        Args:
+            filepath (str): output path
+        """
+        self.stop_recording()
+        self._recorder = InputRecorder(filepath, self.paint_scene.width,
+                                       self.paint_scene.height)
+        self._paint_view.recorder = self._recorder
+
+        for name in RECORDED_ACTIONS:
+            action = getattr(self, name)
+            slot = lambda checked=False, name=name: self._recorder.action(name)
+            action.triggered.connect(slot)
+            self._record_slots.append((action.triggered, slot))
+        self.layers_tree.itemSelectionChanged.connect(self._record_selection)
+        self._record_slots.append((self.layers_tree.itemSelectionChanged,
+                                   self._record_selection))
+
+    def stop_recording(self):
+        """
+        ends recording, storing a digest of the final render so replays can
+        be verified
+        """
+        if self._recorder is None:
+            return
+        for signal, slot in self._record_slots:
+            signal.disconnect(slot)
+        self._record_slots = []
+        self._paint_view.recorder = None
+        self._recorder.close(self.get_img())
+        self._recorder = None
+
+    def _record_selection(self):
+        # itemSelectionChanged can arrive before the selection cache updates
+        ids = [self._layer_id(item)
+               for item in self.layers_tree.selectedItems()]
+        self._recorder.selection(ids)
+
+    def _layer_id(self, item):
+        if isinstance(item, Folder):
+            return item.group_index
+        return item.stroke_index
+
+    def _find_layer_item(self, layer_id):
+        iterator = QtGui.QTreeWidgetItemIterator(self.layers_tree)
+        while iterator.value():
+            item = iterator.value()
+            if self._layer_id(item) == layer_id:
+                return item
+            iterator += 1
+
+    def select_layers(self, layer_ids):
+        """
+        replaces layer panel selection
+
+        Args:
+            layer_ids (list): stroke/group indices to select
+        """
+        layer_ids = set(layer_ids)
+        self.layers_tree.clearSelection()
+        iterator = QtGui.QTreeWidgetItemIterator(self.layers_tree)
+        while iterator.value():
+            item = iterator.value()
+            if self._layer_id(item) in layer_ids:
+                item.setSelected(True)
+            iterator += 1
+
+    def set_layer_visibility(self, layer_id, visible):
+        """
+        toggles layer/group visibility as if clicked in the layer panel
+
+        Args:
+            layer_id (int): stroke/group index
+            visible (bool): visibility
+        """
+        item = self._find_layer_item(layer_id)
+        if item is not None:
+            item.set_toggle_state(0, visible)
+
+    def release_caches(self):
+        """
+        frees rebuildable caches held by this instance, e.g. while the
+        widget is hidden. Caches are rebuilt on demand.
+        """
+        self.paint_scene.release_caches()
+        buffers.buffer_pool.clear()
+        if self.layers_tree.thumbnails is not None:
+            self.layers_tree.thumbnails.clear()
+
+    def memory_usage(self):
+        """
+        estimated memory held by this instance, see memory.instance_memory
+
+        Returns:
+            dict: subsystem name to bytes
+        """
+        return instance_memory(self)
+
+    def memory_report(self, detail=False):
+        """
+        estimated memory by subsystem, cheap enough to poll for a status bar
+
+        Args:
+            detail (bool, optional): include per stroke, per undo command &
+                                     per layer figures
+
+        Returns:
+            dict: subsystem name to bytes, see MemoryMonitor.report
+        """
+        return self._memory_monitor.report(detail)
+
+    def set_memory_budget(self, budget, warn_ratio=0.9, interval=1000):
+        """
+        checks memory use against a budget, memoryBudgetExceeded is emitted
+        when usage reaches warn_ratio of it
+
+        Args:
+            budget (int): bytes, 0 disables budget checks
+            warn_ratio (float, optional): fraction of budget that triggers the
+                                          signal
+            interval (int, optional): ms between checks
+        """
+        self._memory_monitor.set_budget(budget, warn_ratio, interval)
+
     def set_pen_size(self, size):
         """
         Sets pen size from slider input
@@ -332,24 +912,106 @@ class PyQtPaint(QtGui.QWidget):
         """
         saves image to file
         """
-        filepath = self.file_dialog.getSaveFileName(self, "Save Canvas",
-                                                    "Render",
-                                                    "Images (*.png *.jpg)")
+        filepath = self.file_dialog.getSaveFileName(
+            self, "Save Canvas", "Render",
+            "Images (*.png *.jpg);;Vectors (*.svg *.pdf)")
+        if filepath:
+            extension = str(filepath).rsplit('.', 1)[-1].lower()
+            if extension == 'svg':
+                self.export_svg(str(filepath))
+            elif extension == 'pdf':
+                self.export_pdf(str(filepath))
+            else:
+                img = self.get_img()
+                img.save(filepath)
+
+    def open_reference(self):
+        """
+        picks a reference plate to paint over
+        """
+        filepath = self.file_dialog.getOpenFileName(
+            self, "Open Reference", "",
+            "Images (*.png *.jpg *.jpeg *.tif *.tiff *.exr)")
         if filepath:
-            img = self.get_img()
-            img.save(filepath)
+            self.set_reference_image(str(filepath))
+
+    def set_reference_image(self, filepath, opacity=1.0):
+        """
+        loads reference plate under the strokes, see
+        PaintScene.set_reference_image
+
+        Args:
+            filepath (str): image path, None removes the reference
+            opacity (float, optional): draw opacity
+        """
+        self.paint_scene.set_reference_image(filepath, opacity)
 
-    def get_img(self):
+    def export_svg(self, filepath):
         """
-        gets image from PyQtPaint
+        writes visible strokes as SVG, see export.export_svg
+
+        Args:
+            filepath (str): output path
+
+        Returns:
+            int: number of strokes written
+        """
+        return export.export_svg(self, filepath)
+
+    def export_pdf(self, filepath):
+        """
+        writes canvas as PDF, see export.export_pdf
+
+        Args:
+            filepath (str): output path
+        """
+        export.export_pdf(self, filepath)
+
+    def get_img(self, rect=None, scale=1.0):
+        """
+        gets image from PyQtPaint, always rendered at full resolution.
+        Only strokes intersecting rect are drawn, see
+        PaintScene.render_image
+
+        Args:
+            rect (QRectF, optional): canvas area, defaults to whole canvas
+            scale (float, optional): image pixels per canvas pixel
 
         Returns:
             img: returns QImage data from canvas
         """
-        img = QtGui.QImage(self.paint_scene.width, self.paint_scene.height,
-                           QtGui.QImage.Format_RGB32)
-        paint = QtGui.QPainter(img)
-        paint.setRenderHint(QtGui.QPainter.Antialiasing)
-        self.paint_scene.render(paint)
-        paint.end()
-        return img
+        return self.paint_scene.render_image(rect, scale)
+
+    def render_array(self, rect=None, scale=1.0, out=None,
+                     premultiplied=True):
+        """
+        renders the canvas straight into a NumPy array without copies, see
+        buffers.render_to_array. Pixels are in buffers.CHANNEL_ORDER.
+
+        Args:
+            rect (QRectF, optional): canvas area, defaults to whole canvas
+            scale (float, optional): array pixels per canvas pixel
+            out (RenderBuffer or numpy.ndarray, optional): render target,
+                                                          a pooled buffer
+                                                          is reused when
+                                                          omitted
+            premultiplied (bool, optional): premultiplied alpha format
+
+        Returns:
+            numpy.ndarray: (height, width, 4) uint8 pixels
+        """
+        return buffers.render_to_array(self.paint_scene, rect, scale, out,
+                                       premultiplied)
+
+    def sample_color(self, position, radius=0):
+        """
+        average canvas color around a point, see PaintScene.sample_color
+
+        Args:
+            position (QPointF): canvas position
+            radius (int, optional): sampling radius in canvas pixels
+
+        Returns:
+            QColor: opaque average color
+        """
+        return self.paint_scene.sample_color(position, radius)
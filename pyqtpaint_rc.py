@@ -0,0 +1,1559 @@
+# -*- coding: utf-8 -*-
+
+# Resource object code
+#
+# Created by: The Resource Compiler for PyQt (Qt v4.8.7)
+#
+# WARNING! All changes made in this file will be lost!
+
+from PyQt4 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x05\xb3\x89\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\
+\x49\x48\x44\x52\x00\x00\x00\x80\x00\x00\x00\x80\x08\x06\x00\x00\
+\x00\xc3\x3e\x61\xcb\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\
+\x1c\xe9\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\
+\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x01\x59\x69\x54\x58\x74\x58\
+\x4d\x4c\x3a\x63\x6f\x6d\x2e\x61\x64\x6f\x62\x65\x2e\x78\x6d\x70\
+\x00\x00\x00\x00\x00\x3c\x78\x3a\x78\x6d\x70\x6d\x65\x74\x61\x20\
+\x78\x6d\x6c\x6e\x73\x3a\x78\x3d\x22\x61\x64\x6f\x62\x65\x3a\x6e\
+\x73\x3a\x6d\x65\x74\x61\x2f\x22\x20\x78\x3a\x78\x6d\x70\x74\x6b\
+\x3d\x22\x58\x4d\x50\x20\x43\x6f\x72\x65\x20\x35\x2e\x34\x2e\x30\
+\x22\x3e\x0a\x20\x20\x20\x3c\x72\x64\x66\x3a\x52\x44\x46\x20\x78\
+\x6d\x6c\x6e\x73\x3a\x72\x64\x66\x3d\x22\x68\x74\x74\x70\x3a\x2f\
+\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\
+\x2f\x30\x32\x2f\x32\x32\x2d\x72\x64\x66\x2d\x73\x79\x6e\x74\x61\
+\x78\x2d\x6e\x73\x23\x22\x3e\x0a\x20\x20\x20\x20\x20\x20\x3c\x72\
+\x64\x66\x3a\x44\x65\x73\x63\x72\x69\x70\x74\x69\x6f\x6e\x20\x72\
+\x64\x66\x3a\x61\x62\x6f\x75\x74\x3d\x22\x22\x0a\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x78\x6d\x6c\x6e\x73\x3a\x74\x69\
+\x66\x66\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\
+\x6f\x62\x65\x2e\x63\x6f\x6d\x2f\x74\x69\x66\x66\x2f\x31\x2e\x30\
+\x2f\x22\x3e\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x3c\x74\x69\
+\x66\x66\x3a\x4f\x72\x69\x65\x6e\x74\x61\x74\x69\x6f\x6e\x3e\x31\
+\x3c\x2f\x74\x69\x66\x66\x3a\x4f\x72\x69\x65\x6e\x74\x61\x74\x69\
+\x6f\x6e\x3e\x0a\x20\x20\x20\x20\x20\x20\x3c\x2f\x72\x64\x66\x3a\
+\x44\x65\x73\x63\x72\x69\x70\x74\x69\x6f\x6e\x3e\x0a\x20\x20\x20\
+\x3c\x2f\x72\x64\x66\x3a\x52\x44\x46\x3e\x0a\x3c\x2f\x78\x3a\x78\
+\x6d\x70\x6d\x65\x74\x61\x3e\x0a\x4c\xc2\x27\x59\x00\x00\x03\xf3\
+\x49\x44\x41\x54\x78\x01\xed\xdc\x4d\x88\x4d\x61\x1c\xc7\xf1\x31\
+\xf2\x36\x84\x18\x45\x22\x79\xcd\xcb\xc6\x64\x23\x2b\xb2\x91\xb2\
+\x92\x1d\xb2\x92\x85\x8d\xb0\x13\x59\x89\x85\x95\xec\x24\x2b\x4c\
+\x29\x79\xd9\x20\x0b\x2f\x51\x9a\xcd\x48\x21\x35\x4d\x91\xbc\x0b\
+\xc9\xcb\xe0\xf7\x67\x16\x8f\xe9\xdc\x7b\xcf\x39\xdd\xf3\xf2\x3c\
+\xcf\xf7\xa9\x3f\x67\xce\x3d\xf7\x3c\xcf\xef\x73\xff\x73\xc7\xd4\
+\xe3\x76\x74\x30\x10\x40\x00\x01\x04\x10\x40\x00\x01\x04\x10\x40\
+\x00\x01\x04\x10\x40\x00\x01\x04\x10\x40\x00\x01\x04\x10\x40\x00\
+\x01\x04\x10\x40\x00\x01\x04\x10\x40\x00\x01\x04\x10\x40\x00\x01\
+\x04\x10\x40\x00\x01\x04\x10\x40\x00\x01\x04\x10\x40\x00\x01\x04\
+\x10\x40\x00\x01\x04\x10\x40\x00\x01\x04\x10\x40\x00\x01\x04\x10\
+\x40\x00\x01\x04\x10\x40\x00\x01\x04\x10\x40\x00\x01\x04\x10\x40\
+\x00\x01\x04\x10\x40\x20\x36\x81\x05\x0a\x7c\x4e\xf5\x41\xf5\x9b\
+\x6a\x6a\xf0\x51\x3e\xbd\xaa\x45\xaa\x20\xc6\x62\xa5\x78\xab\xe2\
+\x85\xcf\x66\xf0\x4e\x66\x4b\x43\xe8\x80\x8b\xbc\xf8\xb9\x9b\xff\
+\x72\xd1\x0d\x30\xaa\xe8\x09\x74\xff\x2f\xaa\xae\x12\xe6\x09\x71\
+\x8a\xaf\x45\xdb\x75\x96\xa0\xf6\xa3\x84\x39\x42\x9d\x62\xa8\xe8\
+\x60\x65\x34\xc0\xa5\xa2\x43\x04\x7c\xff\xab\x21\x64\x9b\xa9\x10\
+\x03\x2a\xfe\x11\x98\xcd\x60\x50\x66\xb3\x55\x41\x8c\x65\x4a\xf1\
+\x5e\x45\x13\xa4\x33\xb0\x5f\x97\x97\x07\xf1\xca\x3b\x21\xd6\xea\
+\xf8\xbb\x8a\x26\x68\x6e\x60\x46\xeb\x1c\xb7\xa0\x0e\xb7\xd1\x00\
+\x2d\xbf\x01\xb6\x07\xf5\x8a\x27\x84\x39\x48\x13\x34\x6c\x82\x43\
+\x09\x5e\x41\x9e\x3a\xad\x54\xfc\x28\xf8\xdf\xc0\x4c\xa2\x19\x63\
+\x94\xf4\xba\x8a\x26\xf8\x67\x70\x43\x16\x66\x12\xd5\x98\xa2\xb4\
+\x0f\x55\xb1\x37\x81\x19\x98\x45\x94\x63\xae\x52\xbf\x50\xc5\xda\
+\x04\x96\xdd\x0c\xa2\x1e\x3d\x4a\xff\x59\x15\x5b\x13\x58\x66\xcb\
+\xce\x90\xc0\x46\xd5\x4f\x55\x2c\x4d\x60\x59\x2d\x33\xc3\x11\xd8\
+\xa5\xe3\x58\x1a\xc0\xb2\x32\x12\x04\x8e\xe9\x5c\xe8\x4d\x70\x34\
+\x21\x37\xa7\x86\x05\x6c\x7f\x42\xaf\x2a\xd4\x26\x38\xaf\x6c\x65\
+\xec\xc1\x18\xe6\xf4\xf3\xaf\xf1\x5a\xf6\x1d\x55\x68\x4d\x70\x5b\
+\x99\x2c\x1b\x23\x85\x40\xb7\xae\x79\xaa\x0a\xa5\x09\x9e\x28\xcb\
+\xf4\x14\xb9\xb9\xc4\x11\xb0\x5d\xb1\x6f\x54\xbe\x37\xc1\x6b\x65\
+\x58\xe8\xe4\xe2\x30\x83\xc0\x1a\x5d\x6b\xfb\xe2\x7c\x6d\x02\x5b\
+\xfb\xea\x0c\x79\xb9\x34\x41\x60\x8b\xce\xfd\x52\xf9\xd6\x04\xb6\
+\xe6\xcd\x09\x79\x38\x95\x43\x60\x9f\x9e\xe3\x5b\x03\xec\xcd\x91\
+\x93\xa7\x34\x11\x38\xe9\x51\x13\x9c\x68\x92\x83\x87\x72\x0a\x8c\
+\xd6\xf3\xae\xa8\xea\xfe\x4e\x60\xbb\xa0\x6d\xad\x8c\x02\x04\x26\
+\xe9\x9e\x7d\xaa\xba\x36\xc1\x03\xad\x6d\x62\x01\xb9\xb9\xa5\x23\
+\x30\x4b\xc7\xb6\x65\xba\x6e\x4d\x30\xa0\x35\xd9\x16\x78\x46\x09\
+\x02\x2b\x34\x87\xfd\x2f\xda\xba\x34\x81\x6d\x79\xb7\xad\xef\x8c\
+\x12\x05\xd6\x6b\xae\x3a\x6c\x33\xff\xa6\x75\xd8\x96\x77\x46\x05\
+\x02\x3b\x34\x67\xd5\xef\x02\x5b\x2b\xc8\xcd\x94\x8e\xc0\xe1\x0a\
+\x9b\xe0\x80\xb3\x0e\x0e\x2b\x14\x38\x53\x41\x13\x9c\xaa\x30\x2f\
+\x53\x8f\x10\x18\xab\xaf\x6f\xaa\xca\xfa\x71\x70\x4d\x73\x45\xb7\
+\x8d\x7b\x84\x79\xed\xbe\x9c\xaa\x15\x3d\x52\x15\xdd\x04\xfd\x9a\
+\x63\x72\xed\xd2\xb3\xa0\xbf\x02\xf3\xf4\xe7\x4b\x55\x51\x4d\xf0\
+\x5c\xf7\x9e\xa3\x62\xd4\x58\x60\x95\xd6\x66\x1f\x4b\xd3\xee\x26\
+\xf8\xa4\x7b\xae\xac\x71\x6e\x96\xe6\x08\x6c\xd2\xf1\x90\xaa\x5d\
+\x4d\x60\xdb\xb8\x37\x38\xf7\xe7\xd0\x03\x81\xdd\x5a\x63\xbb\x1a\
+\x60\xa7\x07\x79\x59\x62\x82\xc0\xf1\x36\x34\xc1\x91\x84\xfb\x72\
+\xca\x13\x81\x4e\xad\xf3\x82\x2a\xef\x3b\xc1\x59\x3d\x97\x6d\xdc\
+\x9e\xbc\xd8\x8d\x96\x39\x41\x0f\xdc\x53\x65\x6d\x82\x5b\x7a\xce\
+\xb8\x46\x37\xe5\xbc\x5f\x02\x33\xb4\xdc\x67\xaa\xb4\x4d\xf0\x58\
+\xd7\x4e\xf3\x2b\x22\xab\x6d\x25\xb0\x44\x17\xa4\xf9\xcc\xe2\x57\
+\xba\x6e\x7e\xab\x9b\xf1\xb8\x9f\x02\xf6\x7b\xfc\xa0\xaa\xd1\x3b\
+\x81\xbd\x4b\xd8\x5e\x03\x46\xc0\x02\xb6\xad\x6c\xbf\xea\xbe\xca\
+\x3e\x8f\xcf\x36\x73\xdc\x55\xed\x51\x75\xa9\x18\x08\x20\x80\x00\
+\x02\x08\x20\x80\x00\x02\x08\x20\x80\x00\x02\x08\x20\x80\x00\x02\
+\x08\x20\x80\x00\x02\x08\x20\x80\x00\x02\x08\x20\x80\x00\x02\x08\
+\x20\x80\x00\x02\x08\x20\x80\x00\x02\x08\x20\x80\x00\x02\x08\x20\
+\x80\x00\x02\x08\x20\x80\x00\x02\x08\x20\x80\x00\x02\x08\x20\x80\
+\x00\x02\x08\x20\x80\x00\x02\x08\x20\x80\x00\x02\x08\x20\x80\x00\
+\x02\x08\x20\x80\x00\x02\x08\x20\x80\x00\x02\x08\x20\x80\x40\x25\
+\x02\x7f\x00\xd2\x38\xd5\x61\x8d\xf7\x7f\xfe\x00\x00\x00\x00\x49\
+\x45\x4e\x44\xae\x42\x60\x82\x00\x00\x03\x72\x89\x50\x4e\x47\x0d\
+\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\x00\x00\x80\x00\
+\x00\x00\x80\x08\x06\x00\x00\x00\xc3\x3e\x61\xcb\x00\x00\x00\x04\
+\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\x00\x00\x00\x09\
+\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\x00\x9a\x9c\
+\x18\x00\x00\x03\x14\x49\x44\x41\x54\x78\x9c\xed\xdd\xbd\x6a\x14\
+\x51\x18\x87\xf1\x47\x13\x31\x82\x1a\xd0\xa8\x60\x65\x63\x23\x58\
+\x79\x11\x92\xd2\x3b\xd0\x42\xef\x20\x37\xe0\x15\x98\x4e\xc4\x0b\
+\x10\x6c\x25\xd8\xa5\x56\xb0\x10\xc4\x8f\x4a\xac\x44\x45\x8d\xc6\
+\x20\x31\x5f\x16\x93\x80\x18\x36\xd9\xdd\x79\xcf\x99\x33\x7b\x9e\
+\x1f\x9c\xf6\x65\x66\xe7\x9f\xf7\x9d\xcd\xcc\xce\x80\x24\x49\x92\
+\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x43\x39\
+\x02\x1c\x4d\x54\x57\x85\xba\x06\x2c\x03\x3f\x81\x9d\xc4\x6b\x0b\
+\x58\x05\xde\x01\xf7\x80\xd3\x19\xf6\x4f\x07\x98\x01\x3e\x92\xfe\
+\xc0\x0f\x5a\xcf\x81\x93\xc9\xf7\x52\x03\xcd\xd3\xdd\xc1\xdf\x5b\
+\x4b\xc0\x74\xea\x1d\xed\xb3\x14\x33\x79\xcf\xd5\x84\xb5\x87\x35\
+\x0f\x3c\xc0\xf3\x84\x81\x52\x06\xe0\x62\xc2\xda\xa3\xb8\x45\x73\
+\x4e\xa0\xcc\x1e\xd1\xfd\x08\xf8\x77\x2d\x62\x27\xc8\x6a\x99\xee\
+\x0f\xfa\xff\xeb\x31\x30\x9b\x72\xa7\xfb\x66\x2a\x61\xed\x05\xe0\
+\x7c\xc2\xfa\xe3\xb8\x02\xdc\x04\x4e\x00\xeb\xbb\x6b\x13\xd8\xee\
+\x70\x9b\x26\xd6\x17\xba\xff\x8b\xef\xfb\x5a\x07\x5e\x02\x37\x46\
+\xfc\xec\x87\x96\x6a\x26\x4e\x03\x7f\x12\xd6\xaf\xcd\x06\x70\x19\
+\xf8\x10\x5d\x38\xd5\xb7\x80\x39\x3c\xf8\x91\x8e\x01\xd7\x53\x14\
+\x4e\x15\x80\xd2\x66\xff\x24\xb8\x94\xa2\xa8\x01\xe8\x8f\x24\xd7\
+\x36\x0c\x40\x7f\x24\xb9\xae\x91\x2a\x00\x17\x12\xd5\xad\x59\xaf\
+\x02\x60\x07\x88\x67\x00\x2a\x77\x2a\x45\xd1\x54\x01\x38\x97\xa8\
+\x6e\xcd\x7a\xd5\x01\x3c\x07\x88\xd7\xab\x00\xcc\x25\xaa\x5b\x33\
+\xef\x6e\x92\x24\x49\xc5\xb9\x0d\x3c\xa3\xb9\x2f\xbf\xeb\x6b\xe8\
+\x93\xbe\xd6\x80\x57\xc0\x5d\x9a\x5b\xef\x3b\xb7\x40\xf7\x1f\x4a\
+\xad\xeb\xe1\x10\xc7\xe7\x40\x11\xd7\xec\xdf\x93\xe8\x52\xa5\x0e\
+\xf5\x0d\x38\xdb\xa6\x40\x44\x00\xb6\x83\xea\x68\x74\x5b\xb4\xfc\
+\xe1\x4b\xc4\x3f\x82\xb6\x02\x6a\x68\x3c\xbf\xda\x16\x88\x08\xc0\
+\xb7\x80\x1a\x1a\xcf\xf7\xb6\x05\x0c\x40\xbf\xad\xb4\x2d\x60\x00\
+\xfa\xcd\x0e\x50\x39\x03\x50\x39\x47\x40\xe5\x8a\xe8\x00\x5f\x03\
+\x6a\x68\x3c\x45\x04\xc0\x0e\xd0\x1d\x47\x40\xe5\xec\x00\x95\x33\
+\x00\x95\x73\x04\x54\xae\x88\x0e\xe0\xb7\x80\xee\xb4\x0e\x40\xd4\
+\x65\xdc\x0d\x7c\x1e\x5f\x17\x66\x68\x9e\x22\x32\xb6\xa8\xdf\x05\
+\xb4\x9e\x45\x1a\xd9\x6f\x5a\x1e\x7c\x88\x0b\x80\xe7\x01\xf9\xb5\
+\x6e\xff\x60\x00\xfa\x2c\xa4\xeb\x46\x05\xc0\x13\xc1\xfc\xec\x00\
+\x95\x33\x00\x95\x2b\x6a\x04\x18\x80\xfc\xec\x00\x95\x2b\x2a\x00\
+\x9e\x04\xe6\xe7\x08\xa8\x5c\x51\x1d\xc0\x00\xe4\x67\x00\x2a\xe7\
+\x08\xa8\x5c\x51\x1d\x60\x05\x5f\xba\x90\x5b\x51\x01\xd8\x21\x68\
+\x83\x34\xb4\xa2\x46\x00\x38\x06\x72\xda\xa4\x79\x1a\x4b\x6b\x06\
+\xa0\x9f\xc2\xee\xbf\x30\x00\xfd\x64\x00\x2a\x17\x76\xbe\x15\x19\
+\x00\xff\x1d\x9c\x4f\x91\x01\xb0\x03\xe4\xe3\x08\xa8\x9c\x1d\xa0\
+\x72\x06\xa0\x72\x8e\x80\xca\x15\xd9\x01\xfc\x16\x90\x4f\x91\x01\
+\xb0\x03\xe4\x53\xe4\x08\xf0\x8a\x60\x3e\x45\x76\x80\x6d\xe0\x47\
+\x60\x3d\x0d\x56\x64\x00\xc0\x31\x90\x4b\x91\x23\x00\x3c\x11\xcc\
+\x61\x07\x03\x50\xb5\x55\x02\x9f\xd0\x1e\x1d\x80\xcf\xc1\xf5\xb4\
+\xdf\xa7\xc8\x62\xd1\x01\x78\x1d\x5c\x4f\xfb\xbd\x89\x2c\x16\x1d\
+\x80\x27\xc1\xf5\xb4\xdf\x52\xd7\x1b\x70\x98\x45\xba\x7f\x99\xd2\
+\xa4\xae\x17\xc0\xf1\xe1\x0f\xc5\xe1\xa6\x22\x8b\xed\x7a\x4a\xf3\
+\x22\xa9\x33\xc0\x2c\xcd\x06\xfb\x4e\xa1\xf1\xad\x01\x6f\x81\xfb\
+\xc0\x1d\x9a\x67\x03\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\
+\x24\x49\x92\x24\x49\x92\x24\xf1\x17\x30\x6b\x86\x75\xda\x7b\xbc\
+\x10\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\x00\x00\x51\
+\x8f\x89\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\
+\x52\x00\x00\x01\xc2\x00\x00\x01\xc2\x08\x06\x00\x00\x00\x7c\x18\
+\xc9\x45\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\
+\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x38\x20\x69\x54\x58\x74\x58\
+\x4d\x4c\x3a\x63\x6f\x6d\x2e\x61\x64\x6f\x62\x65\x2e\x78\x6d\x70\
+\x00\x00\x00\x00\x00\x3c\x3f\x78\x70\x61\x63\x6b\x65\x74\x20\x62\
+\x65\x67\x69\x6e\x3d\x22\xef\xbb\xbf\x22\x20\x69\x64\x3d\x22\x57\
+\x35\x4d\x30\x4d\x70\x43\x65\x68\x69\x48\x7a\x72\x65\x53\x7a\x4e\
+\x54\x63\x7a\x6b\x63\x39\x64\x22\x3f\x3e\x0a\x3c\x78\x3a\x78\x6d\
+\x70\x6d\x65\x74\x61\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x3d\x22\x61\
+\x64\x6f\x62\x65\x3a\x6e\x73\x3a\x6d\x65\x74\x61\x2f\x22\x20\x78\
+\x3a\x78\x6d\x70\x74\x6b\x3d\x22\x41\x64\x6f\x62\x65\x20\x58\x4d\
+\x50\x20\x43\x6f\x72\x65\x20\x35\x2e\x35\x2d\x63\x30\x32\x31\x20\
+\x37\x39\x2e\x31\x35\x34\x39\x31\x31\x2c\x20\x32\x30\x31\x33\x2f\
+\x31\x30\x2f\x32\x39\x2d\x31\x31\x3a\x34\x37\x3a\x31\x36\x20\x20\
+\x20\x20\x20\x20\x20\x20\x22\x3e\x0a\x20\x20\x20\x3c\x72\x64\x66\
+\x3a\x52\x44\x46\x20\x78\x6d\x6c\x6e\x73\x3a\x72\x64\x66\x3d\x22\
+\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\
+\x67\x2f\x31\x39\x39\x39\x2f\x30\x32\x2f\x32\x32\x2d\x72\x64\x66\
+\x2d\x73\x79\x6e\x74\x61\x78\x2d\x6e\x73\x23\x22\x3e\x0a\x20\x20\
+\x20\x20\x20\x20\x3c\x72\x64\x66\x3a\x44\x65\x73\x63\x72\x69\x70\
+\x74\x69\x6f\x6e\x20\x72\x64\x66\x3a\x61\x62\x6f\x75\x74\x3d\x22\
+\x22\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x78\x6d\
+\x6c\x6e\x73\x3a\x78\x6d\x70\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\
+\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\x6f\x6d\x2f\x78\x61\x70\
+\x2f\x31\x2e\x30\x2f\x22\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x78\x6d\x6c\x6e\x73\x3a\x64\x63\x3d\x22\x68\x74\x74\
+\x70\x3a\x2f\x2f\x70\x75\x72\x6c\x2e\x6f\x72\x67\x2f\x64\x63\x2f\
+\x65\x6c\x65\x6d\x65\x6e\x74\x73\x2f\x31\x2e\x31\x2f\x22\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x78\x6d\x6c\x6e\x73\
+\x3a\x70\x68\x6f\x74\x6f\x73\x68\x6f\x70\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\x6f\x6d\x2f\
+\x70\x68\x6f\x74\x6f\x73\x68\x6f\x70\x2f\x31\x2e\x30\x2f\x22\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x78\x6d\x6c\x6e\
+\x73\x3a\x78\x6d\x70\x4d\x4d\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\
+\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\x6f\x6d\x2f\x78\x61\x70\
+\x2f\x31\x2e\x30\x2f\x6d\x6d\x2f\x22\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x78\x6d\x6c\x6e\x73\x3a\x73\x74\x45\x76\
+\x74\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\
+\x62\x65\x2e\x63\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x73\
+\x54\x79\x70\x65\x2f\x52\x65\x73\x6f\x75\x72\x63\x65\x45\x76\x65\
+\x6e\x74\x23\x22\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x78\x6d\x6c\x6e\x73\x3a\x74\x69\x66\x66\x3d\x22\x68\x74\x74\
+\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\x6f\x6d\
+\x2f\x74\x69\x66\x66\x2f\x31\x2e\x30\x2f\x22\x0a\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x78\x6d\x6c\x6e\x73\x3a\x65\x78\
+\x69\x66\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\
+\x6f\x62\x65\x2e\x63\x6f\x6d\x2f\x65\x78\x69\x66\x2f\x31\x2e\x30\
+\x2f\x22\x3e\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x3c\x78\x6d\
+\x70\x3a\x43\x72\x65\x61\x74\x6f\x72\x54\x6f\x6f\x6c\x3e\x41\x64\
+\x6f\x62\x65\x20\x50\x68\x6f\x74\x6f\x73\x68\x6f\x70\x20\x43\x43\
+\x20\x28\x4d\x61\x63\x69\x6e\x74\x6f\x73\x68\x29\x3c\x2f\x78\x6d\
+\x70\x3a\x43\x72\x65\x61\x74\x6f\x72\x54\x6f\x6f\x6c\x3e\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x3c\x78\x6d\x70\x3a\x43\x72\x65\
+\x61\x74\x65\x44\x61\x74\x65\x3e\x32\x30\x31\x36\x2d\x30\x39\x2d\
+\x32\x36\x54\x31\x38\x3a\x33\x37\x3a\x31\x31\x2d\x30\x34\x3a\x30\
+\x30\x3c\x2f\x78\x6d\x70\x3a\x43\x72\x65\x61\x74\x65\x44\x61\x74\
+\x65\x3e\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x3c\x78\x6d\x70\
+\x3a\x4d\x6f\x64\x69\x66\x79\x44\x61\x74\x65\x3e\x32\x30\x31\x36\
+\x2d\x30\x39\x2d\x32\x36\x54\x31\x38\x3a\x33\x38\x3a\x34\x36\x2d\
+\x30\x34\x3a\x30\x30\x3c\x2f\x78\x6d\x70\x3a\x4d\x6f\x64\x69\x66\
+\x79\x44\x61\x74\x65\x3e\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x3c\x78\x6d\x70\x3a\x4d\x65\x74\x61\x64\x61\x74\x61\x44\x61\x74\
+\x65\x3e\x32\x30\x31\x36\x2d\x30\x39\x2d\x32\x36\x54\x31\x38\x3a\
+\x33\x38\x3a\x34\x36\x2d\x30\x34\x3a\x30\x30\x3c\x2f\x78\x6d\x70\
+\x3a\x4d\x65\x74\x61\x64\x61\x74\x61\x44\x61\x74\x65\x3e\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x3c\x64\x63\x3a\x66\x6f\x72\x6d\
+\x61\x74\x3e\x69\x6d\x61\x67\x65\x2f\x70\x6e\x67\x3c\x2f\x64\x63\
+\x3a\x66\x6f\x72\x6d\x61\x74\x3e\x0a\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x3c\x70\x68\x6f\x74\x6f\x73\x68\x6f\x70\x3a\x43\x6f\x6c\
+\x6f\x72\x4d\x6f\x64\x65\x3e\x33\x3c\x2f\x70\x68\x6f\x74\x6f\x73\
+\x68\x6f\x70\x3a\x43\x6f\x6c\x6f\x72\x4d\x6f\x64\x65\x3e\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x3c\x78\x6d\x70\x4d\x4d\x3a\x49\
+\x6e\x73\x74\x61\x6e\x63\x65\x49\x44\x3e\x78\x6d\x70\x2e\x69\x69\
+\x64\x3a\x30\x33\x30\x63\x30\x31\x64\x35\x2d\x36\x63\x32\x64\x2d\
+\x34\x39\x30\x37\x2d\x38\x31\x61\x33\x2d\x65\x63\x64\x64\x39\x61\
+\x38\x39\x61\x61\x38\x37\x3c\x2f\x78\x6d\x70\x4d\x4d\x3a\x49\x6e\
+\x73\x74\x61\x6e\x63\x65\x49\x44\x3e\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x3c\x78\x6d\x70\x4d\x4d\x3a\x44\x6f\x63\x75\x6d\x65\
+\x6e\x74\x49\x44\x3e\x78\x6d\x70\x2e\x64\x69\x64\x3a\x30\x33\x30\
+\x63\x30\x31\x64\x35\x2d\x36\x63\x32\x64\x2d\x34\x39\x30\x37\x2d\
+\x38\x31\x61\x33\x2d\x65\x63\x64\x64\x39\x61\x38\x39\x61\x61\x38\
+\x37\x3c\x2f\x78\x6d\x70\x4d\x4d\x3a\x44\x6f\x63\x75\x6d\x65\x6e\
+\x74\x49\x44\x3e\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x3c\x78\
+\x6d\x70\x4d\x4d\x3a\x4f\x72\x69\x67\x69\x6e\x61\x6c\x44\x6f\x63\
+\x75\x6d\x65\x6e\x74\x49\x44\x3e\x78\x6d\x70\x2e\x64\x69\x64\x3a\
+\x30\x33\x30\x63\x30\x31\x64\x35\x2d\x36\x63\x32\x64\x2d\x34\x39\
+\x30\x37\x2d\x38\x31\x61\x33\x2d\x65\x63\x64\x64\x39\x61\x38\x39\
+\x61\x61\x38\x37\x3c\x2f\x78\x6d\x70\x4d\x4d\x3a\x4f\x72\x69\x67\
+\x69\x6e\x61\x6c\x44\x6f\x63\x75\x6d\x65\x6e\x74\x49\x44\x3e\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x3c\x78\x6d\x70\x4d\x4d\x3a\
+\x48\x69\x73\x74\x6f\x72\x79\x3e\x0a\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x3c\x72\x64\x66\x3a\x53\x65\x71\x3e\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x3c\x72\
+\x64\x66\x3a\x6c\x69\x20\x72\x64\x66\x3a\x70\x61\x72\x73\x65\x54\
+\x79\x70\x65\x3d\x22\x52\x65\x73\x6f\x75\x72\x63\x65\x22\x3e\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x3c\x73\x74\x45\x76\x74\x3a\x61\x63\x74\x69\x6f\x6e\x3e\
+\x63\x72\x65\x61\x74\x65\x64\x3c\x2f\x73\x74\x45\x76\x74\x3a\x61\
+\x63\x74\x69\x6f\x6e\x3e\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x3c\x73\x74\x45\x76\x74\x3a\
+\x69\x6e\x73\x74\x61\x6e\x63\x65\x49\x44\x3e\x78\x6d\x70\x2e\x69\
+\x69\x64\x3a\x30\x33\x30\x63\x30\x31\x64\x35\x2d\x36\x63\x32\x64\
+\x2d\x34\x39\x30\x37\x2d\x38\x31\x61\x33\x2d\x65\x63\x64\x64\x39\
+\x61\x38\x39\x61\x61\x38\x37\x3c\x2f\x73\x74\x45\x76\x74\x3a\x69\
+\x6e\x73\x74\x61\x6e\x63\x65\x49\x44\x3e\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x3c\x73\x74\
+\x45\x76\x74\x3a\x77\x68\x65\x6e\x3e\x32\x30\x31\x36\x2d\x30\x39\
+\x2d\x32\x36\x54\x31\x38\x3a\x33\x37\x3a\x31\x31\x2d\x30\x34\x3a\
+\x30\x30\x3c\x2f\x73\x74\x45\x76\x74\x3a\x77\x68\x65\x6e\x3e\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x3c\x73\x74\x45\x76\x74\x3a\x73\x6f\x66\x74\x77\x61\x72\
+\x65\x41\x67\x65\x6e\x74\x3e\x41\x64\x6f\x62\x65\x20\x50\x68\x6f\
+\x74\x6f\x73\x68\x6f\x70\x20\x43\x43\x20\x28\x4d\x61\x63\x69\x6e\
+\x74\x6f\x73\x68\x29\x3c\x2f\x73\x74\x45\x76\x74\x3a\x73\x6f\x66\
+\x74\x77\x61\x72\x65\x41\x67\x65\x6e\x74\x3e\x0a\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x3c\x2f\x72\x64\x66\
+\x3a\x6c\x69\x3e\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x3c\x2f\x72\x64\x66\x3a\x53\x65\x71\x3e\x0a\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x3c\x2f\x78\x6d\x70\x4d\x4d\x3a\x48\x69\x73\
+\x74\x6f\x72\x79\x3e\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x3c\
+\x74\x69\x66\x66\x3a\x4f\x72\x69\x65\x6e\x74\x61\x74\x69\x6f\x6e\
+\x3e\x31\x3c\x2f\x74\x69\x66\x66\x3a\x4f\x72\x69\x65\x6e\x74\x61\
+\x74\x69\x6f\x6e\x3e\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x3c\
+\x74\x69\x66\x66\x3a\x58\x52\x65\x73\x6f\x6c\x75\x74\x69\x6f\x6e\
+\x3e\x37\x32\x30\x30\x30\x30\x2f\x31\x30\x30\x30\x30\x3c\x2f\x74\
+\x69\x66\x66\x3a\x58\x52\x65\x73\x6f\x6c\x75\x74\x69\x6f\x6e\x3e\
+\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x3c\x74\x69\x66\x66\x3a\
+\x59\x52\x65\x73\x6f\x6c\x75\x74\x69\x6f\x6e\x3e\x37\x32\x30\x30\
+\x30\x30\x2f\x31\x30\x30\x30\x30\x3c\x2f\x74\x69\x66\x66\x3a\x59\
+\x52\x65\x73\x6f\x6c\x75\x74\x69\x6f\x6e\x3e\x0a\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x3c\x74\x69\x66\x66\x3a\x52\x65\x73\x6f\x6c\
+\x75\x74\x69\x6f\x6e\x55\x6e\x69\x74\x3e\x32\x3c\x2f\x74\x69\x66\
+\x66\x3a\x52\x65\x73\x6f\x6c\x75\x74\x69\x6f\x6e\x55\x6e\x69\x74\
+\x3e\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x3c\x65\x78\x69\x66\
+\x3a\x43\x6f\x6c\x6f\x72\x53\x70\x61\x63\x65\x3e\x36\x35\x35\x33\
+\x35\x3c\x2f\x65\x78\x69\x66\x3a\x43\x6f\x6c\x6f\x72\x53\x70\x61\
+\x63\x65\x3e\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x3c\x65\x78\
+\x69\x66\x3a\x50\x69\x78\x65\x6c\x58\x44\x69\x6d\x65\x6e\x73\x69\
+\x6f\x6e\x3e\x34\x35\x30\x3c\x2f\x65\x78\x69\x66\x3a\x50\x69\x78\
+\x65\x6c\x58\x44\x69\x6d\x65\x6e\x73\x69\x6f\x6e\x3e\x0a\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x3c\x65\x78\x69\x66\x3a\x50\x69\x78\
+\x65\x6c\x59\x44\x69\x6d\x65\x6e\x73\x69\x6f\x6e\x3e\x34\x35\x30\
+\x3c\x2f\x65\x78\x69\x66\x3a\x50\x69\x78\x65\x6c\x59\x44\x69\x6d\
+\x65\x6e\x73\x69\x6f\x6e\x3e\x0a\x20\x20\x20\x20\x20\x20\x3c\x2f\
+\x72\x64\x66\x3a\x44\x65\x73\x63\x72\x69\x70\x74\x69\x6f\x6e\x3e\
+\x0a\x20\x20\x20\x3c\x2f\x72\x64\x66\x3a\x52\x44\x46\x3e\x0a\x3c\
+\x2f\x78\x3a\x78\x6d\x70\x6d\x65\x74\x61\x3e\x0a\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\
+\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x0a\x3c\x3f\x78\x70\
+\x61\x63\x6b\x65\x74\x20\x65\x6e\x64\x3d\x22\x77\x22\x3f\x3e\x13\
+\x9d\x8d\x8f\x00\x00\x00\x20\x63\x48\x52\x4d\x00\x00\x7a\x25\x00\
+\x00\x80\x83\x00\x00\xf9\xff\x00\x00\x80\xe9\x00\x00\x75\x30\x00\
+\x00\xea\x60\x00\x00\x3a\x98\x00\x00\x17\x6f\x92\x5f\xc5\x46\x00\
+\x00\x18\xe9\x49\x44\x41\x54\x78\xda\xec\xdd\xe1\x75\xdb\x46\xba\
+\x06\xe0\x6f\x79\xf2\xff\x22\x15\x2c\x5d\x41\x98\x0a\x4c\x17\xe0\
+\x13\xba\x82\xd0\x15\x44\xaa\x40\x52\x05\xe2\x56\x20\xa6\x02\xd3\
+\xc7\x05\x98\xae\xc0\x4c\x05\xe6\x56\x10\xdc\x0a\x7c\x7f\x60\x78\
+\x45\x3b\x76\x62\x59\x24\x30\x33\x78\x9e\x73\x74\x14\x27\xbb\x09\
+\x39\x18\xe0\x9d\x6f\x30\x03\xfc\xeb\xe3\xc7\x8f\x01\x00\x63\x35\
+\xd1\x04\x00\x08\x42\x00\x10\x84\x00\x20\x08\x01\x40\x10\x02\x80\
+\x20\x04\x00\x41\x08\x00\x82\x10\x00\x04\x21\x00\x08\x42\x00\x10\
+\x84\x00\x20\x08\x01\x40\x10\x02\x80\x20\x04\x00\x41\x08\x00\x82\
+\x10\x00\x04\x21\x00\x08\x42\x00\x10\x84\x00\x20\x08\x01\x40\x10\
+\x02\x80\x20\x04\x00\x41\x08\x00\x82\x10\x00\x04\x21\x00\x08\x42\
+\x00\x10\x84\x00\x20\x08\x01\x40\x10\x02\x80\x20\x04\x00\x41\x08\
+\x00\x82\x10\x00\x04\x21\x00\x08\x42\x00\x10\x84\x00\x20\x08\x01\
+\x40\x10\x02\x80\x20\x04\x00\x41\x08\x00\x82\x10\x00\x04\x21\x00\
+\x08\x42\x00\x10\x84\x00\x20\x08\x01\x40\x10\x02\x80\x20\x04\x00\
+\x41\x08\x00\x82\x10\x00\x04\x21\x00\x08\x42\x00\x10\x84\x00\x20\
+\x08\x01\x10\x84\x00\x20\x08\x01\x40\x10\x02\x80\x20\x04\x00\x41\
+\x08\x00\x82\x10\x00\x04\x21\x00\x08\x42\x00\x10\x84\x00\x20\x08\
+\x01\x40\x10\x02\x80\x20\x04\x00\x41\x08\x00\x82\x10\x00\x04\x21\
+\x00\x08\x42\x00\x10\x84\x00\x20\x08\x01\x40\x10\x02\x80\x20\x04\
+\x00\x41\x08\x00\x82\x10\x00\x04\x21\x00\x08\x42\x00\x10\x84\x00\
+\x20\x08\x01\x40\x10\x02\x80\x20\x04\x00\x41\x08\x00\x82\x10\x00\
+\x04\x21\x00\x08\x42\x00\x10\x84\x00\x20\x08\x01\x40\x10\x02\x80\
+\x20\x04\x00\x41\x08\x00\x82\x10\x00\x04\x21\x00\x08\x42\x00\x10\
+\x84\x00\x20\x08\x01\x40\x10\x02\x80\x20\x04\x00\x41\x08\x00\x82\
+\x10\x00\x04\x21\x00\x08\x42\x00\x10\x84\x00\x20\x08\x01\x40\x10\
+\x02\x80\x20\x04\x40\x10\x02\x80\x20\x04\x00\x41\x08\x00\x82\x10\
+\x00\x04\x21\x00\x08\x42\x00\xa8\xdc\x0f\xa7\xfc\x97\x3d\x7f\xfe\
+\x5c\x8b\x32\x06\x4d\x44\xcc\x8e\xfe\x3c\xff\xec\x9f\x3f\xfd\xca\
+\xff\x6f\x96\xfe\xbf\x0f\xb1\x8b\x88\xf6\x0b\x7f\x7f\x1f\x11\xff\
+\x3d\xfa\x73\x9b\xfe\xb7\x07\x5b\x87\xa9\x1f\x6f\xde\xbc\xd1\x08\
+\x82\x10\xaa\x72\x08\xab\x69\xfa\xf9\x9f\xa3\xd0\x9b\x0f\xf4\x79\
+\x1e\xe3\x38\x20\x77\x11\xf1\xbf\x29\x44\x8f\x7f\x40\x10\xc2\x48\
+\xc3\x6e\x1e\x11\xff\x3e\x0a\xbd\x69\xa5\xd5\xeb\xfc\x1f\x82\xfc\
+\x10\x88\x87\xa0\xdc\x7e\xa1\xc2\x04\x41\x08\x05\x9a\xa6\xd0\x9b\
+\x45\xc4\x4f\x47\x7f\xe6\xaf\xed\x34\x3d\x0a\xca\xab\xa3\x7f\xb6\
+\x4b\x21\xf9\xc7\xd1\x5f\x0b\x48\x04\x21\x64\x5a\xe5\x1d\x02\x6f\
+\x16\xc3\x4c\x63\xd6\xdc\xae\x8b\xcf\xfe\xfe\x36\x05\xe2\x21\x20\
+\x85\x23\x82\x10\x7a\xd4\xa4\xa0\x9b\x45\xb7\x30\x45\xe8\xf5\x6f\
+\xfe\x85\x76\x3f\x84\xe3\xbb\xa3\xea\x11\x04\x21\x9c\xc0\x34\x5d\
+\x74\x0f\xa1\x37\xd5\x24\x59\x87\xe3\x45\xfa\xf3\x3e\x85\xe3\x1f\
+\x47\x21\x09\x82\x10\x04\xdf\xa8\x8e\xe3\xf2\xe8\xcf\x6d\x0a\xc4\
+\x77\x82\x11\x41\x08\x7f\xb5\x38\x0a\xbe\x99\xe6\xa8\x52\x93\x8e\
+\xf3\xe2\xb3\x8a\xf1\x5d\x44\x6c\xe2\xcb\xfb\x25\x41\x10\x52\x75\
+\xb5\x70\x08\xbf\x85\xe6\x18\x75\xc5\xb8\x8c\x88\xbb\x54\x21\xbe\
+\x4e\xa1\xa8\x5a\x44\x10\x52\xa5\x59\x44\xfc\xaa\xea\xe3\x6f\xfa\
+\xc7\x2c\xba\xed\x1b\x87\x6a\xf1\x10\x8c\x20\x08\x29\xd6\x71\xd5\
+\x37\xd5\x1c\x7c\x47\xb5\xd8\x7e\x16\x8a\xad\xe6\x41\x10\x92\xbb\
+\x79\xaa\xfc\x16\xf1\xf0\x67\x6b\xc2\xe7\x9a\xb8\xbf\xb7\x78\x97\
+\xc2\x50\x28\x72\x32\xde\x3e\xc1\xa9\xcc\x22\xe2\x36\x22\x3e\x44\
+\xc4\xdb\x34\x92\x17\x82\x9c\xc3\x21\x10\xff\x4c\xbf\x17\x9a\x04\
+\x15\x21\x43\x99\xa6\x8b\xd0\x6f\x61\xda\x93\x61\x2c\xe3\x7e\xfa\
+\x74\x13\x11\xff\x09\x0b\x6d\x50\x11\x72\x66\x4d\xba\xf0\xbc\x4d\
+\xd5\xdf\xad\x10\x24\xa3\x7e\xf9\x3e\xf5\xcb\x6b\xfd\x12\x41\xc8\
+\xa9\xcd\xa2\x9b\x86\xfa\x90\x7e\xcf\x35\x09\x99\x9a\x46\xb7\xf2\
+\xf4\x43\x44\xbc\x8a\x4f\x37\xf5\x83\x20\xe4\xbb\x47\xd9\xef\xc3\
+\x7d\x3f\xca\xb3\x88\xfb\xfb\x89\x66\x2f\x10\x84\x3c\x68\x44\x7d\
+\x5c\xfd\xcd\x34\x09\x15\x0c\xea\x2e\xe2\x7e\x31\xd7\x42\x93\x20\
+\x08\xf9\xda\xe8\xf9\x70\xef\x4f\xf5\x47\xad\xe6\xd1\x4d\x99\x1e\
+\xee\x25\xea\xe7\x82\x10\x23\xe5\xff\x1f\x29\xbf\x0a\xf7\xfe\x18\
+\x8f\x69\xdc\xdf\x4b\xbc\x0b\xd3\xa6\x82\x90\x51\x5e\x04\x0e\xfb\
+\xfe\xdc\x3b\x61\xec\x83\xc1\x65\xdc\x4f\x9b\x1a\x0c\x0a\x42\x2a\
+\x37\x8b\xfb\xfb\x7f\x17\x61\x5a\x08\x8e\xcd\x53\x18\x1e\x16\x87\
+\x21\x08\x71\x82\xc3\xe8\x07\x8c\xce\x17\x41\x48\x25\x01\x68\xca\
+\x07\x1e\x6e\x7a\x14\x88\xd7\x61\x06\x45\x10\x22\x00\x61\xc4\x81\
+\x78\x25\x10\x05\x21\x02\x10\xc6\xae\x11\x88\xf5\xf9\xd7\xc7\x8f\
+\x1f\x4f\xf6\x2f\x7b\xfe\xfc\xb9\x16\x1d\x36\x00\xaf\x84\x1f\xf4\
+\xaa\x8d\x88\x9b\x88\x58\x69\x8a\xfe\xbd\x79\xf3\x46\x45\x88\x0a\
+\x10\x32\xa8\x10\x0f\xdb\x90\x96\x9a\xa3\x4c\x82\xb0\x5c\xd3\xe8\
+\x36\xc0\x0b\x40\xc8\xe3\x7c\x3c\x2c\xaa\x59\x68\x0e\x41\x88\x13\
+\x0e\x0c\x50\x0d\x50\x05\x21\x27\xd7\x44\x77\x73\xde\x3e\x40\xc8\
+\xdf\x3c\x85\xe1\xab\xf0\xd4\x26\x41\xc8\x49\x2c\x53\x00\x5e\x85\
+\x55\x6a\x50\x92\x45\x58\x61\x2a\x08\x79\xf4\xa8\xf2\x7d\x78\x20\
+\x30\x94\xee\xb0\xe5\x62\xa9\x29\xf2\xf3\x83\x26\xc8\xd2\x34\x9d\
+\x38\x4e\x9a\x3a\xed\xa2\x5b\x76\xff\xad\x9a\xf0\x4e\xc8\x1a\x34\
+\x69\x50\xfb\x5b\x44\x5c\x46\xc4\x56\x93\x08\x42\xbe\xec\x3a\x9d\
+\x28\x8d\xa6\x28\xd6\x3e\xfd\xbc\x3b\xfa\xeb\x36\x05\xe0\x29\x06\
+\x49\xc7\x3f\x4f\x8f\xfe\x9a\x32\xcc\xa2\xbb\x7f\xb8\x4e\x81\xd8\
+\x6a\x12\x41\x48\x67\x1e\xa6\x40\x4b\xd4\xa6\x91\xfd\x1f\xe9\xf7\
+\x43\xab\xbd\xef\x0d\xd9\xaf\x55\x8d\xf3\x88\xf8\x29\xfd\x36\x98\
+\xca\xdb\x32\xba\x7b\x88\x36\xe4\x0b\xc2\xd1\x9b\x46\xb7\x21\x77\
+\xa1\x29\x8a\xb1\x49\xd5\xde\xf6\x44\x55\xde\x29\x03\x79\xfb\x59\
+\xe5\x31\x4f\x55\xa3\xfe\x95\xa7\x26\x9d\xff\xbf\x86\xe9\x52\x41\
+\x38\x52\x17\x61\x25\x68\x29\x55\xdf\x26\x22\x5e\xa7\x0b\x55\x5b\
+\xc8\xe7\xde\xa5\x9f\x55\xea\x63\xf3\x88\xf8\x25\x85\xa2\x3e\x97\
+\x97\x59\x74\xd3\xa5\xab\x54\x21\xb6\x9a\xa4\x3f\x56\x8d\x0e\xd7\
+\xe9\xdf\xa7\x91\xa0\x0b\x52\xde\x95\xdf\xcb\x88\xf8\x31\xfd\xde\
+\x14\x7c\x81\x6a\xbf\xf2\x7d\xc8\x6f\x70\xec\x61\x19\x82\xb0\x6a\
+\x4d\xdc\x6f\x8a\x9f\x69\x8e\x2c\xed\xd3\x88\xfc\x49\x44\xbc\x88\
+\x6e\x41\x43\x8d\xd6\xe9\xfb\x3d\x49\xdf\x77\xef\xd0\x67\x75\x9d\
+\x78\x95\x7e\x0c\x94\x05\x61\x55\xe6\x71\xbf\x29\x9e\xfc\x6c\x53\
+\x95\xf4\x24\x0d\x56\xc6\x12\x0c\xfb\xf4\x7d\x9f\xa4\xef\xbf\xd5\
+\x15\xb2\xb1\x08\x7b\x0f\x05\x61\x45\xa3\xbb\xdb\xe8\xe6\xff\xa7\
+\x9a\x23\xcb\x00\x7c\x96\x7e\xd6\x23\x6f\x8b\xf5\x51\x5b\x08\xc4\
+\x7c\xae\x1f\x77\xae\x1f\x82\xb0\x86\x2a\xf0\x42\x53\x64\x1d\x80\
+\x2e\xfa\xda\xc6\xb5\x44\x10\xa2\x0a\x1c\x8d\x9d\x8b\xfc\x77\x05\
+\xe2\x4e\x73\x64\x73\x5d\x71\xef\x50\x10\x66\x6f\x66\xe4\x96\xa5\
+\x36\xba\x7b\x60\x3f\x0b\xc0\xef\x0a\xc4\x9f\x53\xfb\xb5\x9a\x63\
+\x70\x8b\xb0\xb2\x54\x10\x66\xec\x3a\x85\xa0\x2a\x30\x2f\xab\xe8\
+\x16\x83\xac\x35\xc5\xa3\xac\x53\x3b\xae\x34\x45\x16\xd5\xe1\xab\
+\xe8\xee\x1f\xaa\x0e\x05\x61\x56\x55\xa0\x15\xa1\x79\xd9\x47\x37\
+\xad\xe7\x79\x8e\xa7\xad\xac\x2f\x53\xbb\xee\x35\xc7\xe0\x96\xe9\
+\xda\x33\xd7\x14\x82\x70\x48\x17\xd1\xdd\x0b\x9c\x69\x8a\xec\xaa\
+\x40\xd3\xa0\xe7\xb3\x4d\xed\xab\x3a\x1c\xde\x34\x5d\x83\xae\x35\
+\x85\x20\xec\x5b\x13\xdd\xd4\x84\xa7\xc3\xe4\x57\xb1\xa8\x02\xfb\
+\xaf\x0e\xb5\xf5\xf0\xae\xc2\x02\x3d\x41\xd8\xa3\x79\x74\xd3\x11\
+\x0b\x4d\x91\x95\x4d\x74\xf7\xb0\x54\x81\xfd\x57\x87\x4f\xc2\x23\
+\xdb\x5c\x9b\x04\xe1\x68\x5c\x1b\x75\x65\xe9\x26\xba\x47\x86\xa9\
+\x4c\x86\xab\x0e\x5f\xa4\xe3\xc0\xb0\x9a\xb8\x9f\xad\x42\x10\x9e\
+\xbc\x73\xbd\x0d\x0b\x62\x72\xbc\x00\x3f\x0b\xf7\x47\x72\x1a\x28\
+\x9a\x2a\xcd\xc3\x45\x58\xc5\x2e\x08\x4f\x68\x1e\xdd\xbe\x9d\xb9\
+\xa6\xc8\xca\x2e\x6c\x8c\xcf\xd1\x36\x6c\xc2\xcf\xc5\x2c\x4c\x95\
+\x0a\xc2\x13\x8d\x70\xdf\x86\x05\x31\xb9\x86\xa0\x8b\xad\xe3\xc3\
+\xdf\x6b\xa2\x9b\x2a\xbd\xd6\x14\x82\xf0\x7b\x3b\x8f\xa9\xd0\xfc\
+\xac\xc3\xf4\x5b\x09\xda\xf0\x30\xf3\x9c\x5c\x19\xd4\x0b\xc2\x87\
+\x98\x85\xe9\x84\x9c\x43\xd0\xa3\xbe\xca\x0a\xc3\x97\xc2\x30\x1b\
+\xf3\xf0\x3e\x54\x41\xf8\x0d\x96\x61\x55\x68\xee\x21\x48\x79\x84\
+\x61\x3e\xa6\xe9\x1a\xb7\xd4\x14\x82\xf0\x4b\x6e\xc3\xb3\xfb\x84\
+\x20\xc2\xb0\x7e\x4d\xba\xd6\xd9\x62\x21\x08\x3f\xe9\x14\x6f\xc3\
+\x1b\x23\x84\x20\xc2\x70\x5c\x2e\xc2\x7d\x43\x41\x18\xf7\xf7\x03\
+\xe7\x9a\x42\x08\x22\x0c\x47\x68\x1e\x23\x7f\x5e\xf2\xd8\x83\x70\
+\x19\xee\x07\xe6\x6c\x17\xdd\xb3\x2c\xa9\xcf\x65\xd8\x5a\x91\x5b\
+\x41\xf0\x76\xac\x05\xc1\x98\x83\xf0\x3a\xdc\x0f\xcc\x3d\x04\x6d\
+\x91\xa8\x57\x1b\xf6\x19\xe6\xa6\x89\x91\x2e\xa2\x19\x6b\x10\xde\
+\x85\xfd\x81\xb9\x5f\x24\x6d\x91\x70\x9c\x19\xee\xfa\x78\x27\x08\
+\xeb\x1e\xf1\xbc\x0f\xcb\x86\x73\xf7\x42\xa5\x30\xaa\xca\xff\x85\
+\x66\xc8\xce\x32\xba\x07\x8a\x34\x82\xb0\x2e\xb3\xb0\x91\xb4\x04\
+\x37\xe1\xd9\xa1\x63\xb3\x0d\x6f\xad\xc8\xd1\x22\x46\xb2\xa2\x74\
+\x2c\x41\x38\x0b\x8b\x62\x4a\xb0\x09\xcf\x43\x1c\xab\xeb\xf0\x3e\
+\x43\x05\x84\x20\x3c\x6b\x89\xff\x3e\x2c\x8a\xc9\x5d\x1b\xb6\x49\
+\x8c\x9d\xfb\x85\x79\x9a\x46\xe5\xdb\x2b\x6a\x0f\xc2\x8b\x18\xd9\
+\x4d\xdf\x82\x79\xa9\x2e\x6d\xb8\x5f\x98\xab\x26\x2a\x5e\x51\xfa\
+\x43\xc5\x07\xee\x2e\x2c\x8a\x29\xc5\x2a\xc6\x73\x5f\xb0\x49\x23\
+\xeb\x69\x7c\xdb\x54\xfd\x3e\xfd\xec\x46\x32\x50\xd8\xa6\xfe\x70\
+\xe1\xb4\xc8\xb2\xef\x1e\x0a\x8b\xb5\x20\x14\x82\x9c\xce\x3e\xea\
+\x5d\x28\xd1\x44\xb7\x41\x79\x16\x11\x4f\xd3\xef\xe6\x91\x15\xd3\
+\x2e\x22\xde\xa5\xdf\xdb\x4a\xc3\xf1\x26\xba\x85\x1a\x53\xa7\x47\
+\xb6\xd7\xd7\x26\x0d\x58\x04\x61\xc6\xe5\xfb\x4c\x5f\x2d\x46\x6d\
+\xf7\x85\xa6\xe9\x22\xfe\x4b\x9c\xfe\x29\x1d\x87\x60\x9d\x7f\x56\
+\x41\xbd\x8e\x6e\xa1\xc9\xbe\x92\x36\x6c\x53\xbf\x78\xeb\xf4\xc8\
+\xd6\x6d\x44\xfc\x14\x95\xdc\xd7\xaf\xe9\x1e\xa1\x10\x2c\xcf\x2a\
+\xea\x99\x12\x5d\xa6\xfe\xf7\x21\x5d\x24\xe6\x3d\xfd\x77\xe7\xe9\
+\xbf\xf7\x21\xea\xba\x87\xb3\xad\xa9\xe2\xa8\xd4\x32\x2a\x59\x83\
+\x51\x4b\x10\x0a\xc1\x32\x47\xfd\x37\x15\xf4\xbb\xeb\x88\xf8\x33\
+\x5d\x10\xe6\x03\x7f\x9e\x79\xfa\x1c\x7f\xa6\xcf\xd5\x14\xde\xbe\
+\x37\x61\x01\x95\x30\x14\x84\xdf\x64\x96\x46\xc3\x42\xb0\x2c\x97\
+\x05\x5f\xe4\x0e\x01\xf8\x21\xba\x47\xf5\x35\x19\x7e\xbe\xab\xf4\
+\xf9\x4a\x0e\xc4\x36\x3c\x74\x5d\x18\x0a\xc2\x6f\x0a\xc1\xd1\xbf\
+\x4b\xab\x40\xbb\x28\x77\xd5\xd9\x32\xe3\x00\xfc\xbb\x40\x5c\x16\
+\xda\xde\xeb\xf0\xb8\xbd\x52\xce\x8b\x62\xf7\x6b\x97\x1c\x84\x42\
+\xb0\xec\x6a\xb0\xd4\xfe\x56\xe2\x1b\x4b\x9a\xf4\xb9\x4b\xbd\x7d\
+\xa0\x2a\x74\x4d\x16\x84\x42\xb0\x2a\xdb\x28\x6f\x81\xcc\x45\xd4\
+\xf1\xf2\xe6\x79\xfa\x1e\x17\xfa\x0c\xae\xcd\x65\x07\xa1\x10\x2c\
+\x5b\x49\x0b\x64\x9a\xd4\xd7\x6e\x2b\x3b\x06\xb7\x05\x9e\x43\x1e\
+\xca\xed\x1a\x2d\x08\x85\xa0\x6a\x70\x80\xbe\x56\x43\x15\xf8\x4f\
+\xd5\xe1\x4c\xdf\x61\xec\xd7\xea\x89\x86\xc5\xa8\xfe\x2f\x16\x31\
+\x8e\xb7\x95\x4c\xd3\xf7\x5c\xe8\x3f\x8c\xf9\x9a\x3d\xd1\xa0\x18\
+\xd1\x7f\x62\x19\x23\x7a\x21\x69\xfa\x9e\xaf\xa2\x8c\x55\xa5\xaa\
+\x42\x61\x38\xda\x20\x14\x82\x75\xf8\xbd\x90\x10\x1c\xeb\xdb\x4a\
+\x4a\x79\x3e\xef\xef\x4e\x25\x61\x38\xb6\x20\x14\x82\x75\xd8\x47\
+\xfe\xfb\x06\xc7\x1c\x82\x25\x85\xe1\x3a\xea\x79\xa6\xea\xd8\xc2\
+\x30\xdb\xf3\x6b\x92\x79\xc3\x09\x41\xd5\x60\x1f\x16\x42\xf0\x93\
+\x30\x5c\xe8\x4f\x8c\xe9\x3c\xcb\x35\x08\x85\x60\x5d\x72\xae\x06\
+\xb3\x1e\xa9\x0e\x18\x86\x33\xfd\x89\x33\x58\xe6\x78\xbe\xe5\x18\
+\x84\x42\xb0\x2e\x9b\xc8\x77\x2a\xab\x89\x71\x2d\x8c\xa9\xa5\x5d\
+\xf6\xa9\x5f\x21\x0c\xab\x0c\x42\x21\x58\x9f\xd7\x19\x7f\xb6\x57\
+\xe1\xe5\xaf\x5f\x33\x4d\xed\xa3\x5f\x71\xae\x30\xbc\x16\x84\x46\
+\xe7\x63\xd0\x46\xbe\xd3\x58\x17\x51\xef\x66\xf9\x53\x99\x47\xbe\
+\x8f\x63\x5b\x87\x57\x34\x95\xee\x2a\x32\x59\x9c\x95\x4b\x10\x36\
+\x31\x8e\x0d\xcc\x63\xb3\xc9\xf4\x73\xcd\xa2\xbe\xc7\xa6\x9d\xcb\
+\x6d\xe4\x7b\xbf\x70\xe3\xf0\x14\x2f\x8b\x95\xca\x39\x04\xe1\x21\
+\x04\x67\xfa\x44\x75\x72\x9d\xbe\x12\x82\x75\xb4\x97\xe9\x51\x83\
+\xad\x6a\x82\xf0\x95\x10\xac\xd6\x36\xc3\xcf\xb4\x0c\x53\xa2\x0f\
+\x35\x8f\x3c\xf7\x17\x6e\x1d\x9a\x2a\x0c\x5e\x0c\x0d\x1d\x84\x77\
+\x2e\x4a\xd5\xda\x44\x7e\xf7\x70\x1a\xd5\xe0\xa3\x46\xed\x4d\x66\
+\x9f\xa9\x0d\xd3\xa3\x35\x85\xe1\x60\x6b\x44\x26\x03\x9f\x58\x4b\
+\xc7\xbf\x5a\xef\x32\xfc\x4c\x17\x61\x31\xd6\x63\x2e\x54\x17\xfa\
+\x19\x67\x34\x8d\x81\x76\x0d\x0c\x15\x84\xcb\x28\xef\xe5\xa0\x3c\
+\xcc\x36\xc3\x0b\xf9\x6f\x0e\xcb\xa3\xfc\x96\xe1\x40\x62\xeb\xb0\
+\x54\x65\x16\x03\xec\x31\x1c\x22\x08\x17\xe1\x49\x1e\xb5\x6b\x23\
+\x62\xa7\x1a\x54\x15\xf6\x60\x17\xb6\x51\xd4\x66\x11\x3d\xdf\xc2\
+\xe8\x3b\x08\x07\x49\x7b\x8c\xd2\x55\x83\x55\xb7\xa3\xaa\xb0\x3e\
+\x17\xd1\xe3\xad\xb3\x3e\x83\xb0\x09\x4f\x8d\x19\x8b\x3f\x32\xfb\
+\x3c\x4b\xfd\xee\xa4\xe7\xf1\x52\x7f\xa3\x07\xbd\x2d\xa6\x9c\xf4\
+\x78\xf2\x08\x41\x15\xe1\x50\x7e\x75\x48\xaa\x6e\x4f\x15\x61\xbd\
+\x7a\x79\x0c\x62\x5f\x41\x98\xfb\xd3\xec\x39\xad\x5d\x46\x9f\x65\
+\x1a\xb6\xe8\x9c\xda\x3c\xf2\x7a\x0a\xd4\xce\x21\xa9\x56\x13\x3d\
+\x6c\xab\xe8\x23\x08\xaf\x23\xff\xf7\x9b\x71\x3a\xfb\xc8\x6b\xf1\
+\x82\xbe\x57\x7f\xbb\xb6\xe1\x65\xbd\x35\x9b\xc5\x99\x17\xcf\x9c\
+\x3b\x08\x97\xd1\x3d\x58\x95\x71\x05\x61\x4e\x7e\x71\x48\x46\xd1\
+\xae\x82\xb0\x6e\xcb\x38\xe3\x8a\xe5\x73\x06\xe1\xd9\x53\x9c\x2c\
+\xe5\xb4\xc1\xb9\x09\xd3\xa2\xe7\x32\x8f\xbc\xee\xf9\xdb\x58\x5f\
+\xbf\xdb\x73\x9d\xcf\xe7\x0a\xc2\x26\xbc\x52\x49\x45\x98\xc7\xc5\
+\x9a\x71\xb4\x6f\xeb\x70\x8c\xc2\x59\x72\xe5\x5c\x41\x78\x17\x5e\
+\xa9\x24\x08\x87\x37\x73\x38\x46\xd3\xbe\x3b\x87\x63\x14\x0e\x45\
+\x56\xf6\x41\x78\x1d\x16\x28\x08\xc2\x3c\x3c\x75\x38\x46\xd3\xbe\
+\x2a\xc2\xf1\x98\xc7\x89\xdf\x6e\x3f\x39\xc3\x07\xb4\x38\x46\x10\
+\xaa\x58\x54\x84\x2a\x42\xce\xe9\x2a\x4e\x38\x35\x3f\xa9\xf8\xc4\
+\x60\xdc\x9a\x70\x8f\x5a\x1b\x63\x20\x36\x40\x10\xae\xc2\x53\x1e\
+\xc6\x6c\x57\xe3\x49\x82\xaa\x90\xec\xec\x53\xde\x64\x19\x84\x11\
+\x11\x2f\xc3\x7c\xfd\x58\xe5\x74\xdc\xa7\x0e\xc7\xe8\xda\xd9\x75\
+\x67\x3c\x5e\x9e\xf2\x5f\x76\x8e\x20\xdc\x9f\xfa\x43\x82\x20\xd4\
+\xce\x90\xac\xe2\xc4\x33\x8f\xe7\xda\x3e\xb1\x39\x65\xd9\x0a\x00\
+\xa9\xd0\xba\x39\xf5\xbf\xf4\x9c\x4f\x96\xb9\x0c\x73\xf6\x00\x9c\
+\xce\x59\x6e\xbd\x9d\xfb\x59\xa3\x2f\xc2\xbc\x3d\x00\x8f\xb7\x8a\
+\x33\x2d\xc6\x3c\x77\x10\xee\xc3\xfd\xc2\x31\xd9\x6b\x02\x06\x64\
+\xd0\x5d\xaf\x5d\x9c\x61\x4a\xb4\xaf\x20\x8c\x70\xbf\x70\x4c\xa6\
+\x9a\x80\x01\x35\x9a\xa0\x5a\x67\xdd\x8d\xd0\xd7\x8b\x79\x2f\xc3\
+\xfe\x42\x00\xbe\x2f\x3f\x76\xe7\xfc\x0f\x4c\x7a\xfc\x32\x2f\xc2\
+\xd4\x19\x00\xdf\x6e\x1b\x3d\xcc\x28\xf6\x19\x84\x6d\x58\x3c\x03\
+\xc0\xc3\x32\xe3\xec\x26\x3d\x7f\xb1\x5d\x2a\x73\xe1\xdc\xf6\x9a\
+\x40\x3b\x53\xb4\xde\x9e\x52\x36\x19\xe0\xcb\xad\xc3\xe2\x99\x5a\
+\x35\x2e\xd0\x82\x50\xff\xe3\x04\x56\xd1\x2d\xb4\xec\xc5\x64\xa0\
+\x2f\x69\xf1\x4c\x9d\x66\x19\x7d\x96\x9d\xc3\x31\xba\x76\x9e\x39\
+\x1c\xd5\xf4\xa9\x5e\x67\x0e\x27\x03\x7e\xd9\x17\x2e\x56\x9c\x51\
+\x1b\xee\x47\x6b\x63\x4a\xec\x53\x2f\xfa\xfe\x8f\x4e\x06\xfe\xc2\
+\xde\x54\xa1\x2a\x54\x15\xaa\x06\x55\x83\x1c\xbc\x8c\x01\xa6\xdb\
+\x27\x19\x9c\x48\x2f\x1c\xfb\xaa\x34\x19\x7d\x96\x77\x0e\xc7\x68\
+\xda\xb7\x71\x38\x8a\xb7\x8a\x1e\xef\x0b\xe6\x14\x84\x11\xdd\xbd\
+\x42\x8f\x61\x53\x11\xaa\x08\x55\x84\x2a\xc2\xf1\xda\xc6\x80\x3b\
+\x0a\x26\x99\x34\xc2\x3a\xfd\xa0\x22\x3c\xf5\xc9\xc5\x38\xda\x57\
+\x45\x58\xae\x36\x06\x9e\x19\x9c\x64\xd4\x18\x2f\x87\x2a\x8b\x39\
+\xa9\xa7\x99\x9d\x60\xc2\xf0\x7c\x21\xd8\xea\x77\x9c\xc0\xb3\xa1\
+\xfb\xd2\x24\xb3\x06\x79\x19\xa6\xb3\x4a\x37\xcd\xec\xf3\xbc\x76\
+\x48\x46\xd1\xae\x53\x87\xa4\x48\x59\x5c\xf3\x73\x0b\xc2\x36\x8d\
+\x0e\xf6\xfa\x47\xd1\x41\xd8\x64\xf4\x79\x36\x0e\x49\xf5\xed\xda\
+\x08\xc2\x22\xad\x23\x93\x5b\x62\x93\x0c\x1b\xa7\x0d\xcf\x24\x2d\
+\xdd\x2c\xa3\xcf\xb2\x0f\xd3\xa3\xa7\xb6\xcd\x6c\xb0\x3a\x73\x48\
+\x8a\xb3\x8b\x8c\x16\x49\x4e\x32\x6e\xa4\x67\xfa\x4a\xb1\xe6\x99\
+\x7d\x9e\xdf\x1d\x92\xaa\xdb\x73\xee\x90\x14\xa5\xcd\xed\xfa\x3e\
+\xc9\xb8\xb1\xb2\x1a\x31\xf0\x20\x3f\x65\xf6\x79\xd6\x61\x86\xe1\
+\x94\x17\xb1\xb5\xfe\xc6\x23\x43\x30\xab\xf3\x71\x92\x79\xa3\xad\
+\x85\xa1\x8a\xf0\x44\xfe\xe3\xb0\x54\xdb\x8e\x2a\xc2\x72\x9c\xfd\
+\x25\xbb\x35\x06\xe1\x21\x0c\x57\xfa\x4f\x51\x9a\xc8\xef\xbe\xcd\
+\x4a\x55\x78\x92\xd1\x7c\x6e\xe7\xe2\x2c\xec\x21\x2c\xc5\x4d\x64\
+\xba\x5f\x7c\x52\x48\x03\x5e\x86\x0d\xf7\xaa\xc2\xc7\x5f\xc4\x55\
+\x85\x8f\xaf\x06\x5b\xfd\x8c\xef\x2c\x68\xae\x73\xfd\x70\x93\x82\
+\x1a\xf2\xa5\x30\x2c\x4a\x8e\x1b\x9c\x55\x85\x75\x55\x83\xb9\xf6\
+\x33\x3e\xb5\x8b\xcc\x6f\x71\x4d\x0a\x6b\xd0\x2c\xe7\x97\xf9\xa2\
+\x45\xe4\x37\x65\xd5\xc6\x80\xcf\x33\x2c\xdc\x65\x86\x83\x88\x26\
+\xf5\x33\xf2\x0e\xc1\xec\x77\x00\x94\x16\x84\x6d\x6a\x54\x61\x58\
+\x86\x79\x86\x9f\x69\x1d\xf6\x15\x3e\xd4\x36\xf2\x9c\x8d\x99\x3b\
+\x34\xd9\x5f\xaf\x8b\x78\xd5\xde\xa4\xd0\xc6\x15\x86\x65\xf8\x25\
+\xe3\xea\x86\xf2\xdb\xeb\x17\x87\xc6\x75\x7a\xac\x41\x28\x0c\xcb\
+\xb1\xc8\xf4\x73\xed\x84\xe1\x83\x42\x70\xa7\x7f\x51\x51\xbf\xa9\
+\x26\x08\x8b\x2a\xbb\x47\xac\x89\x88\x65\xa6\x9f\x6d\x15\xa6\x48\
+\xff\xc9\x36\xf2\xdd\xba\xb4\x0c\xdb\x26\x72\x55\xdc\xc2\xc6\x49\
+\xe1\x0d\xbe\x8b\x0c\x9f\x52\xc0\x27\x72\x9e\xbe\x7a\x11\x1e\xf0\
+\xfe\x35\xfb\x18\xf8\x1d\x71\x05\xf7\xab\x31\x5b\x45\x81\xab\xfb\
+\x27\x15\x34\xbc\x30\xcc\xdb\x22\xf2\x7d\x33\x40\x1b\x1e\xf0\x5e\
+\x62\xbb\x4c\xc3\xb4\x68\x8e\xd6\x51\xe8\x2d\x87\x49\x25\x07\x40\
+\x18\xe6\x6d\x99\x79\xdf\xf1\x18\xbf\x4f\xe5\xfe\x5e\xd0\xa5\x43\
+\x94\x65\x08\x16\x7b\x1e\x4d\x2a\x3a\x10\xc2\x30\x5f\xbf\x66\xfe\
+\xf9\x36\xc2\xf0\x93\x10\xdc\xe8\x4f\x3c\xf0\xda\x5b\xf4\xe2\xb3\
+\x49\x85\x07\x44\x18\xe6\x67\x5a\xc0\x28\xbe\xe8\x11\xed\x09\x43\
+\x70\x9d\xf9\x67\x5c\x86\x97\xf0\xba\xe6\x0a\x42\x61\xa8\x2a\x14\
+\x86\x23\x0d\x41\xd5\xa0\x6b\xad\x20\x14\x86\x45\x9b\x47\x19\x4f\
+\x02\x59\xc7\xb8\x16\xd0\xb4\xe9\xfb\xae\xf5\x21\xc6\x7a\x8d\x9d\
+\x38\x50\xf4\xe8\xaa\x90\xcf\xb9\x49\x7d\x67\x5f\xf9\xf1\xd8\xa7\
+\xef\xb9\xd1\x7f\x78\xe0\xe0\xa9\xaa\x3d\xdc\x93\xca\x0f\x98\x30\
+\x34\xa2\x7f\x4c\xdf\xf9\x39\xea\xdd\x74\xbf\x4d\xdf\x6f\xa7\xef\
+\xf0\xc0\x10\xac\xee\xa9\x5e\x93\x11\x1c\x38\x61\x68\x54\xff\xd8\
+\x93\xbe\xb6\xc7\xb1\x5d\x16\x78\x4e\xa8\x06\x85\xa0\x20\x14\x86\
+\xaa\xc2\x01\xad\x2a\xa9\x0e\x0f\x55\xe0\x4a\x9f\x41\x08\x8e\x2f\
+\x08\x85\x61\x5e\x6e\x0b\xee\x3f\x25\xde\x1b\x69\xd3\xe7\x2e\xf5\
+\x42\x76\xeb\x94\x11\x82\x82\xf0\xb4\x17\xb3\x27\xe1\xad\x15\x43\
+\x9b\x45\xb9\x4f\x07\x59\xa7\x3e\x74\x53\x40\x20\xb6\xe9\x73\x3e\
+\x89\x02\x9f\xff\x98\x2c\x53\x7f\x41\x08\x0a\x42\x07\xb6\xca\xaa\
+\xb0\x29\xb8\x0f\x5d\x67\x1c\x88\xc7\x01\x78\x1d\xe5\xce\x82\x34\
+\xaa\x41\xd7\x4a\x41\xe8\x00\xd7\xac\x89\xf2\x17\x40\x1c\x02\xf1\
+\xc7\xe8\xa6\x1e\xb7\x03\x7f\x9e\x6d\xfa\x1c\x3f\x16\x1e\x80\x07\
+\x57\xe1\x55\x4b\xae\x91\x82\xb0\x97\x03\xbd\xd5\xe7\x07\x73\x11\
+\xf5\x2c\x82\x58\xa7\xfe\xf4\x24\xba\x55\x99\x7d\xf5\xab\x6d\xfa\
+\xef\x3d\x49\xff\xfd\x75\x25\xed\x39\x4f\xfd\x03\x21\x78\x76\x3f\
+\x38\xe0\xf1\x2c\x22\xee\xc2\x13\xed\x87\x72\x17\xdd\x4a\xc6\xb6\
+\x92\xef\xb3\x8f\x6e\x55\xe6\x2a\x55\x33\xf3\xe8\xee\x71\x3d\x4d\
+\xbf\x9b\x47\xf6\xd7\x5d\x44\xbc\x4b\xbf\xb7\x51\xe7\xe2\xaf\x26\
+\xf5\x0b\x84\xa0\x20\xec\xd1\xe1\xf9\x92\xc2\xb0\x7f\xd3\xe8\xa6\
+\xc0\x2e\x2b\xfc\x6e\x6d\x74\x4f\x6d\xd9\x7c\x76\x91\x9f\xa5\xef\
+\x3d\xfd\xc6\x60\xdd\xa7\x0b\x53\x3b\x92\x3e\x71\x15\x1e\xac\x3d\
+\x84\x5d\x8c\xf4\x65\xd5\x82\xf0\xd3\x30\xfc\x23\xdc\x9c\x1f\xc2\
+\x45\x44\xbc\x8e\x71\x4c\x53\xb7\x61\x3a\xfe\xef\xcc\xc3\x94\xe8\
+\x50\x21\x38\xda\xed\x65\x13\xc7\xff\x13\xab\xf0\x2a\x9e\xa1\xbc\
+\x0a\x0b\x23\xc6\xae\x49\xfd\x00\x21\x28\x08\x07\xb6\x8e\x71\xbd\
+\x7d\x20\xa7\x8b\xa0\xfb\x42\xe3\x76\x67\x30\x24\x04\x05\x61\x3e\
+\x36\x3a\xc7\x20\x16\xd1\x2d\xfb\x67\x7c\xae\xd3\xf1\xa7\xdf\x41\
+\x7f\x4d\x0b\xd5\x04\xe1\x99\x46\x4a\x25\x3d\x9d\xbf\x16\x57\xe1\
+\xb9\x92\x63\x33\x0f\x0f\xd5\x1e\x22\x04\xdd\x06\x12\x84\xdf\x64\
+\x1f\xf6\x1a\x0e\xe1\x55\x78\xac\xd6\x58\xcc\xc2\x7d\xc1\xbe\xdd\
+\x08\x41\x41\xf8\x50\x6d\xd4\xb5\x51\xb9\x04\x4d\xb8\x5f\xe4\x38\
+\x73\x0e\x2f\xc3\xed\x07\x41\xf8\xc8\x0e\x74\xa9\x19\x7a\xad\x14\
+\xde\xba\x48\x56\x1d\x82\x6f\x55\xfe\xbd\x0e\xe8\x5f\x18\xd0\x0b\
+\xc2\x53\x58\x85\x15\xa5\x7d\x87\xa1\x7d\x9d\x75\xba\x15\x82\xbd\
+\x86\xe0\xb3\xf8\xf4\xc1\x0e\x08\xc2\x47\xd9\xa4\x4e\xb5\xd7\x14\
+\xbd\x58\x86\x6d\x15\xb5\xf1\x48\xc3\xfe\xec\xc2\xa2\x3f\x41\xa8\
+\x73\x09\x43\x84\xe0\x48\x6d\x0d\xda\x05\xe1\xb9\xb5\x29\x0c\xd7\
+\x9a\x42\x18\x22\x04\x33\xb3\x0e\x7b\xa1\x05\x61\x8f\x5e\x86\xa5\
+\xc8\xc2\x10\x21\xe8\x9a\x24\x08\x8d\xbe\x8c\xbe\x7a\x0e\xc3\x46\
+\x53\x14\xa1\x11\x82\xbd\x69\xc3\x56\x2f\x41\x38\xb0\x6d\xb8\x6f\
+\xd8\x67\x18\xda\x5a\x51\x46\x08\xbe\x15\x82\xbd\xd8\x85\x87\x7f\
+\x08\xc2\x4c\xec\xc3\x7d\xc3\xbe\xcc\xc2\x3e\x34\xc7\x87\x88\xfb\
+\x95\xec\x06\xe1\x82\x30\x2b\x87\x39\xfa\x56\x53\xf4\x72\xb1\x9d\
+\x6b\x8a\xac\xcc\x85\x60\x6f\x6e\xc2\xde\x66\x41\x98\xb1\x75\x58\
+\xba\xdc\x87\x26\x5d\x74\xaf\x35\x45\x16\xae\xc3\xb4\x75\x1f\xda\
+\x14\x80\xfa\xbd\x20\xcc\xde\x2e\xba\xa9\xd2\x8d\xa6\x38\xbb\xab\
+\xf0\x72\xdf\xa1\x07\x24\xaf\xc2\x5b\x24\x5c\x57\x04\x21\x7f\x33\
+\x72\xf3\x9c\xd2\xf3\x5b\x44\xc4\x87\x30\x55\xda\xb7\x79\x6a\xf7\
+\x85\xa6\x38\xbb\x75\x98\x69\x12\x84\x05\x5b\xa5\x51\x9c\x0e\x7c\
+\xfe\xca\xe4\x6d\x74\xcf\xb2\x54\x1d\x9e\xbf\xad\x6f\xc3\x54\x68\
+\x5f\x03\x6a\x6b\x0f\x04\x61\x15\x76\x61\x4a\xa3\x2f\x17\x11\xf1\
+\x5e\x75\x78\xd6\x2a\xf0\x7d\x6a\x67\xce\x7f\xdd\xb0\x3f\x50\x10\
+\x56\x37\xb2\x7b\x61\x64\xd7\x8b\xa9\xea\xf0\xac\x55\xe0\x54\x73\
+\x9c\xdd\x3a\x6c\x8d\x10\x84\x3a\x38\x27\xaa\x0e\x3f\x84\x8d\xdd\
+\x8f\xb5\x4c\xed\xa8\x0a\xec\x67\xc0\x6c\x2a\x54\x10\x8e\xc2\x2e\
+\xba\xa9\xd2\x1b\x4d\xd1\x4b\x25\x73\x17\xa6\x4b\xbf\xc7\x3c\xb5\
+\x9b\x47\xdb\xf5\x7b\x5d\x58\x6b\x0a\x41\x38\x26\xd7\x61\x25\x58\
+\x5f\x66\xd1\x4d\xeb\xd9\x88\xff\x6d\x01\x78\x68\xab\x99\xe6\xe8\
+\xc5\x4d\x58\x54\x27\x08\x47\x6c\x6b\x14\x38\xd8\x45\x5e\x20\x6a\
+\x9b\xa1\xed\xd3\x60\xf8\x5a\x53\x08\xc2\xb1\x6b\xa3\xbb\x27\xe0\
+\x91\x49\xc3\x5c\xf4\x97\x23\x6f\x8b\xa5\x00\x1c\xc4\x3a\x0d\x82\
+\xb7\x9a\x42\x10\x72\x6f\x13\x11\x4f\xc2\x36\x8b\xbe\x03\xf1\x2e\
+\xba\xc5\x20\xd7\x31\x9e\x15\x91\xd3\xf4\x7d\x3f\xa4\xef\x2f\x00\
+\xfb\x1d\xf8\x5a\x41\x2e\x08\xf9\x86\x93\x44\x75\xd8\x7f\x30\x5c\
+\xa5\x60\x78\x55\x71\x95\xb8\x4c\xdf\xef\x43\xfa\xbe\x53\x87\xde\
+\x60\x57\x10\xe2\x84\xe1\x73\x8b\x54\x25\xfd\x99\x7e\x2f\xa2\xdc\
+\x55\x93\xcd\x57\xbe\x0f\x06\xb8\xa3\xf7\x83\x26\x28\xea\xe4\x59\
+\x44\xb7\x99\xd9\xe8\xbd\xff\x10\x59\x1e\x55\x87\x9b\x88\x78\x17\
+\xdd\x3d\x9d\x5d\xc6\x9f\x7b\x16\xdd\x54\xe7\x53\xa1\x97\xcd\xa0\
+\xd6\x34\xa8\x20\xe4\x04\x27\xd2\x36\xba\xa9\xac\x0b\xcd\x31\x68\
+\xa5\xb8\x38\x1a\xa4\x6c\x23\xe2\x8f\xa3\x60\x1c\xe2\x42\xd7\x1c\
+\x05\xdf\x4f\xe9\x77\xe3\x50\x65\x61\x1f\xdd\x43\xf7\x37\x9a\x42\
+\x10\x72\xba\xea\xf0\x32\x22\x5e\xa7\xea\x70\xa6\x49\x06\xaf\x16\
+\x0f\xc1\x78\x75\x74\xe1\xdb\xa7\xaa\xb1\x3d\x0a\xc7\x53\x54\x8f\
+\xb3\xa3\xd0\x6b\x52\xb5\x37\x35\x4b\x90\xad\x55\x74\x7b\x03\x55\
+\x81\x82\x90\x33\xd8\x46\xb7\xe4\xfa\x3a\x22\x7e\x33\xfa\xcf\xca\
+\x21\x98\xe6\x5f\xf9\xe7\x0f\xad\x1a\x1b\x03\x9e\xe2\xec\xd2\x80\
+\x75\xab\x29\x04\x21\xe7\x77\x1d\xdd\x3e\xa4\xdb\x70\x1f\xa8\x14\
+\x42\xad\x5e\x6d\xaa\x00\x57\x9a\xa2\x1c\x56\x8d\xd6\x61\x1f\xdd\
+\x62\x1a\x8f\x69\x83\xe1\x6c\xa2\x5b\xe1\x2d\x04\x05\x21\x03\xda\
+\xa6\x13\xd1\x3d\x09\xe8\xcf\x2e\x0d\x42\x6d\x89\x28\x94\xa9\xd1\
+\x3a\x5d\x47\x37\x5d\x7a\x15\x1e\x1b\x06\xe7\xd2\x46\xc4\xcd\x9b\
+\x37\x6f\x54\x80\x2a\x42\x32\xb5\x8f\x6e\xcf\xd2\xb3\x70\xc3\x1e\
+\x4e\x6d\x15\xa6\x41\x05\x21\xc5\xd8\xa6\x30\x7c\x19\xee\x1f\xc2\
+\x29\xce\xa7\x27\xd1\xad\x08\x6d\x35\x87\x20\xa4\x2c\xeb\xb8\x7f\
+\x09\xb0\x13\x18\xbe\x6f\x40\x69\x41\x9a\x20\xa4\x70\x6d\x74\xf7\
+\x0f\x4d\xe9\xc0\xb7\xd9\x87\x5b\x0c\x82\x90\x6a\x03\xf1\x32\x05\
+\xe2\x5a\x73\xc0\x57\x03\xd0\x39\x22\x08\x71\xb2\x83\x41\x22\x82\
+\x10\x81\x08\x63\x08\xc0\x9b\x70\xdb\x40\x10\x22\x10\x05\x22\x23\
+\xec\xf3\x87\x00\xbc\x0e\x0b\xc9\x04\x21\x08\x44\x46\xd8\xc7\x05\
+\xa0\x20\x04\x81\x88\x3e\x8d\x20\x84\x6f\xbd\x78\xd8\x87\x48\x89\
+\xb6\xd1\x6d\x81\x10\x80\x08\x42\x1e\x1d\x88\xd7\x71\xff\x64\x8d\
+\xbd\x26\x21\x73\xeb\xe8\x1e\x24\x61\x1f\x20\x82\x90\x93\x6a\xe3\
+\xfe\x59\x8b\x2f\x5d\x60\xc8\x70\xc0\x76\x13\x11\x3f\xa6\xfe\xb9\
+\xd3\x24\x08\x42\xce\x3d\xe2\x7e\x96\x46\xdd\x6b\xcd\xc1\x80\xb6\
+\x61\x01\x0c\x82\x90\x01\xed\xd2\x45\xe8\xc7\x30\x6d\x4a\x7f\xda\
+\xb8\x9f\x9d\x78\x66\x30\x86\x20\xc4\x85\x89\xb1\xd8\x18\x78\x21\
+\x08\x29\xc1\xf6\xb3\x8b\xd5\x4e\x93\xf0\x08\xfb\xb8\x7f\xfc\xd9\
+\x0b\x83\x2c\x04\x21\x25\x56\x89\x3f\xa7\x9f\x95\x11\x3c\xdf\xd1\
+\x77\x9e\xe8\x3b\x9c\xc3\x0f\x9a\x80\x9e\xed\xd2\xcf\x65\x44\x2c\
+\x22\xe2\x97\xf4\xbb\xd1\x34\x1c\x85\xdf\x26\x22\x5e\xa7\xdf\x20\
+\x08\xa9\xd6\x26\xee\xef\xf5\x08\x45\xe1\x27\xfc\x10\x84\x08\x45\
+\xa1\x38\x2a\xfb\xa3\xf0\xdb\x6a\x0e\x04\x21\x7c\x39\x14\x67\x11\
+\xf1\x6b\x0a\xc5\xa9\xa6\x29\xde\xf6\xa8\xea\xdb\x6b\x0e\x04\x21\
+\xfc\xb3\x5d\xdc\xdf\x53\x9c\xa6\x40\x7c\x1a\x11\x73\xd5\x62\x51\
+\x55\xdf\xbb\x14\x82\xad\x26\x41\x10\xc2\xe3\x2e\xaa\xab\xb8\x7f\
+\x71\xea\x3c\xfd\x1c\x82\x91\x3c\x8e\xd1\xf6\x28\xf8\x54\x7d\x08\
+\x42\x38\xa3\x6d\x7c\x7a\x6f\x49\x30\x0e\x53\xb1\x6f\x23\xe2\x0f\
+\xc1\x47\xa9\xfe\xf5\xf1\xe3\x47\xad\x40\x95\x9e\x3f\x7f\x3e\x8f\
+\xee\x1e\xe3\xd3\xf4\x7b\xaa\x55\x1e\x5d\xed\xed\x0e\xa1\xf7\xe6\
+\xcd\x9b\xad\x26\x41\x45\x08\x65\x54\x8c\xab\xf4\xe7\x26\x05\xe2\
+\x3c\x22\x7e\x4a\xc1\x38\xd3\x4c\x5f\x6d\xbb\x7d\x0a\xbd\x5d\xfa\
+\x69\x35\x0b\x82\x10\xca\xd6\xc6\x5f\xa7\x53\x23\x05\xe3\x34\xfd\
+\x3c\x3d\x0a\xcc\x31\xb4\xc7\x2e\x05\xde\x7f\x8f\xc2\x6f\xaf\xab\
+\x20\x08\x61\x7c\xd5\xcf\x97\x4c\x8f\xaa\xc6\x26\x55\x91\xcd\xd1\
+\xdf\xcf\xdd\x21\xd4\xda\x54\xd9\x1d\xbe\xeb\x21\x00\x01\x41\x08\
+\xdf\x14\x24\xdb\xbf\xf9\xdf\xcc\xd3\xef\xcf\xab\xc8\x7f\x7f\x25\
+\x2c\xe7\x27\x0a\xe9\x77\x5f\xa8\xec\x42\xc8\xc1\xc3\x59\x2c\x03\
+\xc0\xa8\x79\xfb\x04\x00\x82\x10\x00\x04\x21\x00\x08\x42\x00\x10\
+\x84\x00\x20\x08\x01\x40\x10\x02\x80\x20\x04\x00\x41\x08\x00\x82\
+\x10\x00\x04\x21\x00\x08\x42\x00\x10\x84\x00\x20\x08\x01\x40\x10\
+\x02\x80\x20\x04\x00\x41\x08\x00\x82\x10\x00\x04\x21\x00\x08\x42\
+\x00\x10\x84\x00\x20\x08\x01\x40\x10\x02\x80\x20\x04\x00\x41\x08\
+\x00\x82\x10\x00\x04\x21\x00\x08\x42\x00\x10\x84\x00\x20\x08\x01\
+\x40\x10\x02\x80\x20\x04\x00\x41\x08\x00\x82\x10\x00\x04\x21\x00\
+\x08\x42\x00\x10\x84\x00\x20\x08\x01\x40\x10\x02\x80\x20\x04\x00\
+\x41\x08\x00\x82\x10\x00\x04\x21\x00\x08\x42\x00\x10\x84\x00\x20\
+\x08\x01\x40\x10\x02\x80\x20\x04\x00\x41\x08\x00\x82\x10\x00\x04\
+\x21\x00\x08\x42\x00\x04\x21\x00\x08\x42\x00\x10\x84\x00\x20\x08\
+\x01\x40\x10\x02\x80\x20\x04\x00\x41\x08\x00\x82\x10\x00\x04\x21\
+\x00\x08\x42\x00\x10\x84\x00\x20\x08\x01\x40\x10\x02\x80\x20\x04\
+\x00\x41\x08\x00\x82\x10\x00\x04\x21\x00\x08\x42\x00\x10\x84\x00\
+\x20\x08\x01\x40\x10\x02\x80\x20\x04\x00\x41\x08\x00\x82\x10\x00\
+\x04\x21\x00\x08\x42\x00\x10\x84\x00\x20\x08\x01\x40\x10\x02\x80\
+\x20\x04\x00\x41\x08\x00\x82\x10\x00\x04\x21\x00\x08\x42\x00\x10\
+\x84\x00\x20\x08\x01\x40\x10\x02\x80\x20\x04\x00\x41\x08\x00\x82\
+\x10\x00\x04\x21\x00\x08\x42\x00\x10\x84\x00\x20\x08\x01\x40\x10\
+\x02\x80\x20\x04\x00\x41\x08\x00\x82\x10\x00\x04\x21\x00\x08\x42\
+\x00\x10\x84\x00\x20\x08\x01\x10\x84\x00\x20\x08\x01\x40\x10\x02\
+\x80\x20\x04\x00\x41\x08\x00\xa3\xf0\x7f\x03\x00\x7a\xa9\x6c\x1f\
+\x56\xb3\x75\xcd\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x04\x26\x89\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\
+\x49\x48\x44\x52\x00\x00\x00\x80\x00\x00\x00\x80\x08\x06\x00\x00\
+\x00\xc3\x3e\x61\xcb\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\
+\x08\x7c\x08\x64\x88\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\
+\x13\x00\x00\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x03\xc8\x49\x44\
+\x41\x54\x78\x9c\xed\xdd\x4f\xac\x9c\x63\x14\xc7\xf1\x2f\xe2\x5f\
+\x88\x52\x24\x44\x34\x52\x4a\xfc\x5b\x10\x1b\xb1\x22\x36\x22\x61\
+\x23\x76\x88\x15\x16\x76\x2c\x85\x58\x09\x8b\xae\xc4\x4e\x1a\x36\
+\xaa\x21\x11\xac\x10\x0b\x24\x16\x62\xa3\x91\x94\x90\xa6\x42\xc4\
+\x9f\xba\x4d\x4b\xe3\xa6\xfa\x58\xdc\x4e\x7a\x3b\xbd\x33\xf3\xbe\
+\xef\xbc\xe7\x39\x33\xf7\xfd\x7e\x92\xb3\x3f\xe7\xf9\x9d\x99\x3b\
+\xb9\x79\x67\x1e\x90\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\
+\x92\x24\x49\x92\x24\x49\x8a\x75\x23\xf0\x01\xf0\x0f\x70\x18\xd8\
+\x0d\x5c\x95\xda\x91\xaa\xd9\x01\x1c\x04\xca\x58\x1d\x00\x6e\x4e\
+\xec\x4b\x95\xec\xe1\xf4\xf0\x47\xb5\x02\xdc\x93\xd7\x9a\x6a\x38\
+\xc4\xe4\x05\x28\xc0\x2a\xf0\x58\x5a\x77\x0a\x37\x2d\xfc\xf5\xf5\
+\x42\x52\x7f\x0a\xd6\x74\x01\x0a\xb0\x0b\x38\x3b\xa5\x4b\x85\x69\
+\xb3\x00\x05\xf8\x04\xd8\x92\xd2\xa9\x42\xb4\x5d\x80\x02\xec\x05\
+\xb6\x65\x34\xab\xfe\x75\x59\x80\x02\xfc\x02\xdc\x9e\xd0\xaf\x7a\
+\xd6\x75\x01\x0a\x70\x04\xb8\xbf\x7e\xcb\xea\xd3\x3c\x0b\x50\x80\
+\x63\xc0\x53\xd5\xbb\x56\x6f\xe6\x5d\x80\x51\xbd\x0c\x9c\x51\xb9\
+\x77\xf5\xa0\xaf\x05\x28\xc0\xdb\xc0\x79\x75\xdb\xd7\xbc\xfa\x5c\
+\x80\x02\x7c\x0e\x5c\x5a\x75\x02\xcd\xa5\xef\x05\x28\xc0\x77\xc0\
+\x75\x35\x87\x50\x77\x11\x0b\x50\x80\xdf\x81\x3b\x2b\xce\xa1\x8e\
+\xa2\x16\xa0\x00\x47\x81\x87\xea\x8d\xa2\x2e\x22\x17\xa0\x00\xc7\
+\x81\x67\xaa\x4d\xa3\xd6\xa2\x17\x60\x54\xaf\x02\x67\x55\x9a\x49\
+\x2d\xd4\x5a\x80\x02\xbc\x0f\x5c\x50\x67\x2c\x35\x55\x73\x01\x0a\
+\xf0\x15\x70\x45\x95\xc9\xd4\x48\xed\x05\x28\xc0\x7e\xe0\xa6\x0a\
+\xb3\xa9\x81\x8c\x05\x28\xc0\x5f\xc0\xdd\x15\xe6\xd3\x0c\x59\x0b\
+\x50\x80\x7f\x81\x47\xe2\x47\xd4\x34\x99\x0b\x30\xaa\xe7\xc2\xa7\
+\xd4\x44\xd9\xe1\x8f\xea\x75\x7c\xde\x30\x45\x76\xf0\xeb\xeb\x23\
+\xe0\xa2\xd8\x71\x35\x2e\x3b\xf4\xf1\xfa\x06\xb8\x3a\x74\x62\x9d\
+\x22\x3b\xf0\x8d\xea\x67\xe0\xb6\xc8\xa1\x75\x52\x76\xd8\x93\xea\
+\x30\x70\x5f\xe0\xdc\x3a\x21\x3b\xe8\x69\x75\x0c\x78\x22\x6e\x74\
+\x41\x7e\xc8\x4d\xea\x25\x7c\xde\x30\x4c\x76\xb8\x4d\xeb\x2d\xe0\
+\xdc\xa0\x33\x18\xb4\xec\x60\xdb\xd4\x67\xc0\xd6\x98\x63\x18\xae\
+\xec\x50\xdb\xd6\x3e\x60\x7b\xc8\x49\x0c\x54\x76\xa0\x5d\xea\x37\
+\xe0\x96\x88\xc3\xe8\xdb\x32\x7c\x70\x29\xd9\x0d\x74\xf4\x23\x70\
+\x2b\x6b\xbf\x6b\xb4\xb0\xce\xcc\x6e\x60\x13\xdb\x0e\x3c\x99\xdd\
+\xc4\x2c\x2e\x40\xac\x85\x7f\xe2\xd8\x3f\x01\xb1\x56\x80\x4b\xb2\
+\x9b\x98\xc6\x77\x80\x58\x0b\xff\x02\x73\x01\x62\xed\xcb\x6e\x60\
+\x16\x17\x20\xd6\x3b\xd9\x0d\xcc\xb2\xf0\x6f\x51\x2c\xef\x67\x80\
+\x9f\x58\x7b\xb2\xf8\x48\x76\x23\xd3\xf8\x0e\x10\xe3\x20\xf0\x20\
+\x0b\x1e\xfe\xb2\xc8\xfe\xaf\x5e\xdb\xfa\x01\xb8\x21\xe4\x24\x06\
+\x2a\x3b\xd0\x36\xf5\x25\x70\x79\xcc\x31\x0c\x57\x76\xa8\x4d\xeb\
+\x5d\xe0\xfc\xa0\x33\x18\xb4\xec\x60\x9b\xd4\x4e\xfc\x3c\x15\x26\
+\x3b\xdc\x69\xf5\x1f\xf0\x74\xdc\xe8\x82\xfc\x90\x27\xd5\xdf\xc0\
+\x03\x81\x73\xeb\x84\xec\xa0\x37\xaa\x5f\x81\x3b\x22\x87\xd6\x49\
+\xd9\x61\x8f\xd7\xb7\xc0\x35\x91\x03\xeb\x54\xd9\x81\xaf\xaf\x4f\
+\x81\x8b\x63\xc7\xd5\xb8\xec\xd0\x47\xf5\x06\x70\x4e\xf0\xac\xda\
+\x40\x76\xf0\x05\x78\x31\x7c\x4a\x4d\x94\x19\xfc\x2a\xf0\x78\xfc\
+\x88\x9a\x26\x2b\xfc\x43\xc0\xbd\x15\xe6\xd3\x0c\x19\xe1\x1f\x60\
+\x49\x1e\xeb\x1e\x82\xda\xe1\x7f\x0d\x5c\x59\x65\x32\x35\x52\x33\
+\xfc\x0f\x81\x0b\xeb\x8c\xa5\xa6\x6a\x85\xff\x1a\xfe\x54\xec\x42\
+\x8a\x0e\xfe\x38\xf0\x6c\xb5\x69\xd4\x5a\x64\xf8\x47\x81\x87\xeb\
+\x8d\xa2\x2e\xa2\xc2\xff\x03\xb8\xab\xe2\x1c\xea\x28\x22\xfc\xef\
+\x81\x1d\x35\x87\x50\x77\x7d\x87\xff\x05\x70\x59\xd5\x09\x34\x97\
+\x3e\xc3\xdf\x83\xd7\xc6\x2d\x9d\xbe\xc2\x7f\x85\xe5\xf8\x22\x8c\
+\xc6\xcc\x1b\xbc\x57\xc7\x2e\xb9\x79\xc2\xf7\xf2\xe8\x4d\xa0\x6b\
+\xf8\x5e\x1f\xbf\x49\x74\x09\x7f\x2f\xb0\x2d\xa3\x59\xf5\xaf\x6d\
+\xf8\x1f\x03\x5b\x52\x3a\x55\x88\x36\xe1\xef\xc2\x4b\x1d\x36\x9d\
+\xa6\xe1\x3f\x9f\xd5\xa0\x62\xad\x30\x3d\xf8\x55\xe0\xd1\xb4\xee\
+\x14\x6e\x37\x93\xc3\xf7\x6a\xb7\x01\xb8\x16\xf8\x93\xd3\xc3\xdf\
+\x8f\x97\x3b\x0e\xc6\xf5\xc0\x7b\xac\x7d\x21\x73\x05\x78\x13\xaf\
+\x77\x95\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\
+\x92\x24\x49\x03\xf7\x3f\xae\xf3\x22\x2a\x02\xda\x93\x76\x00\x00\
+\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+"
+
+qt_resource_name = b"\
+\x00\x03\x00\x00\x70\x37\x00\x69\x00\x6d\x00\x67\x00\x0e\x06\x0c\
+\x0a\x07\x00\x61\x00\x72\x00\x72\x00\x6f\x00\x77\x00\x2d\x00\x64\
+\x00\x6f\x00\x77\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\x00\x0a\
+\x0a\xc8\xfb\x07\x00\x66\x00\x6f\x00\x6c\x00\x64\x00\x65\x00\x72\
+\x00\x2e\x00\x70\x00\x6e\x00\x67\x00\x07\x0c\xf8\x57\x87\x00\x65\
+\x00\x79\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\x00\x0f\x0f\x22\
+\x64\xc7\x00\x61\x00\x72\x00\x72\x00\x6f\x00\x77\x00\x2d\x00\x72\
+\x00\x69\x00\x67\x00\x68\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
+"
+
+qt_resource_struct = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\x00\x00\
+\x00\x00\x00\x02\x00\x00\x00\x04\x00\x00\x00\x02\x00\x00\x00\x0c\
+\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x2e\x00\x00\
+\x00\x00\x00\x01\x00\x00\x05\xb7\x00\x00\x00\x48\x00\x00\x00\x00\
+\x00\x01\x00\x00\x09\x2d\x00\x00\x00\x5c\x00\x00\x00\x00\x00\x01\
+\x00\x00\x5a\xc0\
+"
+
+def qInitResources():
+    QtCore.qRegisterResourceData(0x01, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(0x01, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
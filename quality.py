@@ -0,0 +1,146 @@
+from PyQt4 import QtGui, QtCore
+from metrics import RollingStat
+
+# ms without interaction before full quality is restored
+IDLE_MS = 150
+# documents with fewer strokes always render at full quality
+MIN_STROKES = 100
+
+
+class AdaptiveQuality(QtCore.QObject):
+    """
+    Render quality policy for a PaintView. While the user draws, resizes,
+    scrolls, zooms or changes brush size the view paints with cheaper render
+    hints & committed strokes are drawn from cached tiles scaled to the
+    current zoom. Once input has been idle for idle_ms the view is repainted
+    at full quality. A stroke being drawn keeps quality lowered until it is
+    finished.
+
+    Attributes:
+        frame_times (dict): 'interactive' & 'full' RollingStat of paint ms
+        full_hints (QPainter.RenderHints): hints used when idle
+        idle_ms (int): ms without interaction before refining
+        interacting (bool): quality is currently lowered
+        interactive_hints (QPainter.RenderHints): hints used while
+                                                  interacting
+        min_strokes (int): documents with fewer strokes are never lowered
+        qualityChanged (SIGNAL): emitted with True when full quality is
+                                 restored & False when it is lowered
+    """
+    qualityChanged = QtCore.pyqtSignal(bool)
+
+    def __init__(self, view, idle_ms=IDLE_MS, min_strokes=MIN_STROKES,
+                 interactive_hints=None, full_hints=None):
+        """
+        Args:
+            view (PaintView): view to manage
+            idle_ms (int, optional): ms without interaction before refining
+            min_strokes (int, optional): documents with fewer strokes are
+                                         never lowered
+            interactive_hints (QPainter.RenderHints, optional): hints while
+                                                                interacting,
+                                                                defaults to
+                                                                none
+            full_hints (QPainter.RenderHints, optional): hints when idle,
+                                                         defaults to the
+                                                         view's hints
+        """
+        super(AdaptiveQuality, self).__init__(view)
+        self._view = view
+        self.idle_ms = idle_ms
+        self.min_strokes = min_strokes
+        if interactive_hints is None:
+            interactive_hints = QtGui.QPainter.RenderHints()
+        self.interactive_hints = interactive_hints
+        if full_hints is None:
+            full_hints = view.renderHints()
+        self.full_hints = full_hints
+        self.interacting = False
+        self.frame_times = {'interactive': RollingStat(),
+                            'full': RollingStat()}
+        self._scaled_tiles = None
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.refine)
+
+    def interact(self):
+        """
+        notes user interaction, lowering quality until input goes idle
+        """
+        self._timer.start(self.idle_ms)
+        if self.interacting:
+            return
+        scene = self._view.scene()
+        if scene is None or len(scene.strokes) < self.min_strokes:
+            return
+        self.interacting = True
+        self._view.setRenderHints(self.interactive_hints)
+        # draw committed strokes from tiles at any zoom, see TileCache.usable
+        tiles = scene.tile_cache
+        if tiles is not None and not tiles.proxy:
+            tiles.proxy = True
+            self._scaled_tiles = tiles
+        self.qualityChanged.emit(False)
+
+    def refine(self):
+        """
+        restores full quality & repaints the view, postponed while a stroke
+        is being drawn
+        """
+        if not self.interacting:
+            return
+        scene = self._view.scene()
+        # PaintScene.is_painting never reports a stroke in progress
+        if scene is not None and scene._current_path is not None:
+            self._timer.start(self.idle_ms)
+            return
+        self._timer.stop()
+        self.interacting = False
+        tiles = self._scaled_tiles
+        self._scaled_tiles = None
+        if tiles is not None and (scene is None or
+                                  scene.proxy_scale is None):
+            tiles.proxy = False
+        self._view.setRenderHints(self.full_hints)
+        self._view.viewport().update()
+        self.qualityChanged.emit(True)
+
+    def close(self):
+        """
+        restores full quality & stops managing the view
+        """
+        if self.interacting:
+            self.interacting = False
+            if self._scaled_tiles is not None:
+                scene = self._view.scene()
+                if scene is None or scene.proxy_scale is None:
+                    self._scaled_tiles.proxy = False
+                self._scaled_tiles = None
+            self._view.setRenderHints(self.full_hints)
+        self._timer.stop()
+
+    def record_frame(self, ms):
+        """
+        adds a frame's paint time to the current quality's statistics
+
+        Args:
+            ms (float): paint time
+        """
+        key = 'interactive' if self.interacting else 'full'
+        self.frame_times[key].add(ms)
+
+    def stats(self):
+        """
+        frame times at each quality
+
+        Returns:
+            dict: 'interactive' & 'full' summaries, plus 'speedup' of mean
+                  frame time once both have samples
+        """
+        interactive = self.frame_times['interactive'].stats()
+        full = self.frame_times['full'].stats()
+        stats = {'interactive': interactive, 'full': full}
+        if interactive.get('mean') and full.get('mean'):
+            stats['speedup'] = full['mean'] / interactive['mean']
+        return stats
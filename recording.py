@@ -0,0 +1,313 @@
+"""
+Deterministic input recording & replay for PyQtPaint sessions.
+
+Usage:
+    python recording.py session.pqr [--realtime]
+
+Replays a recorded session headless and reports whether the final render
+matches the recording.
+"""
+import os
+import sys
+import time
+import struct
+import hashlib
+from PyQt4 import QtGui, QtCore
+
+MAGIC = b'PQPR'
+VERSION = 1
+
+# event types
+END = 0
+PRESS = 1
+DRAG = 2
+HOVER = 3
+RELEASE = 4
+WHEEL = 5
+ACTION = 6
+BRUSH = 7
+SELECT = 8
+VISIBILITY = 9
+
+# PyQtPaint actions in recording order, index is stored in the file
+RECORDED_ACTIONS = ('undo_action', 'redo_action', 'delete_action',
+                    'group_action', 'save_action', 'increase_size_action',
+                    'decrease_size_action', 'brush_softer_action',
+                    'brush_harder_action', 'flatten_action',
+                    'duplicate_action')
+# actions that open dialogs are recorded but not replayed
+SKIPPED_ACTIONS = ('save_action',)
+
+_HEADER = struct.Struct('<4sHII')
+_EVENT = struct.Struct('<BI')
+# largest storable event delta, about 71.6 minutes of idle time
+MAX_DELTA_US = 0xFFFFFFFF
+_POINT = struct.Struct('<ff')
+_WHEEL = struct.Struct('<hI')
+_ACTION = struct.Struct('<B')
+_BRUSH = struct.Struct('<HHI')
+_COUNT = struct.Struct('<I')
+_ID = struct.Struct('<i')
+_VISIBILITY = struct.Struct('<iB')
+_END = struct.Struct('<16sII')
+
+
+def image_digest(img):
+    """
+    md5 of image pixels, used to compare renders
+
+    Args:
+        img (QImage): rendered image
+
+    Returns:
+        bytes: 16 byte digest
+    """
+    bits = img.constBits()
+    return hashlib.md5(bits.asstring(img.byteCount())).digest()
+
+
+class InputRecorder(object):
+    """
+    Streams PyQtPaint input events to a compact binary file.
+    Each event is a type byte & microseconds since the previous event,
+    clamped to MAX_DELTA_US, followed by a fixed size payload.
+
+    Args:
+        filepath (str): output path
+        width (int): canvas width
+        height (int): canvas height
+    """
+    def __init__(self, filepath, width, height):
+        self._handle = open(filepath, 'wb')
+        self._handle.write(_HEADER.pack(MAGIC, VERSION, int(width),
+                                        int(height)))
+        self._last = time.time()
+        self._brush = None
+        self.event_count = 0
+
+    def _event(self, kind, payload=b''):
+        now = time.time()
+        delta = max(0, min(int((now - self._last) * 1000000), MAX_DELTA_US))
+        self._last = now
+        self._handle.write(_EVENT.pack(kind, delta) + payload)
+        self.event_count += 1
+
+    def mouse(self, kind, position):
+        """
+        records press/drag/hover/release
+
+        Args:
+            kind (int): PRESS, DRAG, HOVER or RELEASE
+            position (QPointF): scene position
+        """
+        self._event(kind, _POINT.pack(position.x(), position.y()))
+
+    def wheel(self, delta, modifiers):
+        """
+        records wheel brush change
+
+        Args:
+            delta (int): wheel delta
+            modifiers (Qt.KeyboardModifiers): keyboard modifiers
+        """
+        self._event(WHEEL, _WHEEL.pack(delta, int(modifiers)))
+
+    def action(self, name):
+        """
+        records triggered PyQtPaint action
+
+        Args:
+            name (str): attribute name of action, see RECORDED_ACTIONS
+        """
+        self._event(ACTION, _ACTION.pack(RECORDED_ACTIONS.index(name)))
+
+    def brush(self, size, blur, color):
+        """
+        records brush settings, skipped when unchanged
+
+        Args:
+            size (int): pen size
+            blur (int): pen blur
+            color (QColor): pen color
+        """
+        brush = (int(size), int(blur), color.rgba())
+        if brush == self._brush:
+            return
+        self._brush = brush
+        self._event(BRUSH, _BRUSH.pack(*brush))
+
+    def selection(self, ids):
+        """
+        records layer panel selection
+
+        Args:
+            ids (list): stroke/group indices of selected items
+        """
+        payload = _COUNT.pack(len(ids)) + b''.join(_ID.pack(i) for i in ids)
+        self._event(SELECT, payload)
+
+    def visibility(self, stroke_id, visible):
+        """
+        records layer visibility toggle
+
+        Args:
+            stroke_id (int): stroke/group index
+            visible (bool): visibility
+        """
+        self._event(VISIBILITY, _VISIBILITY.pack(stroke_id, bool(visible)))
+
+    def close(self, img=None):
+        """
+        ends recording, storing digest of final render
+
+        Args:
+            img (QImage, optional): final render to verify replays against
+        """
+        if self._handle is None:
+            return
+        if img is None:
+            self._event(END, _END.pack(b'\0' * 16, 0, 0))
+        else:
+            self._event(END, _END.pack(image_digest(img), img.width(),
+                                       img.height()))
+        self._handle.close()
+        self._handle = None
+
+
+def read_events(filepath):
+    """
+    parses recording
+
+    Args:
+        filepath (str): recording path
+
+    Returns:
+        tuple: (width, height, list of (type, delta_us, payload tuple))
+    """
+    with open(filepath, 'rb') as handle:
+        data = handle.read()
+
+    magic, version, width, height = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError('{} is not a PyQtPaint recording'.format(filepath))
+
+    payloads = {PRESS: _POINT, DRAG: _POINT, HOVER: _POINT, RELEASE: _POINT,
+                WHEEL: _WHEEL, ACTION: _ACTION, BRUSH: _BRUSH,
+                VISIBILITY: _VISIBILITY, END: _END}
+    events = []
+    offset = _HEADER.size
+    while offset < len(data):
+        kind, delta = _EVENT.unpack_from(data, offset)
+        offset += _EVENT.size
+        if kind == SELECT:
+            count = _COUNT.unpack_from(data, offset)[0]
+            offset += _COUNT.size
+            payload = struct.unpack_from('<{}i'.format(count), data, offset)
+            offset += _ID.size * count
+        else:
+            layout = payloads[kind]
+            payload = layout.unpack_from(data, offset)
+            offset += layout.size
+        events.append((kind, delta, payload))
+    return width, height, events
+
+
+class InputReplayer(object):
+    """
+    Feeds a recording back into a PyQtPaint widget
+
+    Attributes:
+        width (int): recorded canvas width
+        height (int): recorded canvas height
+    """
+    def __init__(self, filepath):
+        self.width, self.height, self._events = read_events(filepath)
+
+    def __len__(self):
+        return len(self._events)
+
+    def replay(self, paint, realtime=False):
+        """
+        applies every recorded event to paint
+
+        Args:
+            paint (PyQtPaint): widget to replay into
+            realtime (bool): keep recorded timing, otherwise run at max speed
+
+        Returns:
+            dict: elapsed seconds, event count & whether final render matched
+        """
+        scene = paint.paint_scene
+        view = paint._paint_view
+        app = QtGui.QApplication.instance()
+        digest = None
+        start = time.time()
+        due = start
+
+        for kind, delta, payload in self._events:
+            if realtime:
+                due += delta / 1000000.0
+                while time.time() < due:
+                    app.processEvents()
+
+            if kind in (PRESS, DRAG, HOVER, RELEASE):
+                position = QtCore.QPointF(*payload)
+                if kind == PRESS:
+                    scene.start_paintstroke(position,
+                                            layer=view.current_layer)
+                elif kind == DRAG:
+                    scene.update_paintstroke(position)
+                elif kind == RELEASE:
+                    scene.complete_paintstroke(position)
+                if kind != RELEASE:
+                    scene.move_cursor_preview(position)
+            elif kind == WHEEL:
+                view.apply_wheel(payload[0],
+                                 QtCore.Qt.KeyboardModifiers(payload[1]))
+            elif kind == ACTION:
+                name = RECORDED_ACTIONS[payload[0]]
+                if name not in SKIPPED_ACTIONS:
+                    getattr(paint, name).trigger()
+            elif kind == BRUSH:
+                size, blur, rgba = payload
+                paint.set_pen_size(size)
+                paint.set_pen_blur(blur)
+                paint.set_pen_color(QtGui.QColor.fromRgba(rgba))
+            elif kind == SELECT:
+                paint.select_layers(payload)
+            elif kind == VISIBILITY:
+                paint.set_layer_visibility(payload[0], bool(payload[1]))
+            elif kind == END:
+                digest = payload
+        app.processEvents()
+
+        result = {'seconds': time.time() - start, 'events': len(self._events),
+                  'match': None}
+        if digest is not None and digest[1]:
+            result['match'] = image_digest(paint.get_img()) == digest[0]
+        return result
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n\n')[0])
+    parser.add_argument('recording')
+    parser.add_argument('--realtime', action='store_true')
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    from pyqtpaint import PyQtPaint
+    app = QtGui.QApplication.instance() or QtGui.QApplication(sys.argv)
+
+    replayer = InputReplayer(args.recording)
+    paint = PyQtPaint(replayer.width, replayer.height)
+    result = replayer.replay(paint, realtime=args.realtime)
+    paint.close()
+    app.processEvents()
+    sys.stdout.write('{} events in {:.3f}s, render match: {}\n'.format(
+        result['events'], result['seconds'], result['match']))
+    return 0 if result['match'] is not False else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
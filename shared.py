@@ -0,0 +1,182 @@
+from collections import OrderedDict
+from PyQt4 import QtGui, QtCore
+
+
+class ResourceRegistry(object):
+    """
+    Process wide cache of immutable assets shared by every PyQtPaint
+    instance: icons, pens, brush kernels & cursor sprites.
+    Returned objects are shared, callers must copy before modifying them.
+
+    Attributes:
+        max_sprites (int): number of kernels/sprites kept before the least
+                           recently used are dropped
+    """
+    def __init__(self, max_sprites=64):
+        self.max_sprites = max_sprites
+        self._pixmaps = {}
+        self._pens = {}
+        self._kernels = OrderedDict()
+        self._sprites = OrderedDict()
+
+    def pixmap(self, path):
+        """
+        loads pixmap once per process
+
+        Args:
+            path (str): file or resource path, e.g. ':/img/eye.png'
+
+        Returns:
+            QPixmap: shared pixmap
+        """
+        try:
+            return self._pixmaps[path]
+        except KeyError:
+            pixmap = QtGui.QPixmap(path)
+            self._pixmaps[path] = pixmap
+            return pixmap
+
+    def pen(self, color, width, style=QtCore.Qt.SolidLine,
+            cap=QtCore.Qt.RoundCap, join=QtCore.Qt.RoundJoin):
+        """
+        pen with given settings, equal settings share pen data
+
+        Args:
+            color (QColor): pen color
+            width (float): pen width
+            style (Qt.PenStyle, optional): line style
+            cap (Qt.PenCapStyle, optional): cap style
+            join (Qt.PenJoinStyle, optional): join style
+
+        Returns:
+            QPen: pen sharing its data with the cached pen
+        """
+        key = (color.rgba(), float(width), int(style), int(cap), int(join))
+        try:
+            pen = self._pens[key]
+        except KeyError:
+            pen = QtGui.QPen(color, width, style, cap, join)
+            self._pens[key] = pen
+        return QtGui.QPen(pen)
+
+    def _lru_get(self, cache, key, factory):
+        try:
+            value = cache.pop(key)
+        except KeyError:
+            value = factory()
+            while len(cache) >= self.max_sprites:
+                cache.popitem(last=False)
+        cache[key] = value
+        return value
+
+    def brush_kernel(self, size, blur):
+        """
+        alpha mask of a round brush, soft edge approximates blur effect
+
+        Args:
+            size (int): brush diameter
+            blur (int): blur radius
+
+        Returns:
+            QImage: premultiplied white disc with soft edge
+        """
+        return self._lru_get(self._kernels, (int(size), int(blur)),
+                             lambda: _make_kernel(size, blur))
+
+    def cursor_sprite(self, size, blur, color):
+        """
+        brush kernel tinted with color, used as the cursor fill preview
+
+        Args:
+            size (int): brush diameter
+            blur (int): blur radius
+            color (QColor): brush color
+
+        Returns:
+            QPixmap: tinted brush sprite
+        """
+        key = (int(size), int(blur), color.rgba())
+        return self._lru_get(self._sprites, key,
+                             lambda: _make_sprite(self.brush_kernel(size,
+                                                                    blur),
+                                                  color))
+
+    def clear(self):
+        """
+        drops every cached asset
+        """
+        self._pixmaps.clear()
+        self._pens.clear()
+        self._kernels.clear()
+        self._sprites.clear()
+
+    def memory_usage(self):
+        """
+        estimated bytes held by cached pixel data
+
+        Returns:
+            int: bytes
+        """
+        total = 0
+        for pixmap in self._pixmaps.values():
+            total += pixmap.width() * pixmap.height() * 4
+        for kernel in self._kernels.values():
+            total += kernel.byteCount()
+        for sprite in self._sprites.values():
+            total += sprite.width() * sprite.height() * 4
+        return total
+
+
+def _make_kernel(size, blur):
+    radius = size / 2.0
+    pad = int(blur) * 2
+    dim = int(size) + pad * 2 + 1
+    img = QtGui.QImage(dim, dim, QtGui.QImage.Format_ARGB32_Premultiplied)
+    img.fill(0)
+    center = dim / 2.0
+    white = QtGui.QColor(255, 255, 255, 255)
+    if blur:
+        # fade from the solid core out to radius + blur
+        gradient = QtGui.QRadialGradient(center, center, radius + blur)
+        inner = max(0.0, (radius - blur) / (radius + blur))
+        gradient.setColorAt(0, white)
+        gradient.setColorAt(inner, white)
+        gradient.setColorAt(1, QtGui.QColor(255, 255, 255, 0))
+        brush = QtGui.QBrush(gradient)
+    else:
+        brush = QtGui.QBrush(white, QtCore.Qt.SolidPattern)
+    painter = QtGui.QPainter(img)
+    painter.setRenderHint(QtGui.QPainter.Antialiasing)
+    painter.setPen(QtCore.Qt.NoPen)
+    painter.setBrush(brush)
+    painter.drawEllipse(QtCore.QPointF(center, center), radius + blur,
+                        radius + blur)
+    painter.end()
+    return img
+
+
+def _make_sprite(kernel, color):
+    img = QtGui.QImage(kernel.size(), QtGui.QImage.Format_ARGB32_Premultiplied)
+    img.fill(0)
+    painter = QtGui.QPainter(img)
+    painter.fillRect(img.rect(), color)
+    painter.setCompositionMode(QtGui.QPainter.CompositionMode_DestinationIn)
+    painter.drawImage(0, 0, kernel)
+    painter.end()
+    return QtGui.QPixmap.fromImage(img)
+
+
+_registry = None
+
+
+def registry():
+    """
+    process wide resource registry
+
+    Returns:
+        ResourceRegistry: shared registry
+    """
+    global _registry
+    if _registry is None:
+        _registry = ResourceRegistry()
+    return _registry
@@ -0,0 +1,779 @@
+import math
+import struct
+from array import array
+from collections import OrderedDict
+from PyQt4 import QtGui, QtCore
+from shared import registry
+from tiles import _detached
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# stroke coordinates are stored in 1/QUANTIZE pixel steps
+QUANTIZE = 16
+# offset used to give single point strokes a visible round cap
+DOT_OFFSET = .0001
+# coarsest level of detail, simplification tolerance doubles per level
+MAX_LOD_LEVEL = 8
+# strokes with more path elements have their outline stroked on a worker
+# thread by StrokeItem.precompute_outline
+ASYNC_OUTLINE_ELEMENTS = 2000
+
+# serialized geometry header: start, bounds, delta typecode & count
+_GEOMETRY = struct.Struct('<iiffffcI')
+_BIG_ENDIAN = struct.pack('=h', 1) != struct.pack('<h', 1)
+
+
+class StrokeGeometry(object):
+    """
+    Immutable polyline stored as quantized, delta encoded coordinates.
+    Uses 2 bytes per coordinate (4 if a single step exceeds the int16
+    range) instead of the 24 bytes per element of a QPainterPath.
+
+    Attributes:
+        bounds (tuple): (x, y, width, height) of the points
+    """
+    __slots__ = ('_start', '_deltas', 'bounds', '_levels', '__weakref__')
+
+    def __init__(self, start, deltas, bounds):
+        self._start = start
+        self._deltas = deltas
+        self.bounds = bounds
+        self._levels = None
+
+    @classmethod
+    def from_points(cls, points):
+        """
+        encodes sequence of points
+
+        Args:
+            points (iterable): (x, y) pairs or QPointF
+
+        Returns:
+            StrokeGeometry: encoded geometry
+        """
+        quantized = []
+        for point in points:
+            if isinstance(point, (QtCore.QPointF, QtCore.QPoint)):
+                x, y = point.x(), point.y()
+            else:
+                x, y = point[0], point[1]
+            quantized.append((int(round(x * QUANTIZE)),
+                              int(round(y * QUANTIZE))))
+        return cls._encode(quantized)
+
+    @classmethod
+    def from_array(cls, points):
+        """
+        encodes an (n, 2) array of points, vectorized when numpy is
+        available
+
+        Args:
+            points (numpy.ndarray): x, y rows, any sequence of pairs is
+                                    accepted without numpy
+
+        Returns:
+            StrokeGeometry: encoded geometry
+        """
+        if numpy is None:
+            return cls.from_points(points)
+
+        quantized = numpy.rint(numpy.asarray(points, dtype=numpy.float64) *
+                               QUANTIZE).astype(numpy.int64).reshape(-1, 2)
+        if not len(quantized):
+            return cls._encode([])
+
+        deltas = numpy.diff(quantized, axis=0).ravel()
+        typecode, dtype = 'h', numpy.int16
+        if len(deltas) and (deltas.max() > 32767 or deltas.min() < -32768):
+            typecode, dtype = 'i', numpy.int32
+        encoded = array(typecode)
+        deltas = deltas.astype(dtype)
+        if encoded.itemsize != deltas.itemsize:
+            # C int is not 32 bit on this platform
+            encoded.extend(deltas.tolist())
+        elif hasattr(encoded, 'frombytes'):
+            encoded.frombytes(deltas.tobytes())
+        else:
+            encoded.fromstring(deltas.tostring())
+
+        low = quantized.min(axis=0)
+        high = quantized.max(axis=0)
+        q = float(QUANTIZE)
+        bounds = (low[0] / q, low[1] / q,
+                  (high[0] - low[0]) / q, (high[1] - low[1]) / q)
+        start = (int(quantized[0][0]), int(quantized[0][1]))
+        return cls(start, encoded, tuple(float(b) for b in bounds))
+
+    @classmethod
+    def from_path(cls, path):
+        """
+        encodes polyline QPainterPath built from moveTo/lineTo
+
+        Args:
+            path (QPainterPath): stroke path
+
+        Returns:
+            StrokeGeometry: encoded geometry
+        """
+        quantized = []
+        for i in range(path.elementCount()):
+            element = path.elementAt(i)
+            quantized.append((int(round(element.x * QUANTIZE)),
+                              int(round(element.y * QUANTIZE))))
+        return cls._encode(quantized)
+
+    @classmethod
+    def _encode(cls, quantized):
+        if not quantized:
+            return cls((0, 0), array('h'), (0.0, 0.0, 0.0, 0.0))
+
+        xs = [p[0] for p in quantized]
+        ys = [p[1] for p in quantized]
+        deltas = []
+        px, py = quantized[0]
+        for x, y in quantized[1:]:
+            deltas.append(x - px)
+            deltas.append(y - py)
+            px, py = x, y
+
+        typecode = 'h'
+        if deltas and (max(deltas) > 32767 or min(deltas) < -32768):
+            typecode = 'i'
+
+        q = float(QUANTIZE)
+        bounds = (min(xs) / q, min(ys) / q,
+                  (max(xs) - min(xs)) / q, (max(ys) - min(ys)) / q)
+        return cls(quantized[0], array(typecode, deltas), bounds)
+
+    def to_bytes(self):
+        """
+        serializes encoded coordinates, see from_bytes
+
+        Returns:
+            bytes: little endian header followed by the deltas
+        """
+        deltas = self._deltas
+        header = _GEOMETRY.pack(self._start[0], self._start[1],
+                                *(tuple(self.bounds) +
+                                  (deltas.typecode.encode('ascii'),
+                                   len(deltas))))
+        if _BIG_ENDIAN:
+            deltas = array(deltas.typecode, deltas)
+            deltas.byteswap()
+        return header + (deltas.tobytes() if hasattr(deltas, 'tobytes')
+                         else deltas.tostring())
+
+    @classmethod
+    def from_bytes(cls, data, offset=0):
+        """
+        deserializes geometry written by to_bytes
+
+        Args:
+            data (bytes): buffer
+            offset (int, optional): start of geometry in data
+
+        Returns:
+            tuple: (StrokeGeometry, offset after geometry)
+        """
+        values = _GEOMETRY.unpack_from(data, offset)
+        offset += _GEOMETRY.size
+        typecode = str(values[6].decode('ascii'))
+        deltas = array(typecode)
+        size = deltas.itemsize * values[7]
+        chunk = data[offset:offset + size]
+        if hasattr(deltas, 'frombytes'):
+            deltas.frombytes(chunk)
+        else:
+            deltas.fromstring(chunk)
+        if _BIG_ENDIAN:
+            deltas.byteswap()
+        return cls((values[0], values[1]), deltas, values[2:6]), offset + size
+
+    def __len__(self):
+        return 1 + len(self._deltas) // 2
+
+    @property
+    def nbytes(self):
+        """
+        bytes used by encoded coordinates
+
+        Returns:
+            int: bytes
+        """
+        return len(self._deltas) * self._deltas.itemsize + 16
+
+    def points(self):
+        """
+        decodes points
+
+        Yields:
+            tuple: (x, y) in scene coordinates
+        """
+        q = float(QUANTIZE)
+        x, y = self._start
+        yield x / q, y / q
+        deltas = self._deltas
+        for i in range(0, len(deltas), 2):
+            x += deltas[i]
+            y += deltas[i + 1]
+            yield x / q, y / q
+
+    def level(self, level, cache=True):
+        """
+        simplified copy of geometry for drawing at reduced scale, cached per
+        level like a mip chain. Points closer than 2**level / 2 pixels to
+        the previously kept point are dropped.
+
+        Args:
+            level (int): level of detail, 0 is full detail
+            cache (bool, optional): keep the copy, off for one-off renders
+
+        Returns:
+            StrokeGeometry: simplified geometry
+        """
+        if level <= 0 or len(self) <= 2:
+            return self
+        if self._levels is not None and level in self._levels:
+            return self._levels[level]
+
+        tolerance = (2 ** level) * .5 * QUANTIZE
+        tolerance_sq = tolerance * tolerance
+        kept = []
+        last = None
+        x, y = self._start
+        points = [(x, y)]
+        deltas = self._deltas
+        for i in range(0, len(deltas), 2):
+            x += deltas[i]
+            y += deltas[i + 1]
+            points.append((x, y))
+        for point in points:
+            if last is None or ((point[0] - last[0]) ** 2 +
+                                (point[1] - last[1]) ** 2) >= tolerance_sq:
+                kept.append(point)
+                last = point
+        if kept[-1] != points[-1]:
+            kept.append(points[-1])
+
+        simplified = self._encode(kept)
+        if cache:
+            if self._levels is None:
+                self._levels = {}
+            self._levels[level] = simplified
+        return simplified
+
+    def to_path(self):
+        """
+        materializes geometry as a QPainterPath
+
+        Returns:
+            QPainterPath: moveTo followed by lineTo for each point
+        """
+        points = self.points()
+        x, y = next(points)
+        path = QtGui.QPainterPath(QtCore.QPointF(x, y))
+        degenerate = True
+        for px, py in points:
+            if px != x or py != y:
+                degenerate = False
+            path.lineTo(px, py)
+        if degenerate:
+            # zero length strokes still need a dot
+            path.lineTo(x + DOT_OFFSET, y)
+        return path
+
+
+class PathCache(object):
+    """
+    LRU of materialized QPainterPaths keyed by geometry, bounded by the
+    total number of path elements held
+
+    Attributes:
+        elements (int): path elements currently cached
+        max_elements (int): element budget
+    """
+    def __init__(self, max_elements=500000):
+        self.max_elements = max_elements
+        self.elements = 0
+        self._paths = OrderedDict()
+
+    def get(self, geometry):
+        """
+        path for geometry, materialized on a miss
+
+        Args:
+            geometry (StrokeGeometry): stroke geometry
+
+        Returns:
+            QPainterPath: materialized path
+        """
+        try:
+            path = self._paths.pop(geometry)
+        except KeyError:
+            path = geometry.to_path()
+            self.elements += path.elementCount()
+            while self._paths and self.elements > self.max_elements:
+                old_geometry, old_path = self._paths.popitem(last=False)
+                self.elements -= old_path.elementCount()
+        self._paths[geometry] = path
+        return path
+
+    def __contains__(self, geometry):
+        return geometry in self._paths
+
+    def discard(self, geometry):
+        """
+        drops cached path for geometry
+
+        Args:
+            geometry (StrokeGeometry): stroke geometry
+        """
+        path = self._paths.pop(geometry, None)
+        if path is not None:
+            self.elements -= path.elementCount()
+
+    def clear(self):
+        """
+        drops every cached path
+        """
+        self._paths.clear()
+        self.elements = 0
+
+
+path_cache = PathCache()
+
+
+def stroke_outline(path, pen):
+    """
+    area covered by a path drawn with pen, as used for hit testing
+
+    Args:
+        path (QPainterPath): stroke path
+        pen (QPen): stroke pen
+
+    Returns:
+        QPainterPath: outline
+    """
+    stroker = QtGui.QPainterPathStroker()
+    stroker.setWidth(pen.widthF())
+    stroker.setCapStyle(pen.capStyle())
+    stroker.setJoinStyle(pen.joinStyle())
+    return stroker.createStroke(path)
+
+
+class _OutlineSignals(QtCore.QObject):
+    """
+    Carries finished outlines from worker threads back to the gui thread
+    """
+    finished = QtCore.pyqtSignal(object, int, QtGui.QPainterPath)
+
+    def __init__(self):
+        super(_OutlineSignals, self).__init__()
+        self.finished.connect(self._finished)
+
+    def _finished(self, item, version, outline):
+        item._set_outline(version, outline)
+
+
+_outline_signals = None
+
+
+class OutlineJob(QtCore.QRunnable):
+    """
+    Strokes a detached copy of a path, the item is only handed back to the
+    gui thread
+    """
+    def __init__(self, item, version, path, pen, signals):
+        """
+        Args:
+            item (StrokeItem): item the outline belongs to
+            version (int): outline version of item when queued
+            path (QPainterPath): detached stroke path
+            pen (QPen): stroke pen
+            signals (_OutlineSignals): finished signal emitter
+        """
+        super(OutlineJob, self).__init__()
+        self._item = item
+        self._version = version
+        self._path = path
+        self._pen = pen
+        self._signals = signals
+
+    def run(self):
+        self._signals.finished.emit(self._item, self._version,
+                                    stroke_outline(self._path, self._pen))
+
+
+class StrokeItem(QtGui.QAbstractGraphicsShapeItem):
+    """
+    Committed stroke. Keeps compressed geometry and only builds a
+    QPainterPath, through path_cache, when drawn or hit tested. Geometry is
+    immutable & may be shared by duplicates that differ only by transform,
+    see duplicate_stroke. The stroked outline used by shape() is computed
+    once & kept until pen or geometry change, see precompute_outline.
+    """
+    Type = QtGui.QGraphicsItem.UserType + 1
+
+    def __init__(self, geometry, pen, parent=None):
+        """
+        Args:
+            geometry (StrokeGeometry): stroke points
+            pen (QPen): stroke pen
+            parent (QGraphicsItem, optional): parent item
+        """
+        super(StrokeItem, self).__init__(parent)
+        self._geometry = geometry
+        self._bounds = None
+        self._outline = None
+        self._outline_version = 0
+        self.setPen(pen)
+
+    @property
+    def geometry(self):
+        """
+        compressed stroke points
+
+        Returns:
+            StrokeGeometry: geometry
+        """
+        return self._geometry
+
+    def set_geometry(self, geometry):
+        """
+        replaces stroke points. Edits swap in new geometry rather than
+        changing it, so duplicates sharing the old geometry are unaffected
+
+        Args:
+            geometry (StrokeGeometry): new stroke points
+        """
+        self.prepareGeometryChange()
+        self._geometry = geometry
+        self._bounds = None
+        self._discard_outline()
+        self._memory_changed()
+        self.update()
+
+    def type(self):
+        return StrokeItem.Type
+
+    def path(self):
+        """
+        materialized stroke path, cached in path_cache
+
+        Returns:
+            QPainterPath: stroke path
+        """
+        return path_cache.get(self._geometry)
+
+    def setPen(self, pen):
+        self.prepareGeometryChange()
+        self._bounds = None
+        self._discard_outline()
+        super(StrokeItem, self).setPen(pen)
+
+    def _discard_outline(self):
+        # bumping the version drops outlines still being computed
+        self._outline = None
+        self._outline_version += 1
+
+    def _set_outline(self, version, outline):
+        if version == self._outline_version and self._outline is None:
+            self._outline = outline
+            self._memory_changed()
+
+    def _memory_changed(self):
+        # keeps the scene's MemoryMonitor total in step with the outline
+        memory = getattr(self.scene(), 'memory', None)
+        if memory is not None:
+            memory.stroke_changed(self)
+
+    @property
+    def outline_elements(self):
+        """
+        path elements held by the cached outline
+
+        Returns:
+            int: elements, 0 when not computed
+        """
+        if self._outline is None:
+            return 0
+        return self._outline.elementCount()
+
+    def precompute_outline(self, threaded=True):
+        """
+        computes bounds & the stroked outline ahead of indexing & hit tests.
+        Outlines of long strokes are stroked on a worker thread; shape()
+        computes it directly if asked before the worker finishes.
+
+        Args:
+            threaded (bool, optional): allow stroking on a worker thread
+        """
+        global _outline_signals
+        self.boundingRect()
+        if self._outline is not None:
+            return
+        path = self.path()
+        if not threaded or path.elementCount() <= ASYNC_OUTLINE_ELEMENTS:
+            self._outline = stroke_outline(path, self.pen())
+            self._memory_changed()
+            return
+        if _outline_signals is None:
+            _outline_signals = _OutlineSignals()
+        QtCore.QThreadPool.globalInstance().start(OutlineJob(
+            self, self._outline_version, _detached(path),
+            QtGui.QPen(self.pen()), _outline_signals))
+
+    def boundingRect(self):
+        if self._bounds is None:
+            x, y, w, h = self._geometry.bounds
+            pad = self.pen().widthF() / 2.0 + DOT_OFFSET
+            self._bounds = QtCore.QRectF(x - pad, y - pad,
+                                         w + pad * 2, h + pad * 2)
+        return self._bounds
+
+    def shape(self):
+        if self._outline is None:
+            self._outline = stroke_outline(self.path(), self.pen())
+            self._memory_changed()
+        return self._outline
+
+    def paint(self, painter, option, widget=None):
+        lod = option.levelOfDetailFromTransform(painter.worldTransform())
+        if not clip_to_tiles(self, painter, lod):
+            return
+
+        # draw simplified geometry when zoomed out, one level per halving
+        # of on screen scale
+        level = 0
+        if 0 < lod < 1:
+            level = min(MAX_LOD_LEVEL, int(math.log(1.0 / lod, 2)))
+        painter.setPen(self.pen())
+        painter.setBrush(self.brush())
+        painter.drawPath(path_cache.get(self._geometry.level(level)))
+
+
+class RasterItem(QtGui.QGraphicsItem):
+    """
+    Layer stored as pixels, e.g. strokes merged by flattening.
+    Keeps a QImage rather than a QPixmap so tile workers can draw it.
+    """
+    Type = QtGui.QGraphicsItem.UserType + 2
+
+    def __init__(self, image, offset, parent=None):
+        """
+        Args:
+            image (QImage): premultiplied layer pixels
+            offset (QPointF): scene position of image's top left corner
+            parent (QGraphicsItem, optional): parent item
+        """
+        super(RasterItem, self).__init__(parent)
+        self._image = image
+        self._offset = QtCore.QPointF(offset)
+
+    @property
+    def image(self):
+        """
+        layer pixels
+
+        Returns:
+            QImage: image
+        """
+        return self._image
+
+    @property
+    def offset(self):
+        """
+        position of image in item coordinates
+
+        Returns:
+            QPointF: top left corner
+        """
+        return QtCore.QPointF(self._offset)
+
+    def type(self):
+        return RasterItem.Type
+
+    def boundingRect(self):
+        return QtCore.QRectF(self._offset, QtCore.QSizeF(self._image.size()))
+
+    def paint(self, painter, option, widget=None):
+        lod = option.levelOfDetailFromTransform(painter.worldTransform())
+        if not clip_to_tiles(self, painter, lod):
+            return
+        painter.setRenderHint(QtGui.QPainter.SmoothPixmapTransform)
+        painter.drawImage(self._offset, self._image)
+
+
+class StrokeBlurEffect(QtGui.QGraphicsBlurEffect):
+    """
+    Brush softness with its radius in scene pixels. QGraphicsBlurEffect
+    blurs by a fixed number of device pixels, so soft strokes would look
+    harder in zoomed out views than in full resolution output. The scene
+    sets the device scale when the view zoom changes & swaps it for off
+    screen renders, see PaintScene.set_blur_scale. Changing it dirties the
+    item, so it is never changed while painting.
+    """
+    def __init__(self, radius=0, parent=None, scale=1.0):
+        """
+        Args:
+            radius (float, optional): blur radius in scene pixels
+            parent (QObject, optional): parent object
+            scale (float, optional): device pixels per scene pixel
+        """
+        super(StrokeBlurEffect, self).__init__(parent)
+        self._radius = float(radius)
+        self._scale = float(scale)
+        QtGui.QGraphicsBlurEffect.setBlurRadius(self,
+                                                self._radius * self._scale)
+
+    def blurRadius(self):
+        """
+        blur radius in scene pixels
+
+        Returns:
+            float: radius
+        """
+        return self._radius
+
+    def setBlurRadius(self, radius):
+        self._radius = float(radius)
+        QtGui.QGraphicsBlurEffect.setBlurRadius(self,
+                                                self._radius * self._scale)
+
+    @property
+    def device_scale(self):
+        """
+        device pixels per scene pixel the radius is blurred at
+
+        Returns:
+            float: scale
+        """
+        return self._scale
+
+    def set_device_scale(self, scale):
+        """
+        rescales the device radius, call outside of painting
+
+        Args:
+            scale (float): device pixels per scene pixel
+
+        Returns:
+            bool: radius changed & the item was dirtied
+        """
+        scale = float(scale)
+        if abs(scale - self._scale) * self._radius <= .01:
+            self._scale = scale
+            return False
+        self._scale = scale
+        QtGui.QGraphicsBlurEffect.setBlurRadius(self, self._radius * scale)
+        return True
+
+    def boundingRectFor(self, rect):
+        # padding is in item coordinates, independent of device scale
+        pad = self._radius * 2.5 + 1
+        return rect.adjusted(-pad, -pad, pad, pad)
+
+
+def make_stroke(points, color, size, blur=0):
+    """
+    builds a committed stroke item from points, used for programmatic
+    strokes
+
+    Args:
+        points (numpy.ndarray): (n, 2) array or sequence of (x, y) pairs
+        color (QColor): stroke color
+        size (float): brush diameter
+        blur (int, optional): brush softness
+
+    Returns:
+        StrokeItem: stroke with pen & blur effect set up like drawn strokes
+    """
+    stroke = StrokeItem(StrokeGeometry.from_array(points),
+                        registry().pen(color, size))
+    stroke.setGraphicsEffect(StrokeBlurEffect(blur))
+    return stroke
+
+
+def duplicate_stroke(item, transform=None):
+    """
+    copy of a committed stroke sharing its geometry or pixels, only the
+    item, pen & effect are new
+
+    Args:
+        item (QGraphicsItem): StrokeItem or RasterItem
+        transform (QTransform, optional): applied after item's transform
+
+    Returns:
+        QGraphicsItem: duplicate
+    """
+    if isinstance(item, RasterItem):
+        copy = RasterItem(item.image, item.offset)
+    else:
+        copy = StrokeItem(item.geometry, item.pen())
+        # same geometry & pen, the outline in item coordinates is the same
+        copy._outline = item._outline
+    effect = item.graphicsEffect()
+    if effect is not None:
+        copy.setGraphicsEffect(StrokeBlurEffect(effect.blurRadius()))
+    if transform is None:
+        copy.setTransform(item.transform())
+    else:
+        copy.setTransform(item.transform() * transform)
+    return copy
+
+
+def symmetry_transforms(mode, center, count=2):
+    """
+    transforms placing the extra copies of a symmetry stroke
+
+    Args:
+        mode (str): 'vertical' mirrors across a vertical axis, 'horizontal'
+                    across a horizontal one & 'radial' rotates count copies
+        center (QPointF): mirror axis or rotation center
+        count (int, optional): copies for radial symmetry, original
+                               included
+
+    Returns:
+        list: QTransform per extra copy
+    """
+    if mode == 'vertical':
+        transforms = [QtGui.QTransform.fromScale(-1, 1)]
+    elif mode == 'horizontal':
+        transforms = [QtGui.QTransform.fromScale(1, -1)]
+    elif mode == 'radial':
+        transforms = [QtGui.QTransform().rotate(360.0 * i / count)
+                      for i in range(1, max(1, count))]
+    else:
+        raise ValueError('unknown symmetry mode {!r}'.format(mode))
+    to_origin = QtGui.QTransform.fromTranslate(-center.x(), -center.y())
+    back = QtGui.QTransform.fromTranslate(center.x(), center.y())
+    return [to_origin * transform * back for transform in transforms]
+
+
+def clip_to_tiles(item, painter, lod):
+    """
+    clips painter to the part of item not already drawn by its scene's tile
+    cache
+
+    Args:
+        item (QGraphicsItem): item being painted
+        painter (QPainter): item painter
+        lod (float): level of detail of painter
+
+    Returns:
+        bool: False when tiles cover the whole item & nothing needs drawing
+    """
+    tiles = getattr(item.scene(), 'tile_cache', None)
+    if tiles is None or not tiles.usable(lod):
+        return True
+    region = tiles.uncovered_region(item.sceneBoundingRect())
+    if region is None:
+        return True
+    if region.isEmpty():
+        return False
+    inverse = item.sceneTransform().inverted()[0]
+    painter.setClipRegion(inverse.map(region), QtCore.Qt.IntersectClip)
+    return True
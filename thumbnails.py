@@ -0,0 +1,265 @@
+import math
+from collections import OrderedDict, deque
+from PyQt4 import QtGui, QtCore
+from layers import Layer, Folder
+from strokes import StrokeItem, RasterItem, path_cache, MAX_LOD_LEVEL
+from tiles import _detached
+
+THUMBNAIL_SIZE = QtCore.QSize(36, 20)
+# queued requests beyond this are dropped, rows scrolled out of view ask
+# again when repainted
+MAX_QUEUED = 64
+
+
+class _ThumbnailSignals(QtCore.QObject):
+    """
+    Carries finished thumbnails from worker threads back to the gui thread
+    """
+    finished = QtCore.pyqtSignal(tuple, QtGui.QImage)
+
+
+class ThumbnailJob(QtCore.QRunnable):
+    """
+    Renders a snapshot of strokes scaled to fit a thumbnail
+    """
+    def __init__(self, key, size, bounds, strokes, signals):
+        """
+        Args:
+            key (tuple): (layer index, version) of thumbnail
+            size (QSize): thumbnail size
+            bounds (QRectF): scene rect fitted into the thumbnail
+            strokes (list): (path, rgba, width) or (image, offset) tuples in
+                            stacking order
+            signals (_ThumbnailSignals): finished signal emitter
+        """
+        super(ThumbnailJob, self).__init__()
+        self._key = key
+        self._size = size
+        self._bounds = bounds
+        self._strokes = strokes
+        self._signals = signals
+
+    def run(self):
+        img = QtGui.QImage(self._size,
+                           QtGui.QImage.Format_ARGB32_Premultiplied)
+        img.fill(0)
+        bounds = self._bounds
+        if not bounds.isEmpty():
+            scale = min(self._size.width() / bounds.width(),
+                        self._size.height() / bounds.height())
+            painter = QtGui.QPainter(img)
+            painter.setRenderHint(QtGui.QPainter.Antialiasing)
+            painter.setRenderHint(QtGui.QPainter.SmoothPixmapTransform)
+            size = self._size
+            painter.translate((size.width() - bounds.width() * scale) / 2,
+                              (size.height() - bounds.height() * scale) / 2)
+            painter.scale(scale, scale)
+            painter.translate(-bounds.x(), -bounds.y())
+            painter.setBrush(QtCore.Qt.NoBrush)
+            for stroke in self._strokes:
+                if isinstance(stroke[0], QtGui.QImage):
+                    painter.drawImage(stroke[1], stroke[0])
+                    continue
+                path, rgba, width = stroke
+                # keep thin strokes at least a pixel wide
+                painter.setPen(QtGui.QPen(QtGui.QColor.fromRgba(rgba),
+                                          max(width, 1.0 / scale),
+                                          QtCore.Qt.SolidLine,
+                                          QtCore.Qt.RoundCap,
+                                          QtCore.Qt.RoundJoin))
+                painter.drawPath(path)
+            painter.end()
+        self._signals.finished.emit(self._key, img)
+
+
+class ThumbnailCache(QtCore.QObject):
+    """
+    Layer & folder thumbnails for the layer panel, rendered on a thread pool
+    when a row is painted & kept in an LRU bounded by bytes. Thumbnails are
+    keyed by layer index & version; a folder's version is made from its
+    children's keys, so it changes whenever its children do. Blur is not
+    drawn in thumbnails.
+
+    Attributes:
+        max_bytes (int): thumbnail budget
+        size (QSize): thumbnail size
+        thumbnailReady (SIGNAL): emitted with layer index when a thumbnail
+                                 finishes rendering
+    """
+    thumbnailReady = QtCore.pyqtSignal(int)
+
+    def __init__(self, paint, size=THUMBNAIL_SIZE, max_bytes=4 * 1024 * 1024,
+                 threads=2):
+        """
+        Args:
+            paint (PyQtPaint): widget whose layers are shown
+            size (QSize, optional): thumbnail size
+            max_bytes (int, optional): thumbnail budget
+            threads (int, optional): worker count
+        """
+        super(ThumbnailCache, self).__init__(paint)
+        self._scene = paint.paint_scene
+        self._tree = paint.layers_tree
+        self.size = QtCore.QSize(size)
+        self.max_bytes = max_bytes
+
+        self._images = OrderedDict()
+        self._bytes = 0
+        self._versions = {}
+        self._queue = deque()
+        self._pending = {}
+        self._running = 0
+
+        self._pool = QtCore.QThreadPool(self)
+        self._pool.setMaxThreadCount(max(1, threads))
+        self._signals = _ThumbnailSignals()
+        self._signals.finished.connect(self._finished)
+
+    def _layer_key(self, item):
+        if isinstance(item, Folder):
+            children = tuple(self._layer_key(item.child(i))
+                             for i in range(item.childCount()))
+            return item.group_index, children
+        return item.stroke_index, self._versions.get(item.stroke_index, 0)
+
+    def invalidate(self, layer_id):
+        """
+        marks a layer's thumbnail out of date, folders holding it follow
+
+        Args:
+            layer_id (int): stroke index
+        """
+        self._versions[layer_id] = self._versions.get(layer_id, 0) + 1
+        for key in [key for key in self._images if not self._current(key)]:
+            self._bytes -= self._images.pop(key).byteCount()
+        # queued keys are skipped once dropped, running ones are discarded
+        # by _finished
+        for key in [key for key in self._pending if not self._current(key)]:
+            del self._pending[key]
+
+    def _current(self, key):
+        # a key is stale once the layer, or any layer in the folder, has
+        # been invalidated since it was made
+        layer_id, version = key
+        if isinstance(version, tuple):
+            return all(self._current(child) for child in version)
+        return version == self._versions.get(layer_id, 0)
+
+    def thumbnail(self, item):
+        """
+        thumbnail of a layer panel row, scheduled for rendering when missing
+
+        Args:
+            item (QTreeWidgetItem): Layer or Folder
+
+        Returns:
+            QImage: thumbnail, None until rendered
+        """
+        if not isinstance(item, (Layer, Folder)):
+            return None
+        key = self._layer_key(item)
+        image = self._images.pop(key, None)
+        if image is not None:
+            self._images[key] = image
+            return image
+        if key not in self._pending:
+            self._request(key, item)
+        return None
+
+    def _request(self, key, item):
+        # newest requests are served first, they are the rows on screen
+        self._pending[key] = item
+        self._queue.append(key)
+        while len(self._queue) > MAX_QUEUED:
+            self._pending.pop(self._queue.popleft(), None)
+        self._start_jobs()
+
+    def _start_jobs(self):
+        while self._queue and self._running < self._pool.maxThreadCount():
+            key = self._queue.pop()
+            item = self._pending.get(key)
+            if item is None:
+                continue
+            bounds, strokes = self._snapshot(item)
+            self._running += 1
+            self._pool.start(ThumbnailJob(key, self.size, bounds, strokes,
+                                          self._signals))
+
+    def _layers(self, item):
+        # layers in stacking order, bottom first
+        if isinstance(item, Folder):
+            for i in reversed(range(item.childCount())):
+                for layer in self._layers(item.child(i)):
+                    yield layer
+        elif isinstance(item, Layer):
+            yield item
+
+    def _snapshot(self, item):
+        strokes = []
+        bounds = QtCore.QRectF()
+        canvas = QtCore.QRectF(0, 0, self._scene.width, self._scene.height)
+        items = []
+        for layer in self._layers(item):
+            stroke = self._scene.strokes.get(layer.stroke_index)
+            if stroke is not None:
+                items.append(stroke['stroke'])
+                bounds = bounds.united(stroke['stroke'].sceneBoundingRect())
+        bounds = bounds.intersected(canvas)
+        if bounds.isEmpty():
+            return bounds, strokes
+
+        scale = min(self.size.width() / bounds.width(),
+                    self.size.height() / bounds.height())
+        level = 0
+        if scale < 1:
+            level = min(MAX_LOD_LEVEL, int(math.log(1.0 / scale, 2)))
+        for stroke in items:
+            if isinstance(stroke, RasterItem):
+                strokes.append((stroke.image, stroke.sceneTransform().map(
+                    stroke.offset)))
+            elif isinstance(stroke, StrokeItem):
+                pen = stroke.pen()
+                # simplified levels are built for this render only, they
+                # would otherwise stay on the geometry for good
+                geometry = stroke.geometry
+                simplified = geometry.level(level, cache=False)
+                if simplified is geometry:
+                    path = path_cache.get(geometry)
+                else:
+                    path = simplified.to_path()
+                path = stroke.sceneTransform().map(path)
+                strokes.append((_detached(path), pen.color().rgba(),
+                                pen.widthF()))
+        return bounds, strokes
+
+    def _finished(self, key, image):
+        self._running -= 1
+        item = self._pending.pop(key, None)
+        if not self._current(key):
+            self._start_jobs()
+            return
+        self._images[key] = image
+        self._bytes += image.byteCount()
+        while self._images and self._bytes > self.max_bytes:
+            old_key, old_image = self._images.popitem(last=False)
+            self._bytes -= old_image.byteCount()
+        if item is not None and item.treeWidget() is self._tree:
+            self._tree.viewport().update(self._tree.visualItemRect(item))
+            self.thumbnailReady.emit(key[0])
+        self._start_jobs()
+
+    def clear(self):
+        """
+        drops every thumbnail
+        """
+        self._images.clear()
+        self._bytes = 0
+
+    def memory_usage(self):
+        """
+        bytes held by thumbnails
+
+        Returns:
+            int: bytes
+        """
+        return self._bytes
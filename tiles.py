@@ -0,0 +1,333 @@
+import math
+from PyQt4 import QtGui, QtCore
+
+TILE_SIZE = 256
+# largest brush blur radius, soft strokes this far outside a tile still
+# bleed into it
+MAX_BLUR = 40
+
+
+def _detached(path):
+    # implicitly shared copy for worker threads. Qt's reference count is
+    # atomic & writers detach first, so the gui thread changing its path
+    # never touches the data a worker reads, no deep copy is needed
+    return QtGui.QPainterPath(path)
+
+
+class _TileSignals(QtCore.QObject):
+    """
+    Carries finished tiles from worker threads back to the gui thread
+    """
+    finished = QtCore.pyqtSignal(tuple, QtGui.QImage, int)
+
+
+class TileJob(QtCore.QRunnable):
+    """
+    Rasterizes an immutable snapshot of strokes into one tile image
+    """
+    def __init__(self, key, rect, scale, strokes, generation, signals):
+        """
+        Args:
+            key (tuple): (column, row) of tile
+            rect (QRectF): scene rect covered by tile
+            scale (float): tile pixels per scene pixel
+            strokes (list): (path, rgba, width) or (image, offset) tuples in
+                            stacking order
+            generation (int): invalidation count of tile when snapshotted
+            signals (_TileSignals): finished signal emitter
+        """
+        super(TileJob, self).__init__()
+        self._key = key
+        self._rect = rect
+        self._scale = scale
+        self._strokes = strokes
+        self._generation = generation
+        self._signals = signals
+
+    def run(self):
+        size = int(math.ceil(self._rect.width() * self._scale))
+        img = QtGui.QImage(size, size,
+                           QtGui.QImage.Format_ARGB32_Premultiplied)
+        img.fill(0)
+        painter = QtGui.QPainter(img)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        painter.scale(self._scale, self._scale)
+        painter.translate(-self._rect.x(), -self._rect.y())
+        painter.setBrush(QtCore.Qt.NoBrush)
+        for stroke in self._strokes:
+            if isinstance(stroke[0], QtGui.QImage):
+                painter.drawImage(stroke[1], stroke[0])
+                continue
+            path, rgba, width = stroke
+            painter.setPen(QtGui.QPen(QtGui.QColor.fromRgba(rgba), width,
+                                      QtCore.Qt.SolidLine,
+                                      QtCore.Qt.RoundCap,
+                                      QtCore.Qt.RoundJoin))
+            painter.drawPath(path)
+        painter.end()
+        self._signals.finished.emit(self._key, img, self._generation)
+
+
+class TileCache(QtCore.QObject):
+    """
+    Cache of committed strokes rasterized into canvas tiles.
+    Dirty tiles are rendered in parallel on a QThreadPool, each worker
+    paints the strokes intersecting its tile from an immutable snapshot.
+    The gui thread only blits finished tiles. Tiles touched by soft
+    (blurred) strokes are not cached since QGraphicsBlurEffect only runs on
+    the gui thread, strokes are drawn live there instead.
+
+    Attributes:
+        proxy (bool): tiles are drawn at every zoom level rather than only
+                      when sharp enough, used for reduced resolution editing
+        scale (float): tile pixels per scene pixel
+        tile_size (int): tile edge length in scene pixels
+    """
+    def __init__(self, scene, threads=None, tile_size=TILE_SIZE, scale=1.0):
+        """
+        Args:
+            scene (PaintScene): scene whose strokes are cached
+            threads (int, optional): worker count, defaults to core count
+            tile_size (int, optional): tile edge length in scene pixels
+            scale (float, optional): tile pixels per scene pixel
+        """
+        super(TileCache, self).__init__(scene)
+        self._scene = scene
+        self.tile_size = tile_size
+        self.scale = scale
+        self.proxy = False
+        self._columns = int(math.ceil(scene.width / float(tile_size)))
+        self._rows = int(math.ceil(scene.height / float(tile_size)))
+
+        self._pool = QtCore.QThreadPool(self)
+        self.set_threads(threads)
+
+        self._ready = {}
+        self._dirty = set(self._keys())
+        self._uncacheable = set()
+        self._pending = set()
+        self._generation = {}
+
+        self._signals = _TileSignals()
+        self._signals.finished.connect(self._tile_finished)
+
+    def __len__(self):
+        return self._columns * self._rows
+
+    def set_threads(self, threads=None):
+        """
+        sets number of rasterizer threads
+
+        Args:
+            threads (int, optional): worker count, defaults to core count
+        """
+        if not threads:
+            threads = QtCore.QThread.idealThreadCount()
+        self._pool.setMaxThreadCount(max(1, threads))
+
+    def _keys(self, rect=None):
+        if rect is None:
+            rect = QtCore.QRectF(0, 0, self._columns * self.tile_size,
+                                 self._rows * self.tile_size)
+        size = float(self.tile_size)
+        first_col = max(0, int(math.floor(rect.left() / size)))
+        last_col = min(self._columns - 1, int(math.floor(rect.right() / size)))
+        first_row = max(0, int(math.floor(rect.top() / size)))
+        last_row = min(self._rows - 1, int(math.floor(rect.bottom() / size)))
+        for row in range(first_row, last_row + 1):
+            for col in range(first_col, last_col + 1):
+                yield col, row
+
+    def tile_rect(self, key):
+        """
+        scene rect covered by tile
+
+        Args:
+            key (tuple): (column, row)
+
+        Returns:
+            QRectF: tile rect
+        """
+        return QtCore.QRectF(key[0] * self.tile_size, key[1] * self.tile_size,
+                             self.tile_size, self.tile_size)
+
+    def usable(self, lod):
+        """
+        whether tiles are sharp enough to draw at a level of detail
+
+        Args:
+            lod (float): screen pixels per scene pixel
+
+        Returns:
+            bool: tiles can be drawn
+        """
+        return self.proxy or lod <= self.scale + 1e-6
+
+    def set_scale(self, scale, proxy=False):
+        """
+        changes tile resolution, every tile is re-rasterized
+
+        Args:
+            scale (float): tile pixels per scene pixel
+            proxy (bool, optional): draw tiles at every zoom level
+        """
+        self.proxy = proxy
+        if scale != self.scale:
+            self.scale = scale
+            self.invalidate()
+
+    def ready_tile(self, rect):
+        """
+        finished tile holding all of rect
+
+        Args:
+            rect (QRectF): scene rect
+
+        Returns:
+            tuple: (QRectF tile rect, QImage), None when rect spans several
+                   tiles or its tile is not finished
+        """
+        keys = list(self._keys(rect))
+        if len(keys) != 1 or not self.tile_rect(keys[0]).contains(rect):
+            return None
+        img = self._ready.get(keys[0])
+        if img is None:
+            return None
+        return self.tile_rect(keys[0]), img
+
+    def invalidate(self, rect=None):
+        """
+        marks tiles dirty, they are re-rasterized next time they are drawn
+
+        Args:
+            rect (QRectF, optional): scene area that changed, defaults to
+                                     whole canvas
+        """
+        for key in self._keys(rect):
+            self._ready.pop(key, None)
+            self._uncacheable.discard(key)
+            self._dirty.add(key)
+            self._generation[key] = self._generation.get(key, 0) + 1
+
+    def clear(self):
+        """
+        drops every tile image
+        """
+        self.invalidate()
+
+    def uncovered_region(self, rect):
+        """
+        part of rect not covered by finished tiles
+
+        Args:
+            rect (QRectF): scene rect
+
+        Returns:
+            QRegion: uncovered region, None when no finished tile touches rect
+        """
+        region = QtGui.QRegion()
+        covered = False
+        for key in self._keys(rect):
+            if key in self._ready:
+                covered = True
+            else:
+                region += self.tile_rect(key).toAlignedRect()
+        if not covered:
+            return None
+        return region
+
+    def draw(self, painter, rect):
+        """
+        blits finished tiles in rect & schedules dirty ones
+
+        Args:
+            painter (QPainter): painter in scene coordinates
+            rect (QRectF): exposed scene rect
+        """
+        schedule = []
+        if self.scale != 1.0:
+            painter.save()
+            painter.setRenderHint(QtGui.QPainter.SmoothPixmapTransform)
+        for key in self._keys(rect):
+            img = self._ready.get(key)
+            if img is not None:
+                painter.drawImage(self.tile_rect(key), img)
+            elif key in self._dirty and key not in self._pending:
+                schedule.append(key)
+        if self.scale != 1.0:
+            painter.restore()
+        if schedule:
+            self._schedule(schedule)
+
+    def render_all(self):
+        """
+        rasterizes every dirty tile & waits for the workers, mostly useful
+        for benchmarks
+        """
+        self._schedule([key for key in self._keys()
+                        if key in self._dirty and key not in self._pending])
+        self._pool.waitForDone()
+        QtCore.QCoreApplication.processEvents()
+
+    def _schedule(self, keys):
+        from strokes import StrokeItem, RasterItem, path_cache
+
+        for key in keys:
+            rect = self.tile_rect(key)
+            search = rect.adjusted(-MAX_BLUR, -MAX_BLUR, MAX_BLUR, MAX_BLUR)
+            items = self._scene.items(search,
+                                      QtCore.Qt.IntersectsItemBoundingRect,
+                                      QtCore.Qt.AscendingOrder)
+            strokes = []
+            cacheable = True
+            for item in items:
+                if (not isinstance(item, (StrokeItem, RasterItem)) or
+                        not item.isVisible()):
+                    continue
+                effect = item.graphicsEffect()
+                if effect is not None and effect.blurRadius() > 0:
+                    pad = effect.blurRadius()
+                    if item.sceneBoundingRect().adjusted(
+                            -pad, -pad, pad, pad).intersects(rect):
+                        cacheable = False
+                        break
+                    continue
+                if not item.sceneBoundingRect().intersects(rect):
+                    continue
+                if isinstance(item, RasterItem):
+                    # images are implicitly shared & only read by workers
+                    strokes.append((item.image, item.sceneTransform().map(
+                        item.offset)))
+                    continue
+                pen = item.pen()
+                path = item.sceneTransform().map(
+                    path_cache.get(item.geometry))
+                strokes.append((_detached(path), pen.color().rgba(),
+                                pen.widthF()))
+
+            self._dirty.discard(key)
+            if not cacheable:
+                self._uncacheable.add(key)
+                continue
+            self._pending.add(key)
+            generation = self._generation.get(key, 0)
+            self._pool.start(TileJob(key, rect, self.scale, strokes,
+                                     generation, self._signals))
+
+    def _tile_finished(self, key, img, generation):
+        self._pending.discard(key)
+        if generation != self._generation.get(key, 0):
+            # invalidated while rendering
+            self._dirty.add(key)
+            return
+        self._ready[key] = img
+        self._scene.update(self.tile_rect(key))
+
+    def memory_usage(self):
+        """
+        bytes held by finished tiles
+
+        Returns:
+            int: bytes
+        """
+        return sum(img.byteCount() for img in self._ready.values())
@@ -0,0 +1,162 @@
+import os
+import json
+import time
+import threading
+
+
+class _NullSpan(object):
+    """
+    Stand-in span used when tracing is disabled
+    """
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span(object):
+    """
+    Context manager recording a complete event on exit
+    """
+    def __init__(self, tracer, name, args):
+        self._tracer = tracer
+        self._name = name
+        self._args = args
+        self._start = 0
+
+    def __enter__(self):
+        self._start = self._tracer.now()
+        return self
+
+    def __exit__(self, *exc):
+        self._tracer.complete(self._name, self._start, args=self._args)
+        return False
+
+
+def span(tracer, name, args=None):
+    """
+    times the enclosed block when tracer is set
+
+    Args:
+        tracer (Tracer): active tracer or None
+        name (str): event name, usually Class.method
+        args (dict, optional): extra data shown in the trace viewer
+
+    Returns:
+        context manager
+    """
+    if tracer is None:
+        return _NULL_SPAN
+    return _Span(tracer, name, args)
+
+
+class Tracer(object):
+    """
+    Fixed size ring buffer of timestamped pipeline events.
+    Oldest events are overwritten once capacity is reached. Dumps as Chrome
+    trace-event json, viewable in chrome://tracing or Perfetto.
+
+    Attributes:
+        capacity (int): maximum number of events kept
+    """
+    def __init__(self, capacity=65536):
+        self.capacity = capacity
+        self._events = [None] * capacity
+        self._next = 0
+        self._count = 0
+        self._origin = time.time()
+
+    def now(self):
+        """
+        microseconds since tracer creation
+
+        Returns:
+            float: timestamp
+        """
+        return (time.time() - self._origin) * 1000000.0
+
+    def _record(self, event):
+        self._events[self._next] = event
+        self._next = (self._next + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+
+    def complete(self, name, start, end=None, args=None):
+        """
+        records an event with duration
+
+        Args:
+            name (str): event name
+            start (float): start timestamp from now()
+            end (float, optional): end timestamp, defaults to now()
+            args (dict, optional): extra event data
+        """
+        if end is None:
+            end = self.now()
+        self._record(('X', name, start, end - start,
+                      threading.current_thread().ident, args))
+
+    def instant(self, name, args=None):
+        """
+        records a point in time event
+
+        Args:
+            name (str): event name
+            args (dict, optional): extra event data
+        """
+        self._record(('i', name, self.now(), 0,
+                      threading.current_thread().ident, args))
+
+    def clear(self):
+        """
+        drops all recorded events
+        """
+        self._events = [None] * self.capacity
+        self._next = 0
+        self._count = 0
+
+    def events(self):
+        """
+        recorded events, oldest first
+
+        Returns:
+            list: (phase, name, timestamp, duration, thread, args) tuples
+        """
+        if self._count < self.capacity:
+            return self._events[:self._count]
+        return self._events[self._next:] + self._events[:self._next]
+
+    def to_chrome_trace(self):
+        """
+        converts recorded events to the trace-event format
+
+        Returns:
+            dict: json serialisable trace
+        """
+        pid = os.getpid()
+        trace_events = []
+        for phase, name, ts, dur, tid, args in self.events():
+            event = {'name': name, 'cat': 'pyqtpaint', 'ph': phase,
+                     'ts': ts, 'pid': pid, 'tid': tid}
+            if phase == 'X':
+                event['dur'] = dur
+            else:
+                event['s'] = 't'
+            if args:
+                event['args'] = args
+            trace_events.append(event)
+        return {'traceEvents': trace_events, 'displayTimeUnit': 'ms'}
+
+    def dump(self, filepath):
+        """
+        writes Chrome trace-event json to file
+
+        Args:
+            filepath (str): output path
+        """
+        with open(filepath, 'w') as handle:
+            json.dump(self.to_chrome_trace(), handle)
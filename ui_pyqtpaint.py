@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'ui/pyqtpaint.ui'
+#
+# Created by: PyQt4 UI code generator 4.11.4
+#
+# WARNING! All changes made in this file will be lost!
+
+from PyQt4 import QtCore, QtGui
+
+try:
+    _fromUtf8 = QtCore.QString.fromUtf8
+except AttributeError:
+    def _fromUtf8(s):
+        return s
+
+try:
+    _encoding = QtGui.QApplication.UnicodeUTF8
+    def _translate(context, text, disambig):
+        return QtGui.QApplication.translate(context, text, disambig, _encoding)
+except AttributeError:
+    def _translate(context, text, disambig):
+        return QtGui.QApplication.translate(context, text, disambig)
+
+class Ui_Form(object):
+    def setupUi(self, Form):
+        Form.setObjectName(_fromUtf8("Form"))
+        Form.resize(723, 502)
+        self.horizontalLayout = QtGui.QHBoxLayout(Form)
+        self.horizontalLayout.setObjectName(_fromUtf8("horizontalLayout"))
+        self.viewport_widget = QtGui.QWidget(Form)
+        self.viewport_widget.setObjectName(_fromUtf8("viewport_widget"))
+        self.verticalLayout_2 = QtGui.QVBoxLayout(self.viewport_widget)
+        self.verticalLayout_2.setObjectName(_fromUtf8("verticalLayout_2"))
+        self.horizontalLayout.addWidget(self.viewport_widget)
+        self.widget = QtGui.QWidget(Form)
+        sizePolicy = QtGui.QSizePolicy(QtGui.QSizePolicy.Fixed, QtGui.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.widget.sizePolicy().hasHeightForWidth())
+        self.widget.setSizePolicy(sizePolicy)
+        self.widget.setMinimumSize(QtCore.QSize(200, 0))
+        self.widget.setObjectName(_fromUtf8("widget"))
+        self.verticalLayout = QtGui.QVBoxLayout(self.widget)
+        self.verticalLayout.setObjectName(_fromUtf8("verticalLayout"))
+        self.label_5 = QtGui.QLabel(self.widget)
+        self.label_5.setObjectName(_fromUtf8("label_5"))
+        self.verticalLayout.addWidget(self.label_5)
+        self.widget_2 = QtGui.QWidget(self.widget)
+        self.widget_2.setObjectName(_fromUtf8("widget_2"))
+        self.formLayout = QtGui.QFormLayout(self.widget_2)
+        self.formLayout.setFieldGrowthPolicy(QtGui.QFormLayout.FieldsStayAtSizeHint)
+        self.formLayout.setHorizontalSpacing(20)
+        self.formLayout.setVerticalSpacing(-1)
+        self.formLayout.setContentsMargins(-1, 10, -1, -1)
+        self.formLayout.setObjectName(_fromUtf8("formLayout"))
+        self.label_3 = QtGui.QLabel(self.widget_2)
+        self.label_3.setObjectName(_fromUtf8("label_3"))
+        self.formLayout.setWidget(0, QtGui.QFormLayout.LabelRole, self.label_3)
+        self.color_BTN = QtGui.QPushButton(self.widget_2)
+        sizePolicy = QtGui.QSizePolicy(QtGui.QSizePolicy.Expanding, QtGui.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.color_BTN.sizePolicy().hasHeightForWidth())
+        self.color_BTN.setSizePolicy(sizePolicy)
+        self.color_BTN.setStyleSheet(_fromUtf8("QPushButton {\n"
+"    background-color: red;\n"
+"    border-style: none;\n"
+"    min-width: 3em;\n"
+"    height: 3em;\n"
+"    border-radius: 10px;\n"
+"}"))
+        self.color_BTN.setText(_fromUtf8(""))
+        self.color_BTN.setObjectName(_fromUtf8("color_BTN"))
+        self.formLayout.setWidget(0, QtGui.QFormLayout.FieldRole, self.color_BTN)
+        self.label_2 = QtGui.QLabel(self.widget_2)
+        self.label_2.setObjectName(_fromUtf8("label_2"))
+        self.formLayout.setWidget(1, QtGui.QFormLayout.LabelRole, self.label_2)
+        self.size_SLD = QtGui.QSlider(self.widget_2)
+        self.size_SLD.setMinimum(1)
+        self.size_SLD.setMaximum(250)
+        self.size_SLD.setProperty("value", 30)
+        self.size_SLD.setOrientation(QtCore.Qt.Horizontal)
+        self.size_SLD.setObjectName(_fromUtf8("size_SLD"))
+        self.formLayout.setWidget(1, QtGui.QFormLayout.FieldRole, self.size_SLD)
+        self.label_4 = QtGui.QLabel(self.widget_2)
+        self.label_4.setObjectName(_fromUtf8("label_4"))
+        self.formLayout.setWidget(2, QtGui.QFormLayout.LabelRole, self.label_4)
+        self.blur_SLD = QtGui.QSlider(self.widget_2)
+        self.blur_SLD.setMaximum(25)
+        self.blur_SLD.setOrientation(QtCore.Qt.Horizontal)
+        self.blur_SLD.setInvertedAppearance(True)
+        self.blur_SLD.setObjectName(_fromUtf8("blur_SLD"))
+        self.formLayout.setWidget(2, QtGui.QFormLayout.FieldRole, self.blur_SLD)
+        self.verticalLayout.addWidget(self.widget_2)
+        self.label = QtGui.QLabel(self.widget)
+        self.label.setObjectName(_fromUtf8("label"))
+        self.verticalLayout.addWidget(self.label)
+        self.layers_widget = QtGui.QWidget(self.widget)
+        sizePolicy = QtGui.QSizePolicy(QtGui.QSizePolicy.Preferred, QtGui.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.layers_widget.sizePolicy().hasHeightForWidth())
+        self.layers_widget.setSizePolicy(sizePolicy)
+        self.layers_widget.setObjectName(_fromUtf8("layers_widget"))
+        self.verticalLayout_6 = QtGui.QVBoxLayout(self.layers_widget)
+        self.verticalLayout_6.setObjectName(_fromUtf8("verticalLayout_6"))
+        self.verticalLayout.addWidget(self.layers_widget)
+        self.horizontalLayout.addWidget(self.widget)
+
+        self.retranslateUi(Form)
+        QtCore.QMetaObject.connectSlotsByName(Form)
+
+    def retranslateUi(self, Form):
+        Form.setWindowTitle(_translate("Form", "Form", None))
+        self.label_5.setText(_translate("Form", "Brush Settings", None))
+        self.label_3.setText(_translate("Form", "Color", None))
+        self.label_2.setText(_translate("Form", "Size", None))
+        self.label_4.setText(_translate("Form", "Hardness", None))
+        self.label.setText(_translate("Form", "Layers", None))
+